@@ -1,5 +1,7 @@
 from django.contrib import admin
-from apps.documents.models import Document
+from apps.documents.models import Document, DocumentOutbox
+from apps.documents.repository import DocumentRepository
+from utils.search import build_prefix_search_query
 
 
 @admin.register(Document)
@@ -9,7 +11,7 @@ class DocumentAdmin(admin.ModelAdmin):
     """
     list_display = ('id', 'name', 'status', 'company', 'created_by', 'created_at', 'last_updated_at')
     list_filter = ('status', 'company', 'created_at', 'last_updated_at')
-    search_fields = ('name', 'created_by', 'token', 'external_id')
+    search_fields = ('=token', '=external_id', '=created_by')
     readonly_fields = ('created_at', 'last_updated_at')
     ordering = ('-created_at',)
     fieldsets = (
@@ -23,3 +25,25 @@ class DocumentAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'last_updated_at')
         }),
     )
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Exact matches on token, external_id and created_by, plus full-text matches
+        on the document name and signer names and emails, all served by indexes.
+        """
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        query = build_prefix_search_query(search_term)
+        if query is not None:
+            results |= queryset.filter(DocumentRepository.build_search_condition(query))
+        return results, may_have_duplicates
+
+
+@admin.register(DocumentOutbox)
+class DocumentOutboxAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the DocumentOutbox model.
+    """
+    list_display = ('id', 'document', 'status', 'attempts', 'created_at', 'processed_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'claimed_at', 'processed_at')
+    ordering = ('-created_at',)
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-17 14:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0002_alter_document_created_by_alter_document_open_id_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payload', models.JSONField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('claimed_at', models.DateTimeField(null=True)),
+                ('processed_at', models.DateTimeField(null=True)),
+                ('document', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='outbox', to='documents.document')),
+            ],
+            options={
+                'verbose_name': 'Document Outbox Entry',
+                'verbose_name_plural': 'Document Outbox Entries',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='documents_outbox_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-17 16:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('documents', '0003_documentoutbox'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='document',
+            index=models.Index(fields=['company', 'created_at', 'id'], name='document_company_created_idx'),
+        ),
+    ]
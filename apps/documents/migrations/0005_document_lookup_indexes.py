@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 16:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('documents', '0004_document_company_created_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='document',
+            index=models.Index(fields=['company', 'status'], name='document_company_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='document',
+            index=models.Index(fields=['token'], name='document_token_idx'),
+        ),
+    ]
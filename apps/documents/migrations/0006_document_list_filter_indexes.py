@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-17 17:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('documents', '0005_document_lookup_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='document',
+            index=models.Index(fields=['company', 'status', 'created_at', 'id'], name='document_status_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='document',
+            index=models.Index(fields=['company', 'external_id'], name='document_company_external_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='document',
+            name='document_company_status_idx',
+        ),
+    ]
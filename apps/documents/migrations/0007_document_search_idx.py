@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-17 17:50
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('documents', '0006_document_list_filter_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='document_search_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0007_document_search_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentoutbox',
+            name='next_attempt_at',
+            field=models.DateTimeField(null=True),
+        ),
+    ]
@@ -1,5 +1,11 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
 
+# Full-text vector over the document name. Search queries must use this exact
+# expression for Postgres to match it against the GIN index below.
+DOCUMENT_SEARCH_VECTOR = SearchVector("name", config="simple")
+
 
 class Document(models.Model):
     open_id = models.IntegerField(null=True)
@@ -15,6 +21,41 @@ class Document(models.Model):
     class Meta:
         verbose_name = "Document"
         verbose_name_plural = "Documents"
+        indexes = [
+            models.Index(fields=["company", "created_at", "id"], name="document_company_created_idx"),
+            models.Index(fields=["company", "status", "created_at", "id"], name="document_status_created_idx"),
+            models.Index(fields=["company", "external_id"], name="document_company_external_idx"),
+            models.Index(fields=["token"], name="document_token_idx"),
+            GinIndex(DOCUMENT_SEARCH_VECTOR, name="document_search_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+
+class DocumentOutbox(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    document = models.OneToOneField(Document, on_delete=models.CASCADE, related_name='outbox')
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True)
+    next_attempt_at = models.DateTimeField(null=True)
+    processed_at = models.DateTimeField(null=True)
+
+    class Meta:
+        verbose_name = "Document Outbox Entry"
+        verbose_name_plural = "Document Outbox Entries"
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='documents_outbox_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.document} ({self.status})"
@@ -1,25 +1,170 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Iterator, Sequence
 
-from django.db.models import QuerySet
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import QuerySet, Q, Prefetch, F, OuterRef, Subquery, Value, IntegerField
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
 
 from apps.companies.models import Company
-from apps.documents.models import Document
+from apps.documents.models import Document, DocumentOutbox, DOCUMENT_SEARCH_VECTOR
+from apps.signers.models import Signer, SIGNER_SEARCH_VECTOR
+from utils.collections import group_tokens_by_status
+
+SIGNER_FIELDS = ("id", "token", "status", "name", "email", "external_id", "document_id")
+DOCUMENT_FIELDS = (
+    "id", "open_id", "token", "name", "status", "created_at", "last_updated_at",
+    "created_by", "company_id", "external_id",
+)
+
+EXPORT_COLUMNS = {
+    "document_id": F("id"),
+    "document_token": F("token"),
+    "document_name": F("name"),
+    "document_status": F("status"),
+    "document_external_id": F("external_id"),
+    "document_created_at": F("created_at"),
+    "document_last_updated_at": F("last_updated_at"),
+    "signer_id": F("signers__id"),
+    "signer_token": F("signers__token"),
+    "signer_name": F("signers__name"),
+    "signer_email": F("signers__email"),
+    "signer_status": F("signers__status"),
+}
+
+
+def signers_prefetch() -> Prefetch:
+    """
+    Prefetch of the signers serialized with a document, loaded for a whole page
+    of documents with one extra query.
+    """
+    return Prefetch("signers", queryset=Signer.objects.only(*SIGNER_FIELDS).order_by("id"))
 
 
 class DocumentRepository:
     @staticmethod
-    def get_document_by_id(document_id: int) -> Optional[Document]:
+    def get_document_by_id(document_id: int, with_signers: bool = False) -> Optional[Document]:
+        """
+        Fetch a document by its ID, optionally with its signers.
+        """
+        queryset = Document.objects.filter(id=document_id)
+        if with_signers:
+            queryset = queryset.prefetch_related(signers_prefetch())
+        return queryset.first()
+
+    @staticmethod
+    def get_document_version(document_id: int) -> Optional[dict]:
+        """
+        Fetch only the owner and `last_updated_at` of a document, to validate
+        conditional requests without loading the document.
+        """
+        return Document.objects.filter(id=document_id).values("company_id", "last_updated_at").first()
+
+    @staticmethod
+    def build_search_condition(query: SearchQuery) -> Q:
+        """
+        Match documents whose name, or one of whose signers' name or email,
+        matches a full-text query. Each side is resolved through its GIN index.
+        """
+        matching_names = Document.objects.alias(search=DOCUMENT_SEARCH_VECTOR).filter(search=query).values("id")
+        matching_signers = (
+            Signer.objects.alias(search=SIGNER_SEARCH_VECTOR).filter(search=query).values("document_id")
+        )
+        return Q(id__in=matching_names) | Q(id__in=matching_signers)
+
+    @staticmethod
+    def search_documents_by_company(company_id: int, query: SearchQuery) -> QuerySet:
+        """
+        Fetch the documents of a company matching a full-text query, with their
+        signers, annotated with an integer `search_rank` (name rank plus the best
+        signer rank, scaled by 10^6 so it can be compared exactly in cursors).
+        """
+        best_signer_rank = Subquery(
+            Signer.objects
+            .filter(document_id=OuterRef("id"))
+            .annotate(rank=SearchRank(SIGNER_SEARCH_VECTOR, query))
+            .order_by("-rank")
+            .values("rank")[:1]
+        )
+        rank = SearchRank(DOCUMENT_SEARCH_VECTOR, query) + Coalesce(best_signer_rank, Value(0.0))
+        return (
+            Document.objects
+            .filter(company_id=company_id)
+            .filter(DocumentRepository.build_search_condition(query))
+            .annotate(search_rank=Cast(rank * Value(1000000.0), IntegerField()))
+            .prefetch_related(signers_prefetch())
+        )
+
+    @staticmethod
+    def get_documents_by_company(company_id: int, filters: Optional[dict] = None) -> QuerySet:
+        """
+        Fetch the documents belonging to a specific company, with their signers,
+        optionally narrowed by status, creation range and external_id.
+        """
+        queryset = Document.objects.filter(company_id=company_id)
+        filters = filters or {}
+        if "status" in filters:
+            queryset = queryset.filter(status=filters["status"])
+        if "external_id" in filters:
+            queryset = queryset.filter(external_id=filters["external_id"])
+        if "created_after" in filters:
+            queryset = queryset.filter(created_at__gte=filters["created_after"])
+        if "created_before" in filters:
+            queryset = queryset.filter(created_at__lt=filters["created_before"])
+        return queryset.prefetch_related(signers_prefetch())
+
+    @staticmethod
+    def get_document_rows_by_company(
+            company_id: int,
+            filters: Optional[dict] = None,
+            columns: Sequence[str] = DOCUMENT_FIELDS
+    ) -> QuerySet:
         """
-        Fetch a document by its ID.
+        Same documents as `get_documents_by_company`, as plain dicts of the given
+        columns instead of model instances. `id`, `created_at` and `last_updated_at`,
+        which identify, order and version the rows, are always selected. Signers are
+        fetched separately per page.
         """
-        return Document.objects.filter(id=document_id).first()
+        return (
+            DocumentRepository.get_documents_by_company(company_id, filters)
+            .prefetch_related(None)
+            .values(*dict.fromkeys(("id", "created_at", "last_updated_at", *columns)))
+        )
 
     @staticmethod
-    def get_documents_by_company(company_id: int) -> QuerySet:
+    def get_document_row_by_id(document_id: int, columns: Sequence[str] = DOCUMENT_FIELDS) -> Optional[dict]:
         """
-        Fetch all documents belonging to a specific company.
+        Fetch a document as a plain dict of the given columns, plus `id` and `company_id`.
         """
-        return Document.objects.filter(company_id=company_id)
+        return Document.objects.filter(id=document_id).values(*dict.fromkeys(("id", "company_id", *columns))).first()
+
+    @staticmethod
+    def get_signer_rows_by_document_ids(document_ids: List[int]) -> List[dict]:
+        """
+        Fetch the signers of several documents as plain dicts, in one query.
+        """
+        return list(Signer.objects.filter(document_id__in=document_ids).order_by("id").values(*SIGNER_FIELDS))
+
+    @staticmethod
+    def iter_export_rows_by_company(company_id: int, chunk_size: int) -> Iterator[dict]:
+        """
+        Stream one row per document and signer of a company (documents without
+        signers appear once), read through a server-side cursor in chunks.
+        """
+        return (
+            Document.objects
+            .filter(company_id=company_id)
+            .order_by("id", "signers__id")
+            .values(**EXPORT_COLUMNS)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    def get_documents_by_ids(document_ids: List[int]) -> QuerySet:
+        """
+        Fetch several documents by their IDs, with their signers.
+        """
+        return Document.objects.filter(id__in=document_ids).prefetch_related(signers_prefetch()).order_by("id")
 
     @staticmethod
     def create_document(data: dict) -> Document:
@@ -28,6 +173,56 @@ class DocumentRepository:
         """
         return Document.objects.create(**data)
 
+    @staticmethod
+    def bulk_create_documents(documents_data: List[dict]) -> List[Document]:
+        """
+        Create several documents with a single INSERT.
+        """
+        return Document.objects.bulk_create([Document(**data) for data in documents_data])
+
+    @staticmethod
+    def bulk_update_documents(documents: List[Document], fields: List[str]) -> None:
+        """
+        Save the given fields of several documents with a single UPDATE.
+        """
+        now = timezone.now()
+        for document in documents:
+            document.last_updated_at = now
+        Document.objects.bulk_update(documents, [*fields, "last_updated_at"])
+
+    @staticmethod
+    def delete_documents_by_ids(document_ids: List[int]) -> None:
+        """
+        Delete several documents by their IDs.
+        """
+        Document.objects.filter(id__in=document_ids).delete()
+
+    @staticmethod
+    def lock_documents_by_company(
+            company_id: int,
+            document_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None,
+            limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Lock the company's documents selected by IDs, or else by filters, and return
+        their `id` and `token`, at most `limit` of them. Rows are locked in ID order,
+        before any of their signers, as signer bulk operations also lock them. Must be
+        called inside a transaction.
+        """
+        if document_ids is not None:
+            queryset = Document.objects.filter(company_id=company_id, id__in=document_ids)
+        else:
+            queryset = DocumentRepository.get_documents_by_company(company_id, filters).prefetch_related(None)
+        return list(queryset.order_by("id").select_for_update().values("id", "token")[:limit])
+
+    @staticmethod
+    def update_documents_by_ids(document_ids: List[int], data: dict) -> int:
+        """
+        Set the same fields on several documents with a single UPDATE.
+        """
+        return Document.objects.filter(id__in=document_ids).update(**data, last_updated_at=timezone.now())
+
     @staticmethod
     def update_document(document: Document, **kwargs) -> Document:
         """
@@ -38,9 +233,128 @@ class DocumentRepository:
         document.save()
         return document
 
+    @staticmethod
+    def update_document_fields(document: Document, **kwargs) -> Document:
+        """
+        Update only the given fields of a document (and `last_updated_at`), leaving
+        columns changed by others since the instance was loaded untouched.
+        """
+        for key, value in kwargs.items():
+            setattr(document, key, value)
+        document.save(update_fields=[*kwargs, "last_updated_at"])
+        return document
+
     @staticmethod
     def delete_document(document: Document) -> None:
         """
         Delete a document.
         """
         document.delete()
+
+    @staticmethod
+    def bulk_update_status_by_token(status_by_token: Dict[str, str], final_statuses: Iterable[str] = ()) -> int:
+        """
+        Set the status of documents looked up by token, with one UPDATE per distinct status.
+        Documents already in one of `final_statuses` are left as they are.
+        """
+        updated = 0
+        now = timezone.now()
+        for status, tokens in group_tokens_by_status(status_by_token).items():
+            updated += (
+                Document.objects
+                .filter(token__in=tokens)
+                .exclude(status__in=final_statuses)
+                .update(status=status, last_updated_at=now)
+            )
+        return updated
+
+
+class DocumentOutboxRepository:
+    @staticmethod
+    def create_entry(document: Document, payload: dict) -> DocumentOutbox:
+        """
+        Create an outbox entry for a document waiting to be sent to ZapSign.
+        """
+        return DocumentOutbox.objects.create(document=document, payload=payload)
+
+    @staticmethod
+    def bulk_create_entries(entries_data: List[dict]) -> List[DocumentOutbox]:
+        """
+        Create several outbox entries with a single INSERT.
+        """
+        return DocumentOutbox.objects.bulk_create([DocumentOutbox(**data) for data in entries_data])
+
+    @staticmethod
+    def _claimable(stale_before: datetime) -> Q:
+        """
+        Pending entries that are not waiting for a scheduled retry, and entries stuck
+        in processing since before `stale_before`.
+        """
+        due = Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now())
+        return (
+            (Q(status=DocumentOutbox.Status.PENDING) & due)
+            | Q(status=DocumentOutbox.Status.PROCESSING, claimed_at__lt=stale_before)
+        )
+
+    @staticmethod
+    def claim_entry(entry_id: int, stale_before: datetime) -> Optional[DocumentOutbox]:
+        """
+        Lock and mark an outbox entry as processing, skipping entries locked by other workers
+        and entries whose retry is not due yet. Entries stuck in processing since before
+        `stale_before` can be claimed again. Must be called inside a transaction.
+        """
+        entry = (
+            DocumentOutbox.objects
+            .select_for_update(skip_locked=True)
+            .select_related("document")
+            .filter(DocumentOutboxRepository._claimable(stale_before), id=entry_id)
+            .first()
+        )
+        if not entry:
+            return None
+        entry.status = DocumentOutbox.Status.PROCESSING
+        entry.attempts += 1
+        entry.claimed_at = timezone.now()
+        entry.save(update_fields=["status", "attempts", "claimed_at"])
+        return entry
+
+    @staticmethod
+    def get_claimable_entry_ids(stale_before: datetime, limit: int) -> List[int]:
+        """
+        Fetch the IDs of the oldest outbox entries that are waiting to be processed.
+        """
+        return list(
+            DocumentOutbox.objects
+            .filter(DocumentOutboxRepository._claimable(stale_before))
+            .order_by("created_at")
+            .values_list("id", flat=True)[:limit]
+        )
+
+    @staticmethod
+    def mark_done(entry: DocumentOutbox) -> DocumentOutbox:
+        """
+        Mark an outbox entry as successfully processed.
+        """
+        entry.status = DocumentOutbox.Status.DONE
+        entry.last_error = None
+        entry.processed_at = timezone.now()
+        entry.save(update_fields=["status", "last_error", "processed_at"])
+        return entry
+
+    @staticmethod
+    def mark_failed_attempt(
+            entry: DocumentOutbox,
+            error: str,
+            give_up: bool,
+            next_attempt_at: Optional[datetime] = None
+    ) -> DocumentOutbox:
+        """
+        Record a failed attempt, either releasing the entry for a retry at `next_attempt_at`
+        or giving up on it.
+        """
+        entry.status = DocumentOutbox.Status.FAILED if give_up else DocumentOutbox.Status.PENDING
+        entry.last_error = error
+        entry.next_attempt_at = None if give_up else next_attempt_at
+        entry.processed_at = timezone.now() if give_up else None
+        entry.save(update_fields=["status", "last_error", "next_attempt_at", "processed_at"])
+        return entry
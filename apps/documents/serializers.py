@@ -1,6 +1,12 @@
+from typing import Optional, Tuple
+
+from django.conf import settings
 from rest_framework import serializers
 from apps.documents.models import Document
-from apps.signers.serializers import SignerSerializer, SignerCreateSerializer
+from apps.signers.serializers import SignerSerializer, SignerCreateSerializer, SIGNER_ROW_SERIALIZER
+from utils.pagination import CURSOR_QUERY_PARAM, PAGE_SIZE_QUERY_PARAM
+from utils.row_serializer import RowSerializer
+from utils.search import build_prefix_search_query
 
 
 class DocumentSerializer(serializers.ModelSerializer):
@@ -14,6 +20,73 @@ class DocumentSerializer(serializers.ModelSerializer):
         ]
 
 
+# Same shape as DocumentSerializer (without signers), built from `values()` rows.
+DOCUMENT_ROW_SERIALIZER = RowSerializer(
+    [
+        ("id", "id"), ("open_id", "open_id"), ("token", "token"), ("name", "name"), ("status", "status"),
+        ("created_at", "created_at"), ("last_updated_at", "last_updated_at"), ("created_by", "created_by"),
+        ("company", "company_id"), ("external_id", "external_id"),
+    ],
+    datetime_fields=("created_at", "last_updated_at"),
+)
+
+
+def serialize_document_rows(
+        document_rows: list,
+        signer_rows: Optional[list] = None,
+        row_serializer: RowSerializer = DOCUMENT_ROW_SERIALIZER
+) -> list:
+    """
+    Renders document and signer rows into the same JSON as DocumentSerializer(many=True).
+    Without signer rows, the documents are rendered without the `signers` key.
+    """
+    data = row_serializer.many(document_rows)
+    if signer_rows is None:
+        return data
+
+    signers_by_document = {row["id"]: [] for row in document_rows}
+    for signer in SIGNER_ROW_SERIALIZER.many(signer_rows):
+        signers_by_document[signer["document"]].append(signer)
+    for document, row in zip(data, document_rows):
+        document["signers"] = signers_by_document[row["id"]]
+    return data
+
+
+def get_document_projection(params: dict) -> Tuple[RowSerializer, bool]:
+    """
+    Returns the row serializer restricted to the requested `fields` and whether
+    signers are included. Without `fields`, documents keep their full shape with signers.
+    """
+    fields = params.get("fields")
+    if fields is None:
+        return DOCUMENT_ROW_SERIALIZER, True
+    return DOCUMENT_ROW_SERIALIZER.only(fields), params.get("expand") == "signers"
+
+
+PROJECTION_QUERY_PARAMS = ("fields", "expand")
+
+
+class DocumentFieldsQuerySerializer(serializers.Serializer):
+    fields = serializers.CharField(
+        required=False,
+        help_text="Comma-separated document fields to return, e.g. id,status,token. Signers are left out "
+                  "unless expand=signers is also given. Without it, every field and the signers are returned.",
+    )
+    expand = serializers.ChoiceField(
+        choices=["signers"], required=False, help_text="Nests the signers when `fields` is given.",
+    )
+
+    def validate_fields(self, value):
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(DOCUMENT_ROW_SERIALIZER.output_keys))
+        if not names or unknown:
+            raise serializers.ValidationError(
+                f"Unknown fields: {', '.join(unknown)}. Available fields: "
+                f"{', '.join(DOCUMENT_ROW_SERIALIZER.output_keys)}; use expand=signers for signers."
+            )
+        return names
+
+
 class DocumentCreateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255)
     url_pdf = serializers.URLField(required=True)
@@ -25,7 +98,114 @@ class DocumentCreateSerializer(serializers.Serializer):
         return data
 
 
+class DocumentBatchCreateSerializer(serializers.Serializer):
+    documents = DocumentCreateSerializer(many=True)
+
+    def validate_documents(self, value):
+        if not value:
+            raise serializers.ValidationError("At least one document is required.")
+        if len(value) > settings.DOCUMENT_BATCH_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"A batch can contain at most {settings.DOCUMENT_BATCH_MAX_SIZE} documents."
+            )
+        return value
+
+
+class DocumentBatchItemErrorSerializer(serializers.Serializer):
+    title = serializers.CharField()
+    message = serializers.CharField()
+
+
+class DocumentBatchItemResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=["created", "queued", "failed"])
+    document = DocumentSerializer(allow_null=True)
+    error = DocumentBatchItemErrorSerializer(allow_null=True)
+
+
 class DocumentUpdateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255, required=False)
     status = serializers.CharField(max_length=50, required=False)
     external_id = serializers.CharField(max_length=255, required=False)
+
+
+class DocumentFilterSerializer(serializers.Serializer):
+    status = serializers.CharField(max_length=50, required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    external_id = serializers.CharField(max_length=255, required=False)
+
+    def validate(self, data):
+        if data.get("created_after") and data.get("created_before") and data["created_after"] > data["created_before"]:
+            raise serializers.ValidationError("created_after must be before created_before.")
+        return data
+
+
+class RejectUnknownQueryParamsMixin:
+    """Answers 400 for query parameters that are neither serializer fields nor listed in `extra_query_params`."""
+    extra_query_params = ()
+
+    def validate(self, data):
+        allowed = set(self.fields) | set(self.extra_query_params)
+        unknown = sorted(set(self.initial_data) - allowed)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown query parameters: {', '.join(unknown)}.")
+        return super().validate(data)
+
+
+class DocumentDetailQuerySerializer(RejectUnknownQueryParamsMixin, DocumentFieldsQuerySerializer):
+    pass
+
+
+class DocumentListFilterSerializer(RejectUnknownQueryParamsMixin, DocumentFieldsQuerySerializer,
+                                   DocumentFilterSerializer):
+    extra_query_params = (CURSOR_QUERY_PARAM, PAGE_SIZE_QUERY_PARAM)
+
+
+class DocumentBulkFilterSerializer(DocumentFilterSerializer):
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError("At least one filter is required.")
+        return super().validate(data)
+
+
+class DocumentBulkSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    filter = DocumentBulkFilterSerializer(required=False)
+
+    def validate_ids(self, value):
+        if len(value) > settings.API_BULK_MAX_SIZE:
+            raise serializers.ValidationError(f"At most {settings.API_BULK_MAX_SIZE} ids can be given.")
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if ("ids" in data) == ("filter" in data):
+            raise serializers.ValidationError("Provide either ids or filter.")
+        return data
+
+
+class DocumentBulkUpdateSerializer(DocumentBulkSelectionSerializer):
+    changes = DocumentUpdateSerializer()
+
+    def validate_changes(self, value):
+        if not value:
+            raise serializers.ValidationError("At least one field to change is required.")
+        return value
+
+
+class DocumentBulkItemResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=["updated", "deleted", "not_found"])
+
+
+class DocumentExportQuerySerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(choices=["ndjson", "csv"], default="ndjson")
+
+
+class DocumentSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=100)
+
+    def validate_q(self, value):
+        if build_prefix_search_query(value) is None:
+            raise serializers.ValidationError("The search must contain at least one letter or digit.")
+        return value
@@ -1,18 +1,41 @@
 import logging
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional, List, Tuple, Iterator, Sequence
+
+from django.conf import settings
 from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
 
 from apps.companies.models import Company
 from apps.documents.models import Document
-from apps.documents.repository import DocumentRepository
+from apps.documents.repository import DocumentRepository, DocumentOutboxRepository, EXPORT_COLUMNS, DOCUMENT_FIELDS
 from apps.signers.repository import SignerRepository
 from apps.zapsign_integration.service import ZapSignService
+from utils.collections import build_bulk_results
+from utils.search import build_prefix_search_query
 from utils.exceptions import DocumentNotFoundException, UnauthorizedDocumentAccessException, \
     FailedToCreateDocumentException, FailedToCreateSignerException, FailedToCreateDocumentInZapSignException, \
-    MissingZapSignResponseFieldsException, FailedToUpdateDocumentException
+    MissingZapSignResponseFieldsException, FailedToUpdateDocumentException, DocumentNotInZapSignException, \
+    ExceptionMessageBuilder, BulkSelectionTooLargeException
 
 logger = logging.getLogger(__name__)
 
+DOCUMENT_STATUS_QUEUED = "queued"
+DOCUMENT_STATUS_FAILED = "failed"
+
+BATCH_ITEM_CREATED = "created"
+BATCH_ITEM_QUEUED = "queued"
+BATCH_ITEM_FAILED = "failed"
+
+BULK_ITEM_UPDATED = "updated"
+BULK_ITEM_DELETED = "deleted"
+BULK_ITEM_NOT_FOUND = "not_found"
+
+DOCUMENT_EXPORT_FIELDS = tuple(EXPORT_COLUMNS)
+
 
 class DocumentService:
     def __init__(
@@ -20,18 +43,31 @@ class DocumentService:
         document_repository: Optional[DocumentRepository] = None,
         signer_repository: Optional[SignerRepository] = None,
         zap_sign_service: Optional[ZapSignService] = None,
+        outbox_repository: Optional[DocumentOutboxRepository] = None,
     ):
         self.document_repository = document_repository or DocumentRepository()
         self.signer_repository = signer_repository or SignerRepository()
         self.zap_sign_service = zap_sign_service or ZapSignService()
+        self.outbox_repository = outbox_repository or DocumentOutboxRepository()
 
-    def get_document(self, document_id: int, company: Company) -> Document:
+    def get_zap_sign_service(self, company: Company) -> ZapSignService:
+        """
+        Return the ZapSign client to use on behalf of a company. With
+        ZAPSIGN_USE_COMPANY_API_TOKEN enabled, calls authenticate (and are rate
+        limited) with the company's own API token instead of the global one.
+        """
+        if settings.ZAPSIGN_USE_COMPANY_API_TOKEN:
+            return self.zap_sign_service.with_api_token(company.api_token)
+        return self.zap_sign_service
+
+    def get_document(self, document_id: int, company: Company, with_signers: bool = False) -> Document:
         """
         Retrieve a document by ID and validate ownership.
+        Pass `with_signers` when the document will be serialized with its signers.
         """
         try:
             logger.info(f"Fetching document with ID {document_id} for company ID {company.id}.")
-            document = self.document_repository.get_document_by_id(document_id)
+            document = self.document_repository.get_document_by_id(document_id, with_signers)
             if not document:
                 logger.error(f"Document with ID {document_id} not found.")
                 raise DocumentNotFoundException()
@@ -45,6 +81,43 @@ class DocumentService:
             logger.exception(f"An unexpected error occurred while fetching document ID {document_id}: {str(e)}")
             raise
 
+    def get_document_row(self, document_id: int, company: Company, columns: Sequence[str] = DOCUMENT_FIELDS) -> dict:
+        """
+        Retrieve a document as a plain dict of the given columns and validate ownership.
+        """
+        logger.info(f"Fetching document row with ID {document_id} for company ID {company.id}.")
+        row = self.document_repository.get_document_row_by_id(document_id, columns)
+        if not row:
+            logger.error(f"Document with ID {document_id} not found.")
+            raise DocumentNotFoundException()
+        if row["company_id"] != company.id:
+            logger.error(f"Unauthorized access to document ID {document_id} by company ID {company.id}.")
+            raise UnauthorizedDocumentAccessException()
+        return row
+
+    def get_document_version(self, document_id: int, company: Company) -> datetime:
+        """
+        Return when a document (or one of its signers) last changed, validating ownership.
+        """
+        version = self.document_repository.get_document_version(document_id)
+        if not version:
+            raise DocumentNotFoundException()
+        if version["company_id"] != company.id:
+            logger.error(f"Unauthorized access to document ID {document_id} by company ID {company.id}.")
+            raise UnauthorizedDocumentAccessException()
+        return version["last_updated_at"]
+
+    @staticmethod
+    def get_document_rows_version(document_rows: List[dict]) -> Tuple[list, Optional[datetime]]:
+        """
+        Return the version of a page of document rows: the `id` and `last_updated_at`
+        of every row, which change whenever a document of the page is added, edited
+        (signers included) or removed, and the latest change time among them.
+        """
+        version = [(row["id"], row["last_updated_at"].isoformat()) for row in document_rows]
+        last_modified = max((row["last_updated_at"] for row in document_rows), default=None)
+        return version, last_modified
+
     @staticmethod
     def validate_document_ownership(document_id: int, company: Company) -> None:
         """
@@ -54,17 +127,67 @@ class DocumentService:
         if not Document.objects.filter(id=document_id, company=company).exists():
             raise DocumentNotFoundException()
 
-    def list_documents(self, company_id: int) -> List[Document]:
+    def get_zap_sign_document(self, document_id: int, company: Company) -> dict:
         """
-        List all documents for a specific company.
+        Retrieve a document's details from ZapSign, served from the shared cache when possible.
+        """
+        document = self.get_document(document_id, company)
+        if not document.token:
+            logger.error(f"Document ID {document_id} has not been created in ZapSign yet.")
+            raise DocumentNotInZapSignException()
+        return self.get_zap_sign_service(company).get_document(document.token)
+
+    def list_documents(self, company_id: int, filters: Optional[dict] = None) -> QuerySet:
+        """
+        List the documents of a specific company matching the filters. The queryset
+        is lazy, so callers can paginate it before any row is loaded.
         """
         try:
-            logger.info(f"Fetching documents for company ID {company_id}.")
-            return list(self.document_repository.get_documents_by_company(company_id))
+            logger.info(f"Fetching documents for company ID {company_id} with filters {filters or {}}.")
+            return self.document_repository.get_documents_by_company(company_id, filters)
         except Exception as e:
             logger.error(f"An unexpected error occurred while listing documents for company ID {company_id}: {str(e)}")
             raise
 
+    def list_document_rows(
+            self,
+            company_id: int,
+            filters: Optional[dict] = None,
+            columns: Sequence[str] = DOCUMENT_FIELDS
+    ) -> QuerySet:
+        """
+        List the documents of a company as plain dicts of the given columns, for the read-only list endpoint.
+        """
+        logger.info(f"Fetching document rows for company ID {company_id} with filters {filters or {}}.")
+        return self.document_repository.get_document_rows_by_company(company_id, filters, columns)
+
+    def get_signer_rows(self, document_rows: List[dict]) -> List[dict]:
+        """
+        Fetch the signers of a page of document rows as plain dicts.
+        """
+        return self.document_repository.get_signer_rows_by_document_ids([row["id"] for row in document_rows])
+
+    def search_documents(self, company_id: int, text: str) -> QuerySet:
+        """
+        Search a company's documents by document name and signer name or email.
+        Every term of `text` must prefix-match a word; results are ranked by relevance.
+        """
+        logger.info(f"Searching documents for company ID {company_id}.")
+        query = build_prefix_search_query(text)
+        if query is None:
+            return self.document_repository.get_documents_by_company(company_id).none()
+        return self.document_repository.search_documents_by_company(company_id, query)
+
+    def export_documents(self, company_id: int) -> Iterator[dict]:
+        """
+        Stream every document of a company joined with its signers, without
+        loading the whole history in memory.
+        """
+        logger.info(f"Exporting documents for company ID {company_id}.")
+        return self.document_repository.iter_export_rows_by_company(
+            company_id, settings.DOCUMENT_EXPORT_CHUNK_SIZE
+        )
+
     @transaction.atomic
     def create_document(self, company: Company, data: dict) -> Document:
         """
@@ -78,87 +201,351 @@ class DocumentService:
 
             url_pdf = data.pop("url_pdf", None)
 
-            data['company_id'] = company.id
-
-            document = self.document_repository.create_document(data)
+            document = self._create_local_document(company, data)
 
-            if not document:
-                logger.error("Failed to create document in local database.")
-                raise FailedToCreateDocumentException()
-
-            logger.info(f"Document created in local database with ID {document.id}.")
-
-            zap_sign_payload = {
-                "name": document.name,
-                "url_pdf": url_pdf,
-                "signers": [
-                    {
-                        "name": signer.get("name"),
-                        "email": signer.get("email"),
-                        "auth_mode": "assinaturaTela",
-                        "send_automatic_email": True,
-                    }
-                    for signer in signers_data
-                ],
-            }
+            zap_sign_payload = self._build_zap_sign_payload(document, url_pdf, signers_data)
 
             logger.info(f"Payload for ZapSign API: {zap_sign_payload}")
 
-            zap_sign_response = self.zap_sign_service.create_document_in_zapsign(**zap_sign_payload)
+            zap_sign_service = self.get_zap_sign_service(company)
+            zap_sign_response = zap_sign_service.create_document_in_zapsign(**zap_sign_payload)
 
-            if not zap_sign_response:
-                logger.error("Failed to create document in ZapSign API.")
-                raise FailedToCreateDocumentInZapSignException()
+            return self._apply_zap_sign_response(document, zap_sign_response, signers_data)
 
-            logger.info(f"ZapSign API response: {zap_sign_response}")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred during document creation: {str(e)}")
+            raise
 
-            document_update_data = {
-                "token": zap_sign_response.get("token"),
-                "status": zap_sign_response.get("status"),
-                "open_id": zap_sign_response.get("open_id"),
-                "zap_sign_created_by": zap_sign_response["created_by"]["email"],
-                "zap_sign_external_id": zap_sign_response.get("external_id"),
-            }
+    @transaction.atomic
+    def enqueue_document_creation(self, company: Company, data: dict) -> Document:
+        """
+        Create a new document in the local database together with an outbox entry.
+        The ZapSign call happens later in a Celery worker, outside of this transaction.
+        """
+        try:
+            logger.info(f"Queueing the creation of a new document with data: {data}")
+
+            signers_data = data.pop("signers", [])
+
+            url_pdf = data.pop("url_pdf", None)
+
+            data["status"] = DOCUMENT_STATUS_QUEUED
+
+            document = self._create_local_document(company, data)
+
+            entry = self.outbox_repository.create_entry(
+                document,
+                {"url_pdf": url_pdf, "signers": signers_data},
+            )
+
+            logger.info(f"Outbox entry {entry.id} created for document {document.id}.")
+
+            transaction.on_commit(lambda: self._dispatch_outbox_entry(entry.id))
+
+            return document
+
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while queueing document creation: {str(e)}")
+            raise
+
+    def create_documents_batch(self, company: Company, items: List[dict]) -> List[dict]:
+        """
+        Create several documents at once and report the outcome of each one.
+
+        The local rows are inserted with one bulk INSERT, ZapSign is called for every
+        document in parallel through a bounded thread pool (no database transaction
+        is held meanwhile), and the responses are written back in bulk. Items are
+        independent: a document ZapSign rejects is removed from the local database
+        and reported as failed, while the others are kept, so failed items can
+        simply be resubmitted.
+        """
+        try:
+            logger.info(f"Starting the batch creation of {len(items)} documents for company ID {company.id}.")
+
+            signers_by_index = [item.pop("signers", []) for item in items]
+            url_pdf_by_index = [item.pop("url_pdf", None) for item in items]
 
-            updated_document = self.document_repository.update_document(document, **document_update_data)
+            with transaction.atomic():
+                documents = self.document_repository.bulk_create_documents(
+                    [{**item, "company_id": company.id} for item in items]
+                )
 
-            if not updated_document:
-                logger.error("Failed to update document with ZapSign details.")
-                raise FailedToUpdateDocumentException()
+            payloads = [
+                self._build_zap_sign_payload(document, url_pdf, signers_data)
+                for document, url_pdf, signers_data in zip(documents, url_pdf_by_index, signers_by_index)
+            ]
+            zap_sign_service = self.get_zap_sign_service(company)
+            max_workers = max(1, min(settings.ZAPSIGN_BATCH_MAX_WORKERS, len(payloads)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(partial(self._call_zap_sign_safely, zap_sign_service), payloads))
 
-            logger.info(f"Document updated with ZapSign details: {document_update_data}")
+            succeeded = [
+                (index, response) for index, (response, error) in enumerate(outcomes) if error is None
+            ]
+            failed_ids = [documents[index].id for index, (_, error) in enumerate(outcomes) if error is not None]
 
-            for signer, original_signer_data in zip(zap_sign_response.get("signers", []), signers_data):
-                signer_data = {
-                    "token": signer.get("token"),
-                    "status": signer.get("status"),
-                    "name": original_signer_data.get("name"),
-                    "email": original_signer_data.get("email"),
-                    "external_id": signer.get("external_id"),
-                    "document": updated_document,
+            with transaction.atomic():
+                self._apply_zap_sign_responses_bulk(
+                    [documents[index] for index, _ in succeeded],
+                    [response for _, response in succeeded],
+                    [signers_by_index[index] for index, _ in succeeded],
+                )
+                if failed_ids:
+                    self.document_repository.delete_documents_by_ids(failed_ids)
+
+            created = {
+                document.id: document
+                for document in self.document_repository.get_documents_by_ids([documents[i].id for i, _ in succeeded])
+            }
+
+            logger.info(f"Batch creation finished: {len(succeeded)} created, {len(failed_ids)} failed.")
+
+            return [
+                {
+                    "index": index,
+                    "status": BATCH_ITEM_CREATED if error is None else BATCH_ITEM_FAILED,
+                    "document": created.get(documents[index].id) if error is None else None,
+                    "error": error,
                 }
-                created_signer = self.signer_repository.create_signer(signer_data)
-                if not created_signer:
-                    logger.error(f"Failed to create signer with data {signer_data} for document {updated_document.id}.")
-                    raise FailedToCreateSignerException()
+                for index, (_, error) in enumerate(outcomes)
+            ]
+        except Exception as e:
+            logger.error(f"An unexpected error occurred during batch document creation: {str(e)}")
+            raise
+
+    @transaction.atomic
+    def enqueue_documents_batch(self, company: Company, items: List[dict]) -> List[dict]:
+        """
+        Queue several documents for creation through the outbox, with one bulk INSERT
+        for the documents and one for their outbox entries.
+        """
+        try:
+            logger.info(f"Queueing the batch creation of {len(items)} documents for company ID {company.id}.")
 
-                logger.info(f"Signer created with ID {created_signer.id} for document {updated_document.id}.")
+            payloads = [{"url_pdf": item.pop("url_pdf", None), "signers": item.pop("signers", [])} for item in items]
 
-            return updated_document
+            documents = self.document_repository.bulk_create_documents(
+                [{**item, "company_id": company.id, "status": DOCUMENT_STATUS_QUEUED} for item in items]
+            )
+            entries = self.outbox_repository.bulk_create_entries(
+                [{"document": document, "payload": payload} for document, payload in zip(documents, payloads)]
+            )
+
+            entry_ids = [entry.id for entry in entries]
+            transaction.on_commit(lambda: [self._dispatch_outbox_entry(entry_id) for entry_id in entry_ids])
 
+            return [
+                {"index": index, "status": BATCH_ITEM_QUEUED, "document": document, "error": None}
+                for index, document in enumerate(documents)
+            ]
         except Exception as e:
-            logger.error(f"An unexpected error occurred during document creation: {str(e)}")
+            logger.error(f"An unexpected error occurred while queueing batch document creation: {str(e)}")
+            raise
+
+    @staticmethod
+    def _call_zap_sign_safely(
+            zap_sign_service: ZapSignService,
+            zap_sign_payload: dict
+    ) -> Tuple[Optional[dict], Optional[dict]]:
+        """
+        Call ZapSign for one document of a batch, returning (response, error) instead of raising.
+        A response single creates would reject (empty or incomplete) is reported as an error.
+        """
+        try:
+            zap_sign_response = zap_sign_service.create_document_in_zapsign(**zap_sign_payload)
+            DocumentService._build_document_update_data(zap_sign_response)
+            return zap_sign_response, None
+        except ExceptionMessageBuilder as e:
+            return None, {"title": e.title, "message": e.message}
+        except Exception as e:
+            logger.error(f"Failed to create batch document '{zap_sign_payload.get('name')}' in ZapSign: {str(e)}")
+            error = FailedToCreateDocumentInZapSignException()
+            return None, {"title": error.title, "message": error.message}
+
+    def process_outbox_entry(self, entry_id: int) -> Optional[Document]:
+        """
+        Send a queued document to ZapSign and store the response.
+        The entry is claimed in a short transaction, the ZapSign call runs without
+        holding a database transaction, and the result is written in a second one.
+        Returns None when the entry is missing, finished, or claimed by another worker.
+        """
+        stale_before = timezone.now() - timedelta(seconds=settings.ZAPSIGN_OUTBOX_VISIBILITY_TIMEOUT)
+
+        with transaction.atomic():
+            entry = self.outbox_repository.claim_entry(entry_id, stale_before)
+
+        if not entry:
+            logger.info(f"Outbox entry {entry_id} is not available for processing.")
+            return None
+
+        document = entry.document
+        signers_data = entry.payload.get("signers", [])
+
+        try:
+            logger.info(f"Processing outbox entry {entry.id} for document {document.id} (attempt {entry.attempts}).")
+            zap_sign_payload = self._build_zap_sign_payload(document, entry.payload.get("url_pdf"), signers_data)
+            zap_sign_service = self.get_zap_sign_service(document.company)
+            zap_sign_response = zap_sign_service.create_document_in_zapsign(**zap_sign_payload)
+
+            with transaction.atomic():
+                document = self._apply_zap_sign_response(document, zap_sign_response, signers_data)
+                self.outbox_repository.mark_done(entry)
+
+            return document
+        except Exception as e:
+            give_up = entry.attempts >= settings.ZAPSIGN_OUTBOX_MAX_ATTEMPTS
+            backoff = settings.ZAPSIGN_OUTBOX_RETRY_BACKOFF * 2 ** (entry.attempts - 1)
+            next_attempt_at = timezone.now() + timedelta(seconds=backoff)
+            logger.error(f"Failed to process outbox entry {entry.id} (attempt {entry.attempts}): {str(e)}")
+
+            with transaction.atomic():
+                self.outbox_repository.mark_failed_attempt(entry, str(e), give_up, next_attempt_at)
+                if give_up:
+                    self.document_repository.update_document_fields(document, status=DOCUMENT_STATUS_FAILED)
             raise
 
+    def _dispatch_outbox_entry(self, entry_id: int) -> None:
+        """
+        Hand an outbox entry over to a Celery worker. When the broker is unavailable the
+        entry stays pending and is picked up by the periodic drain task.
+        """
+        from apps.documents.tasks import process_document_outbox
+
+        try:
+            process_document_outbox.delay(entry_id)
+        except Exception as e:
+            logger.warning(f"Could not dispatch outbox entry {entry_id}, leaving it for the drain task: {str(e)}")
+
+    def _create_local_document(self, company: Company, data: dict) -> Document:
+        """
+        Create the local document row for a company.
+        """
+        data['company_id'] = company.id
+
+        document = self.document_repository.create_document(data)
+
+        if not document:
+            logger.error("Failed to create document in local database.")
+            raise FailedToCreateDocumentException()
+
+        logger.info(f"Document created in local database with ID {document.id}.")
+        return document
+
+    @staticmethod
+    def _build_zap_sign_payload(document: Document, url_pdf: Optional[str], signers_data: list) -> dict:
+        """
+        Build the ZapSign API payload for a local document.
+        """
+        return {
+            "name": document.name,
+            "url_pdf": url_pdf,
+            "signers": [
+                {
+                    "name": signer.get("name"),
+                    "email": signer.get("email"),
+                    "auth_mode": "assinaturaTela",
+                    "send_automatic_email": True,
+                }
+                for signer in signers_data
+            ],
+        }
+
+    def _apply_zap_sign_response(self, document: Document, zap_sign_response: dict, signers_data: list) -> Document:
+        """
+        Update a local document with ZapSign's response and create its signers.
+        """
+        document_update_data = self._build_document_update_data(zap_sign_response)
+        logger.info(f"ZapSign API response: {zap_sign_response}")
+
+        updated_document = self.document_repository.update_document_fields(document, **document_update_data)
+
+        if not updated_document:
+            logger.error("Failed to update document with ZapSign details.")
+            raise FailedToUpdateDocumentException()
+
+        logger.info(f"Document updated with ZapSign details: {document_update_data}")
+
+        signers_to_create = self._build_signers_from_response(updated_document, zap_sign_response, signers_data)
+        created_signers = self.signer_repository.bulk_create_signers(signers_to_create, touch=False)
+        if len(created_signers) != len(signers_to_create):
+            logger.error(f"Failed to create the signers of document {updated_document.id}.")
+            raise FailedToCreateSignerException()
+
+        logger.info(f"Created {len(created_signers)} signers for document {updated_document.id}.")
+
+        return updated_document
+
+    @staticmethod
+    def _build_document_update_data(zap_sign_response: Optional[dict]) -> dict:
+        """
+        Extract the document fields stored from a ZapSign creation response, shared
+        by single and batch creates. Raises an exception when ZapSign returned nothing.
+        """
+        if not zap_sign_response:
+            logger.error("Failed to create document in ZapSign API.")
+            raise FailedToCreateDocumentInZapSignException()
+
+        return {
+            "token": zap_sign_response.get("token"),
+            "status": zap_sign_response.get("status"),
+            "open_id": zap_sign_response.get("open_id"),
+            "created_by": zap_sign_response["created_by"]["email"],
+            "external_id": zap_sign_response.get("external_id"),
+        }
+
+    @staticmethod
+    def _build_signers_from_response(document: Document, zap_sign_response: dict, signers_data: list) -> List[dict]:
+        """
+        Pair the signers returned by ZapSign with the submitted ones, in order.
+        """
+        return [
+            {
+                "token": signer.get("token"),
+                "status": signer.get("status"),
+                "name": original_signer_data.get("name"),
+                "email": original_signer_data.get("email"),
+                "external_id": signer.get("external_id"),
+                "document": document,
+            }
+            for signer, original_signer_data in zip(zap_sign_response.get("signers", []), signers_data)
+        ]
+
+    def _apply_zap_sign_responses_bulk(
+            self,
+            documents: List[Document],
+            zap_sign_responses: List[dict],
+            signers_by_document: List[list]
+    ) -> None:
+        """
+        Update several local documents with ZapSign's responses and create all of
+        their signers, using one bulk UPDATE and one bulk INSERT.
+        """
+        if not documents:
+            return
+
+        signers_to_create = []
+        for document, zap_sign_response, signers_data in zip(documents, zap_sign_responses, signers_by_document):
+            document_update_data = self._build_document_update_data(zap_sign_response)
+            for field, value in document_update_data.items():
+                setattr(document, field, value)
+            signers_to_create.extend(self._build_signers_from_response(document, zap_sign_response, signers_data))
+
+        self.document_repository.bulk_update_documents(documents, list(document_update_data))
+        self.signer_repository.bulk_create_signers(signers_to_create, touch=False)
+
+        logger.info(f"Applied ZapSign responses to {len(documents)} documents and {len(signers_to_create)} signers.")
+
     @transaction.atomic
     def update_document(self, document_id: int, company: Company, data: dict) -> Document:
         """
         Update an existing document.
         """
         try:
-            document = self.get_document(document_id, company)
+            document = self.get_document(document_id, company, with_signers=True)
             logger.info(f"Updating document ID {document_id} for company ID {company.id} with data: {data}")
-            return self.document_repository.update_document(document, **data)
+            updated_document = self.document_repository.update_document(document, **data)
+            self._invalidate_zap_sign_cache_on_commit(updated_document.token)
+            return updated_document
         except (DocumentNotFoundException, UnauthorizedDocumentAccessException):
             raise
         except Exception as e:
@@ -174,8 +561,81 @@ class DocumentService:
             document = self.get_document(document_id, company)
             logger.info(f"Deleting document ID {document_id} for company ID {company.id}.")
             self.document_repository.delete_document(document)
+            self._invalidate_zap_sign_cache_on_commit(document.token)
         except (DocumentNotFoundException, UnauthorizedDocumentAccessException):
             raise
         except Exception as e:
             logger.error(f"An unexpected error occurred while deleting document ID {document_id}: {str(e)}")
             raise
+
+    @transaction.atomic
+    def bulk_update_documents(
+            self,
+            company: Company,
+            data: dict,
+            document_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None
+    ) -> List[dict]:
+        """
+        Apply the same changes to the company's documents selected by IDs or by filters,
+        with a single UPDATE. Returns one result per document.
+        """
+        documents = self._lock_documents_for_bulk(company, document_ids, filters)
+        found_ids = [document["id"] for document in documents]
+        logger.info(f"Bulk updating {len(found_ids)} documents for company ID {company.id} with data: {data}")
+        if found_ids:
+            self.document_repository.update_documents_by_ids(found_ids, data)
+            self._invalidate_zap_sign_documents_on_commit([document["token"] for document in documents])
+        return build_bulk_results(document_ids, found_ids, BULK_ITEM_UPDATED, BULK_ITEM_NOT_FOUND)
+
+    @transaction.atomic
+    def bulk_delete_documents(
+            self,
+            company: Company,
+            document_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None
+    ) -> List[dict]:
+        """
+        Delete the company's documents selected by IDs or by filters, with their signers,
+        using set-based DELETEs. Returns one result per document.
+        """
+        documents = self._lock_documents_for_bulk(company, document_ids, filters)
+        found_ids = [document["id"] for document in documents]
+        logger.info(f"Bulk deleting {len(found_ids)} documents for company ID {company.id}.")
+        if found_ids:
+            self.document_repository.delete_documents_by_ids(found_ids)
+            self._invalidate_zap_sign_documents_on_commit([document["token"] for document in documents])
+        return build_bulk_results(document_ids, found_ids, BULK_ITEM_DELETED, BULK_ITEM_NOT_FOUND)
+
+    def _lock_documents_for_bulk(
+            self,
+            company: Company,
+            document_ids: Optional[List[int]],
+            filters: Optional[dict]
+    ) -> List[dict]:
+        """
+        Lock the selected documents. A filter matching more than API_BULK_MAX_SIZE documents is rejected.
+        """
+        if document_ids is not None:
+            return self.document_repository.lock_documents_by_company(company.id, document_ids=document_ids)
+
+        max_size = settings.API_BULK_MAX_SIZE
+        documents = self.document_repository.lock_documents_by_company(company.id, filters=filters, limit=max_size + 1)
+        if len(documents) > max_size:
+            raise BulkSelectionTooLargeException(max_size)
+        return documents
+
+    def _invalidate_zap_sign_documents_on_commit(self, document_tokens: List[Optional[str]]) -> None:
+        """
+        Drop the cached ZapSign details of several documents once the current transaction commits.
+        """
+        document_tokens = [token for token in document_tokens if token]
+        if document_tokens:
+            transaction.on_commit(lambda: self.zap_sign_service.invalidate_documents(document_tokens))
+
+    def _invalidate_zap_sign_cache_on_commit(self, document_token: Optional[str]) -> None:
+        """
+        Drop the cached ZapSign details of a document once the current transaction commits.
+        """
+        if document_token:
+            transaction.on_commit(lambda: self.zap_sign_service.invalidate_document(document_token))
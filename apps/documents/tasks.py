@@ -0,0 +1,49 @@
+import logging
+from datetime import timedelta
+
+import requests
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from apps.documents.repository import DocumentOutboxRepository
+from apps.documents.service import DocumentService
+from utils.exceptions import ExceptionMessageBuilder
+
+logger = logging.getLogger(__name__)
+
+# ZapSign and document creation errors, which process_outbox_entry records on the
+# entry (rescheduling or failing it) before re-raising them.
+RECORDED_OUTBOX_ERRORS = (requests.RequestException, ExceptionMessageBuilder)
+
+
+@shared_task
+def process_document_outbox(entry_id: int):
+    """
+    Send a queued document to ZapSign. A failed attempt schedules the entry's
+    next attempt with exponential backoff, and drain_document_outbox dispatches
+    it once it is due, until the entry runs out of attempts.
+    """
+    try:
+        document = DocumentService().process_outbox_entry(entry_id)
+    except RECORDED_OUTBOX_ERRORS:
+        # Already logged and recorded on the entry, which the drain retries.
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error while processing outbox entry {entry_id}: {str(e)}")
+        raise
+    return document.id if document else None
+
+
+@shared_task
+def drain_document_outbox():
+    """
+    Dispatch outbox entries that were never picked up, whose retry is due,
+    or whose worker died mid-flight.
+    """
+    stale_before = timezone.now() - timedelta(seconds=settings.ZAPSIGN_OUTBOX_VISIBILITY_TIMEOUT)
+    entry_ids = DocumentOutboxRepository.get_claimable_entry_ids(stale_before, settings.ZAPSIGN_OUTBOX_BATCH_SIZE)
+    for entry_id in entry_ids:
+        process_document_outbox.delay(entry_id)
+    logger.info(f"Dispatched {len(entry_ids)} outbox entries.")
+    return len(entry_ids)
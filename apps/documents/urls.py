@@ -1,9 +1,15 @@
 from django.urls import path
-from apps.documents.views import DocumentListView, DocumentDetailView
+from apps.documents.views import DocumentListView, DocumentDetailView, DocumentZapSignView, DocumentBatchView, \
+    DocumentExportView, DocumentSearchView, DocumentBulkView
 
 app_name = 'documents'
 
 urlpatterns = [
     path('', DocumentListView.as_view(), name='document_list'),
+    path('batch/', DocumentBatchView.as_view(), name='document_batch'),
+    path('bulk/', DocumentBulkView.as_view(), name='document_bulk'),
+    path('export/', DocumentExportView.as_view(), name='document_export'),
+    path('search/', DocumentSearchView.as_view(), name='document_search'),
     path('<int:document_id>/', DocumentDetailView.as_view(), name='document_detail'),
+    path('<int:document_id>/zapsign/', DocumentZapSignView.as_view(), name='document_zapsign'),
 ]
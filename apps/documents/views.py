@@ -1,13 +1,24 @@
 from typing import Optional
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from drf_yasg import openapi
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 
-from apps.documents.serializers import DocumentSerializer, DocumentCreateSerializer, DocumentUpdateSerializer
-from apps.documents.service import DocumentService
+from apps.documents.serializers import DocumentSerializer, DocumentCreateSerializer, DocumentUpdateSerializer, \
+    DocumentBatchCreateSerializer, DocumentBatchItemResultSerializer, DocumentExportQuerySerializer, \
+    DocumentListFilterSerializer, DocumentSearchQuerySerializer, DocumentDetailQuerySerializer, \
+    serialize_document_rows, get_document_projection, PROJECTION_QUERY_PARAMS, DocumentBulkUpdateSerializer, \
+    DocumentBulkSelectionSerializer, DocumentBulkItemResultSerializer
+from apps.documents.service import DocumentService, BATCH_ITEM_FAILED, DOCUMENT_EXPORT_FIELDS, BULK_ITEM_NOT_FOUND
+from utils.conditional import build_etag, get_not_modified_response, set_validators
+from utils.idempotency import idempotent, IDEMPOTENCY_KEY_PARAMETER
+from utils.pagination import KeysetPagination, CURSOR_PARAMETER, PAGE_SIZE_PARAMETER
+from utils.streaming import iter_ndjson, iter_csv
 
 
 class DocumentListView(APIView):
@@ -28,36 +39,286 @@ class DocumentListView(APIView):
     @swagger_auto_schema(
         tags=["documents"],
         operation_summary="List documents",
+        operation_description=(
+            "Lists the company's documents, newest first, one page at a time, optionally filtered by status, "
+            "creation range (created_after inclusive, created_before exclusive) and external_id. "
+            "`fields` restricts the returned (and queried) document fields; signers are then only "
+            "loaded with expand=signers. Unknown query parameters are rejected. "
+            "When there are more documents, the X-Next-Cursor and Link headers point to the next page."
+        ),
+        query_serializer=DocumentListFilterSerializer,
+        manual_parameters=[CURSOR_PARAMETER, PAGE_SIZE_PARAMETER],
         responses={
-            200: DocumentSerializer(many=True)
+            200: DocumentSerializer(many=True),
+            304: "The client's copy (If-None-Match / If-Modified-Since) is still current.",
         },
     )
     def get(self, request, *args, **kwargs):
         """
-        List documents for a company.
+        List documents for a company, optionally filtered by status, creation range and external_id.
+        The validators are computed from the page's own rows, and a 304 is answered
+        without loading signers or serializing anything when the client's copy is current.
         """
-        documents = self.document_service.list_documents(request.user.id)
-        serializer = DocumentSerializer(documents, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        filter_serializer = DocumentListFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+        row_serializer, with_signers = get_document_projection(filter_serializer.validated_data)
+        filters = {
+            key: value for key, value in filter_serializer.validated_data.items() if key not in PROJECTION_QUERY_PARAMS
+        }
+
+        paginator = KeysetPagination(ordering=("-created_at", "-id"))
+        rows = paginator.paginate_queryset(
+            self.document_service.list_document_rows(request.user.id, filters, row_serializer.row_keys), request
+        )
+        version, last_modified = self.document_service.get_document_rows_version(rows)
+        etag = build_etag(request, request.user.id, version, paginator.next_cursor)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        signer_rows = self.document_service.get_signer_rows(rows) if with_signers else None
+        data = serialize_document_rows(rows, signer_rows, row_serializer)
+        return set_validators(paginator.get_paginated_response(data), etag, last_modified)
 
     @swagger_auto_schema(
         tags=["documents"],
         operation_summary="Create a document",
         request_body=DocumentCreateSerializer,
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
         responses={
-            201: DocumentSerializer
+            201: DocumentSerializer,
+            202: DocumentSerializer,
         },
     )
+    @idempotent
     def post(self, request, *args, **kwargs):
         """
         Create a new document for a company.
+        When the ZapSign outbox is enabled, the document is queued and 202 Accepted is returned.
         """
         serializer = DocumentCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        if settings.ZAPSIGN_OUTBOX_ENABLED:
+            document = self.document_service.enqueue_document_creation(request.user, serializer.data)
+            return Response(DocumentSerializer(document).data, status=status.HTTP_202_ACCEPTED)
         document = self.document_service.create_document(request.user, serializer.data)
         return Response(DocumentSerializer(document).data, status=status.HTTP_201_CREATED)
 
 
+class DocumentBatchView(APIView):
+    """
+    API view to create several documents in one request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            document_service: Optional[DocumentService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.document_service = document_service or DocumentService()
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Create documents in batch",
+        operation_description=(
+            "Creates every document of the batch and returns one result per item, in request order. "
+            "Items are independent: a document ZapSign rejects is reported as failed and not stored, "
+            "while the other documents are kept. Responds 201 when every item was created, "
+            "202 when the items were queued through the outbox, and 207 when at least one item failed."
+        ),
+        request_body=DocumentBatchCreateSerializer,
+        manual_parameters=[IDEMPOTENCY_KEY_PARAMETER],
+        responses={
+            201: DocumentBatchItemResultSerializer(many=True),
+            202: DocumentBatchItemResultSerializer(many=True),
+            207: DocumentBatchItemResultSerializer(many=True),
+        },
+    )
+    @idempotent
+    def post(self, request, *args, **kwargs):
+        """
+        Create several documents for a company.
+        """
+        serializer = DocumentBatchCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.data["documents"]
+        if settings.ZAPSIGN_OUTBOX_ENABLED:
+            results = self.document_service.enqueue_documents_batch(request.user, items)
+            response_status = status.HTTP_202_ACCEPTED
+        else:
+            results = self.document_service.create_documents_batch(request.user, items)
+            any_failed = any(result["status"] == BATCH_ITEM_FAILED for result in results)
+            response_status = status.HTTP_207_MULTI_STATUS if any_failed else status.HTTP_201_CREATED
+        return Response(DocumentBatchItemResultSerializer(results, many=True).data, status=response_status)
+
+
+class DocumentBulkView(APIView):
+    """
+    API view to update or delete several documents in one request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            document_service: Optional[DocumentService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.document_service = document_service or DocumentService()
+
+    @staticmethod
+    def build_response(results: list) -> Response:
+        """
+        Responds 200 when every selected document was processed, 207 when some IDs were not found.
+        """
+        any_missing = any(result["status"] == BULK_ITEM_NOT_FOUND for result in results)
+        response_status = status.HTTP_207_MULTI_STATUS if any_missing else status.HTTP_200_OK
+        return Response(DocumentBulkItemResultSerializer(results, many=True).data, status=response_status)
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Update documents in bulk",
+        operation_description=(
+            "Applies the same changes to the company's documents selected by `ids` or by `filter` "
+            "(status, created_after, created_before, external_id), with a single UPDATE. "
+            "Returns one result per document; IDs that do not exist or belong to another company "
+            "are reported as not_found, and the response is then 207."
+        ),
+        request_body=DocumentBulkUpdateSerializer,
+        responses={
+            200: DocumentBulkItemResultSerializer(many=True),
+            207: DocumentBulkItemResultSerializer(many=True),
+        },
+    )
+    def patch(self, request, *args, **kwargs):
+        """
+        Update several documents of a company.
+        """
+        serializer = DocumentBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        results = self.document_service.bulk_update_documents(
+            request.user, data["changes"], document_ids=data.get("ids"), filters=data.get("filter")
+        )
+        return self.build_response(results)
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Delete documents in bulk",
+        operation_description=(
+            "Deletes the company's documents selected by `ids` or by `filter`, with their signers. "
+            "Returns one result per document; IDs that do not exist or belong to another company "
+            "are reported as not_found, and the response is then 207."
+        ),
+        request_body=DocumentBulkSelectionSerializer,
+        responses={
+            200: DocumentBulkItemResultSerializer(many=True),
+            207: DocumentBulkItemResultSerializer(many=True),
+        },
+    )
+    def delete(self, request, *args, **kwargs):
+        """
+        Delete several documents of a company.
+        """
+        serializer = DocumentBulkSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        results = self.document_service.bulk_delete_documents(
+            request.user, document_ids=data.get("ids"), filters=data.get("filter")
+        )
+        return self.build_response(results)
+
+
+class DocumentExportView(APIView):
+    """
+    API view to stream every document of a company with its signers.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            document_service: Optional[DocumentService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.document_service = document_service or DocumentService()
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Export documents",
+        operation_description=(
+            "Streams one row per document and signer (documents without signers appear once), "
+            "as newline-delimited JSON or CSV. Rows are read in chunks, so exports of any size "
+            "use constant memory."
+        ),
+        query_serializer=DocumentExportQuerySerializer,
+        responses={
+            200: openapi.Response("Export file (application/x-ndjson or text/csv)."),
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """
+        Export the documents of a company.
+        """
+        serializer = DocumentExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        export_format = serializer.validated_data["export_format"]
+
+        rows = self.document_service.export_documents(request.user.id)
+        if export_format == "csv":
+            response = StreamingHttpResponse(iter_csv(rows, DOCUMENT_EXPORT_FIELDS), content_type="text/csv")
+        else:
+            response = StreamingHttpResponse(iter_ndjson(rows), content_type="application/x-ndjson")
+        response["Content-Disposition"] = f'attachment; filename="documents.{export_format}"'
+        return response
+
+
+class DocumentSearchView(APIView):
+    """
+    API view to search a company's documents.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            document_service: Optional[DocumentService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.document_service = document_service or DocumentService()
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Search documents",
+        operation_description=(
+            "Finds the company's documents whose name, or one of whose signers' name or email, "
+            "contains words starting with every term of q (\"acme contr\" matches \"ACME Contract\"). "
+            "Results are ranked by relevance, then newest first. "
+            "When there are more results, the X-Next-Cursor and Link headers point to the next page."
+        ),
+        query_serializer=DocumentSearchQuerySerializer,
+        manual_parameters=[CURSOR_PARAMETER, PAGE_SIZE_PARAMETER],
+        responses={200: DocumentSerializer(many=True)},
+    )
+    def get(self, request, *args, **kwargs):
+        """
+        Search documents for a company by document name and signer name or email.
+        """
+        query_serializer = DocumentSearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        documents = self.document_service.search_documents(request.user.id, query_serializer.validated_data["q"])
+        paginator = KeysetPagination(ordering=("-search_rank", "-created_at", "-id"))
+        serializer = DocumentSerializer(paginator.paginate_queryset(documents, request), many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
 class DocumentDetailView(APIView):
     """
     API view to handle document details, updates, and deletions.
@@ -74,17 +335,32 @@ class DocumentDetailView(APIView):
     @swagger_auto_schema(
         tags=["documents"],
         operation_summary="Retrieve a document",
+        query_serializer=DocumentDetailQuerySerializer,
         responses={
-            200: DocumentSerializer
+            200: DocumentSerializer,
+            304: "The client's copy (If-None-Match / If-Modified-Since) is still current.",
         },
     )
     def get(self, request, document_id):
         """
         Retrieve a document for a specific company.
+        Answers 304 without loading the document when the client's copy is current.
+        Unknown query parameters are rejected with 400, like on the list endpoint.
         """
-        document = self.document_service.get_document(document_id, request.user)
-        serializer = DocumentSerializer(document)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        fields_serializer = DocumentDetailQuerySerializer(data=request.query_params)
+        fields_serializer.is_valid(raise_exception=True)
+        row_serializer, with_signers = get_document_projection(fields_serializer.validated_data)
+
+        last_modified = self.document_service.get_document_version(document_id, request.user)
+        etag = build_etag(request, document_id, last_modified)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        row = self.document_service.get_document_row(document_id, request.user, row_serializer.row_keys)
+        signer_rows = self.document_service.get_signer_rows([row]) if with_signers else None
+        data = serialize_document_rows([row], signer_rows, row_serializer)[0]
+        return set_validators(Response(data, status=status.HTTP_200_OK), etag, last_modified)
 
     @swagger_auto_schema(
         tags=["documents"],
@@ -117,3 +393,32 @@ class DocumentDetailView(APIView):
         """
         self.document_service.delete_document(document_id, request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class DocumentZapSignView(APIView):
+    """
+    API view to retrieve a document's live details from ZapSign.
+    """
+
+    def __init__(
+            self,
+            document_service: Optional[DocumentService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.document_service = document_service or DocumentService()
+
+    @swagger_auto_schema(
+        tags=["documents"],
+        operation_summary="Retrieve a document from ZapSign",
+        operation_description="Returns the document as reported by ZapSign. Responses are cached for a short time.",
+        responses={
+            200: "ZapSign document details."
+        },
+    )
+    def get(self, request, document_id):
+        """
+        Retrieve the ZapSign details of a document for a specific company.
+        """
+        zap_sign_document = self.document_service.get_zap_sign_document(document_id, request.user)
+        return Response(zap_sign_document, status=status.HTTP_200_OK)
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 16:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('signers', '0003_alter_signer_status_alter_signer_token'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='signer',
+            index=models.Index(fields=['token'], name='signer_token_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='signer',
+            index=models.Index(fields=['document', 'email'], name='signer_document_email_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-17 19:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('signers', '0005_signer_search_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='signer',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', django.db.models.functions.text.Replace('email', models.Value('@'), models.Value(' ')), django.db.models.functions.text.Replace(django.db.models.functions.text.Replace('email', models.Value('@'), models.Value(' ')), models.Value('.'), models.Value(' ')), config='simple'), name='signer_search_parts_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='signer',
+            name='signer_search_idx',
+        ),
+    ]
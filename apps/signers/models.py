@@ -1,4 +1,21 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Replace
+
+# Full-text vector over the signer name and email. The "@" is replaced so the
+# local part and the domain of an email are searchable on their own. The email
+# is indexed a second time with its dots replaced too, because the parser keeps
+# "acme-corp.com.br" as a single host token: without dots its parts ("acme-corp",
+# "corp", "br") become words of their own. Search queries must use this exact
+# expression to hit the GIN index below.
+SIGNER_SEARCH_VECTOR = SearchVector(
+    "name",
+    Replace("email", Value("@"), Value(" ")),
+    Replace(Replace("email", Value("@"), Value(" ")), Value("."), Value(" ")),
+    config="simple",
+)
 
 
 class Signer(models.Model):
@@ -12,6 +29,11 @@ class Signer(models.Model):
     class Meta:
         verbose_name = "Signer"
         verbose_name_plural = "Signers"
+        indexes = [
+            models.Index(fields=["token"], name="signer_token_idx"),
+            models.Index(fields=["document", "email"], name="signer_document_email_idx"),
+            GinIndex(SIGNER_SEARCH_VECTOR, name="signer_search_parts_idx"),
+        ]
 
     def __str__(self):
         return self.name
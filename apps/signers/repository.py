@@ -1,11 +1,22 @@
-from typing import Optional
+from typing import Optional, Dict, List, Iterable
 
-from django.db.models import QuerySet
+from django.db.models import QuerySet, F
+from django.utils import timezone
 
+from apps.documents.models import Document
 from apps.signers.models import Signer
+from utils.collections import group_tokens_by_status
 
 
 class SignerRepository:
+    @staticmethod
+    def touch_documents(document_ids: Iterable[int]) -> None:
+        """
+        Bump `last_updated_at` on the documents whose signers changed, so the
+        document's validators (ETag/Last-Modified) also cover its signers.
+        """
+        Document.objects.filter(id__in=set(document_ids)).update(last_updated_at=timezone.now())
+
     @staticmethod
     def get_signer_by_id(signer_id: int) -> Optional[Signer]:
         """
@@ -13,6 +24,21 @@ class SignerRepository:
         """
         return Signer.objects.filter(id=signer_id).first()
 
+    @staticmethod
+    def get_signer_with_company_by_id(signer_id: int) -> Optional[Signer]:
+        """
+        Fetch a signer by its ID, annotated with the ID of the company owning its
+        document (`document_company_id`) and the document's `document_last_updated_at`,
+        in a single joined query.
+        """
+        return (
+            Signer.objects
+            .annotate(document_company_id=F("document__company_id"),
+                      document_last_updated_at=F("document__last_updated_at"))
+            .filter(id=signer_id)
+            .first()
+        )
+
     @staticmethod
     def get_signers_by_document(document_id: int) -> QuerySet:
         """
@@ -25,7 +51,21 @@ class SignerRepository:
         """
         Create a new signer.
         """
-        return Signer.objects.create(**data)
+        signer = Signer.objects.create(**data)
+        SignerRepository.touch_documents([signer.document_id])
+        return signer
+
+    @staticmethod
+    def bulk_create_signers(signers_data: List[dict], touch: bool = True) -> List[Signer]:
+        """
+        Create several signers with a single INSERT. On PostgreSQL the returned
+        signers have their IDs set. Pass `touch=False` when the documents were
+        just saved in the same operation.
+        """
+        signers = Signer.objects.bulk_create([Signer(**data) for data in signers_data])
+        if signers and touch:
+            SignerRepository.touch_documents(signer.document_id for signer in signers)
+        return signers
 
     @staticmethod
     def update_signer(signer: Signer, data: dict) -> Signer:
@@ -35,6 +75,7 @@ class SignerRepository:
         for field, value in data.items():
             setattr(signer, field, value)
         signer.save()
+        SignerRepository.touch_documents([signer.document_id])
         return signer
 
     @staticmethod
@@ -42,4 +83,68 @@ class SignerRepository:
         """
         Delete a signer.
         """
+        document_id = signer.document_id
         signer.delete()
+        SignerRepository.touch_documents([document_id])
+
+    @staticmethod
+    def lock_signers_by_company(
+            company_id: int,
+            signer_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None,
+            limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Lock the signers of the company's documents selected by IDs, or else by
+        `document_id`/`status` filters, and return their `id` and `document_id`, at
+        most `limit` of them, in ID order. Must be called inside a transaction.
+
+        Their documents are locked first, in ID order, like document bulk operations
+        (whose cascading deletes reach the signers) lock them, so the two never wait
+        on each other's rows in opposite orders.
+        """
+        queryset = Signer.objects.filter(document__company_id=company_id)
+        if signer_ids is not None:
+            queryset = queryset.filter(id__in=signer_ids)
+        else:
+            queryset = queryset.filter(**(filters or {}))
+        queryset = queryset.order_by("id")
+        document_ids = list(
+            Document.objects
+            .filter(company_id=company_id, id__in=queryset.values("document_id")[:limit])
+            .order_by("id")
+            .select_for_update()
+            .values_list("id", flat=True)
+        )
+        queryset = queryset.filter(document_id__in=document_ids)
+        return list(queryset.select_for_update(of=("self",)).values("id", "document_id")[:limit])
+
+    @staticmethod
+    def update_signers_by_ids(signer_ids: List[int], document_ids: Iterable[int], data: dict) -> int:
+        """
+        Set the same fields on several signers with a single UPDATE and touch their documents.
+        """
+        updated = Signer.objects.filter(id__in=signer_ids).update(**data)
+        SignerRepository.touch_documents(document_ids)
+        return updated
+
+    @staticmethod
+    def delete_signers_by_ids(signer_ids: List[int], document_ids: Iterable[int]) -> None:
+        """
+        Delete several signers with a single DELETE and touch their documents.
+        """
+        Signer.objects.filter(id__in=signer_ids).delete()
+        SignerRepository.touch_documents(document_ids)
+
+    @staticmethod
+    def bulk_update_status_by_token(status_by_token: Dict[str, str], final_statuses: Iterable[str] = ()) -> int:
+        """
+        Set the status of signers looked up by token, with one UPDATE per distinct status.
+        Signers already in one of `final_statuses` are left as they are.
+        """
+        updated = 0
+        for status, tokens in group_tokens_by_status(status_by_token).items():
+            updated += Signer.objects.filter(token__in=tokens).exclude(status__in=final_statuses).update(status=status)
+        if updated:
+            Document.objects.filter(signers__token__in=list(status_by_token)).update(last_updated_at=timezone.now())
+        return updated
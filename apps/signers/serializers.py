@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
 from apps.signers.models import Signer
+from utils.row_serializer import RowSerializer
 
 
 class SignerSerializer(serializers.ModelSerializer):
@@ -8,6 +10,13 @@ class SignerSerializer(serializers.ModelSerializer):
         fields = ["id", "token", "status", "name", "email", "external_id", "document"]
 
 
+# Same shape as SignerSerializer, built from `values()` rows.
+SIGNER_ROW_SERIALIZER = RowSerializer([
+    ("id", "id"), ("token", "token"), ("status", "status"), ("name", "name"), ("email", "email"),
+    ("external_id", "external_id"), ("document", "document_id"),
+])
+
+
 class SignerCreateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255)
     email = serializers.EmailField(required=True)
@@ -21,3 +30,41 @@ class SignerUpdateSerializer(serializers.Serializer):
     email = serializers.EmailField(required=False)
     external_id = serializers.CharField(max_length=255, required=False)
     token = serializers.CharField(max_length=255)
+
+
+class SignerBulkFilterSerializer(serializers.Serializer):
+    document_id = serializers.IntegerField(min_value=1, required=False)
+    status = serializers.CharField(max_length=50, required=False)
+
+    def validate(self, data):
+        if not data:
+            raise serializers.ValidationError("At least one filter is required.")
+        return data
+
+
+class SignerBulkSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    filter = SignerBulkFilterSerializer(required=False)
+
+    def validate_ids(self, value):
+        if len(value) > settings.API_BULK_MAX_SIZE:
+            raise serializers.ValidationError(f"At most {settings.API_BULK_MAX_SIZE} ids can be given.")
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if ("ids" in data) == ("filter" in data):
+            raise serializers.ValidationError("Provide either ids or filter.")
+        return data
+
+
+class SignerBulkChangesSerializer(serializers.Serializer):
+    status = serializers.CharField(max_length=50)
+
+
+class SignerBulkUpdateSerializer(SignerBulkSelectionSerializer):
+    changes = SignerBulkChangesSerializer()
+
+
+class SignerBulkItemResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=["updated", "deleted", "not_found"])
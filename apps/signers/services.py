@@ -1,13 +1,17 @@
 import logging
+from datetime import datetime
 from typing import Optional, List
+from django.conf import settings
 from django.db import transaction
 from django.db.models import QuerySet
 
 from apps.companies.models import Company
-from apps.documents.service import DocumentService
+from apps.documents.service import DocumentService, BULK_ITEM_UPDATED, BULK_ITEM_DELETED, BULK_ITEM_NOT_FOUND
 from apps.signers.models import Signer
 from apps.signers.repository import SignerRepository
-from utils.exceptions import SignerNotFoundException, UnauthorizedSignerAccessException
+from utils.collections import build_bulk_results
+from utils.exceptions import SignerNotFoundException, UnauthorizedSignerAccessException, \
+    BulkSelectionTooLargeException, DocumentNotFoundException, UnauthorizedDocumentAccessException
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +32,15 @@ class SignerService:
         try:
             logger.info(f"Fetching signer with ID {signer_id}.")
 
-            signer = self.signer_repository.get_signer_by_id(signer_id)
+            signer = self.signer_repository.get_signer_with_company_by_id(signer_id)
 
             if not signer:
                 logger.error(f"Signer with ID {signer_id} not found.")
                 raise SignerNotFoundException()
 
-            self.document_service.validate_document_ownership(document_id=signer.document_id, company=company)
+            if signer.document_company_id != company.id:
+                logger.error(f"Unauthorized access to signer ID {signer_id} by company ID {company.id}.")
+                raise UnauthorizedSignerAccessException()
 
             return signer
         except SignerNotFoundException:
@@ -45,14 +51,26 @@ class SignerService:
             logger.error(f"An unexpected error occurred while fetching signer ID {signer_id}: {str(e)}")
             raise
 
-    def list_signers(self, document_id: int, company: Company) -> QuerySet:
+    def get_signers_version(self, document_id: int, company: Company) -> datetime:
+        """
+        Return when the signers of a document last changed, validating ownership.
+        Another company's document is reported as not found, like list_signers does.
+        """
+        try:
+            return self.document_service.get_document_version(document_id, company)
+        except UnauthorizedDocumentAccessException:
+            raise DocumentNotFoundException()
+
+    def list_signers(self, document_id: int, company: Company, validate_ownership: bool = True) -> QuerySet:
         """
         List all signers for a specific document if it belongs to the company.
+        Callers that already validated ownership (e.g. with get_signers_version) can skip the check.
         """
         try:
             logger.info(f"Fetching signers for document ID {document_id}.")
 
-            self.document_service.validate_document_ownership(document_id=document_id, company=company)
+            if validate_ownership:
+                self.document_service.validate_document_ownership(document_id=document_id, company=company)
 
             return self.signer_repository.get_signers_by_document(document_id)
         except Exception as e:
@@ -74,6 +92,24 @@ class SignerService:
             logger.error(f"An unexpected error occurred while creating a signer: {str(e)}")
             raise
 
+    @transaction.atomic
+    def create_signers(self, document_id: int, signers_data: List[dict], company: Company) -> List[Signer]:
+        """
+        Create several signers for one document: ownership is checked once and
+        every signer is inserted with a single INSERT. All or nothing.
+        """
+        try:
+            logger.info(f"Creating {len(signers_data)} signers for document ID {document_id}.")
+            self.document_service.validate_document_ownership(document_id=document_id, company=company)
+            allowed_fields = {"name", "email"}
+            return self.signer_repository.bulk_create_signers([
+                {**{key: value for key, value in data.items() if key in allowed_fields}, "document_id": document_id}
+                for data in signers_data
+            ])
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while creating signers for document ID {document_id}: {str(e)}")
+            raise
+
     @transaction.atomic
     def update_signer(self, signer_id: int, company: Company, data: dict) -> Signer:
         """
@@ -93,3 +129,58 @@ class SignerService:
         logger.info(f"Deleting signer with ID {signer_id}.")
 
         self.signer_repository.delete_signer(signer)
+
+    @transaction.atomic
+    def bulk_update_signers(
+            self,
+            company: Company,
+            data: dict,
+            signer_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None
+    ) -> List[dict]:
+        """
+        Apply the same changes to the company's signers selected by IDs or by filters,
+        with a single UPDATE. Returns one result per signer.
+        """
+        signers = self._lock_signers_for_bulk(company, signer_ids, filters)
+        found_ids = [signer["id"] for signer in signers]
+        logger.info(f"Bulk updating {len(found_ids)} signers for company ID {company.id} with data: {data}")
+        if found_ids:
+            self.signer_repository.update_signers_by_ids(found_ids, [signer["document_id"] for signer in signers], data)
+        return build_bulk_results(signer_ids, found_ids, BULK_ITEM_UPDATED, BULK_ITEM_NOT_FOUND)
+
+    @transaction.atomic
+    def bulk_delete_signers(
+            self,
+            company: Company,
+            signer_ids: Optional[List[int]] = None,
+            filters: Optional[dict] = None
+    ) -> List[dict]:
+        """
+        Delete the company's signers selected by IDs or by filters, with a single DELETE.
+        Returns one result per signer.
+        """
+        signers = self._lock_signers_for_bulk(company, signer_ids, filters)
+        found_ids = [signer["id"] for signer in signers]
+        logger.info(f"Bulk deleting {len(found_ids)} signers for company ID {company.id}.")
+        if found_ids:
+            self.signer_repository.delete_signers_by_ids(found_ids, [signer["document_id"] for signer in signers])
+        return build_bulk_results(signer_ids, found_ids, BULK_ITEM_DELETED, BULK_ITEM_NOT_FOUND)
+
+    def _lock_signers_for_bulk(
+            self,
+            company: Company,
+            signer_ids: Optional[List[int]],
+            filters: Optional[dict]
+    ) -> List[dict]:
+        """
+        Lock the selected signers. A filter matching more than API_BULK_MAX_SIZE signers is rejected.
+        """
+        if signer_ids is not None:
+            return self.signer_repository.lock_signers_by_company(company.id, signer_ids=signer_ids)
+
+        max_size = settings.API_BULK_MAX_SIZE
+        signers = self.signer_repository.lock_signers_by_company(company.id, filters=filters, limit=max_size + 1)
+        if len(signers) > max_size:
+            raise BulkSelectionTooLargeException(max_size)
+        return signers
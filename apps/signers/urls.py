@@ -1,9 +1,10 @@
 from django.urls import path
-from apps.signers.views import SignerListView, SignerDetailView
+from apps.signers.views import SignerListView, SignerDetailView, SignerBulkView
 
 app_name = "signers"
 
 urlpatterns = [
     path('document/<int:document_id>/', SignerListView.as_view(), name='signer_list'),
+    path('bulk/', SignerBulkView.as_view(), name='signer_bulk'),
     path('<int:signer_id>/', SignerDetailView.as_view(), name='signer_detail'),
 ]
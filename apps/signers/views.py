@@ -7,8 +7,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.signers.serializers import SignerSerializer, SignerCreateSerializer, SignerUpdateSerializer
+from apps.documents.service import BULK_ITEM_NOT_FOUND
+from apps.signers.serializers import SignerSerializer, SignerCreateSerializer, SignerUpdateSerializer, \
+    SignerBulkUpdateSerializer, SignerBulkSelectionSerializer, SignerBulkItemResultSerializer
 from apps.signers.services import SignerService
+from utils.conditional import build_etag, get_not_modified_response, set_validators
+from utils.pagination import KeysetPagination, CURSOR_PARAMETER, PAGE_SIZE_PARAMETER
 
 
 class SignerListView(APIView):
@@ -29,40 +33,134 @@ class SignerListView(APIView):
     @swagger_auto_schema(
         tags=["signers"],
         operation_summary="List signers",
+        operation_description=(
+            "Lists the document's signers in creation order, one page at a time. "
+            "When there are more signers, the X-Next-Cursor and Link headers point to the next page."
+        ),
+        manual_parameters=[CURSOR_PARAMETER, PAGE_SIZE_PARAMETER],
         responses={
-            200: SignerSerializer(many=True)
+            200: SignerSerializer(many=True),
+            304: "The client's copy (If-None-Match / If-Modified-Since) is still current.",
         },
     )
     def get(self, request, document_id):
         """
         List signers for a document.
+        Answers 304 without loading the signers when the client's copy is current.
         """
-        signers = self.signer_service.list_signers(document_id, request.user)
+        last_modified = self.signer_service.get_signers_version(document_id, request.user)
+        etag = build_etag(request, document_id, last_modified)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        paginator = KeysetPagination(ordering=("id",))
+        signers = paginator.paginate_queryset(
+            self.signer_service.list_signers(document_id, request.user, validate_ownership=False), request
+        )
         serializer = SignerSerializer(signers, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return set_validators(paginator.get_paginated_response(serializer.data), etag, last_modified)
 
     @swagger_auto_schema(
         tags=["signers"],
-        operation_summary="Create a signer",
-        request_body=SignerCreateSerializer,
+        operation_summary="Create signers",
+        operation_description=(
+            "Creates every signer of the list for the document. Each item is validated first; "
+            "if any item is invalid, no signer is created."
+        ),
+        request_body=SignerCreateSerializer(many=True),
         responses={
-            201: SignerSerializer
+            201: SignerSerializer(many=True)
         },
     )
     @transaction.atomic
     def post(self, request, document_id, *args, **kwargs):
         """
-        Create a new signer for a document.
+        Create new signers for a document.
         """
         serializer = SignerCreateSerializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
-        signers = [
-            self.signer_service.create_signer({**signer_data, "document_id": document_id}, request.user)
-            for signer_data in serializer.validated_data
-        ]
+        signers = self.signer_service.create_signers(document_id, serializer.validated_data, request.user)
         return Response(SignerSerializer(signers, many=True).data, status=status.HTTP_201_CREATED)
 
 
+class SignerBulkView(APIView):
+    """
+    API view to update or delete several signers in one request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def __init__(
+            self,
+            signer_service: Optional[SignerService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.signer_service = signer_service or SignerService()
+
+    @staticmethod
+    def build_response(results: list) -> Response:
+        """
+        Responds 200 when every selected signer was processed, 207 when some IDs were not found.
+        """
+        any_missing = any(result["status"] == BULK_ITEM_NOT_FOUND for result in results)
+        response_status = status.HTTP_207_MULTI_STATUS if any_missing else status.HTTP_200_OK
+        return Response(SignerBulkItemResultSerializer(results, many=True).data, status=response_status)
+
+    @swagger_auto_schema(
+        tags=["signers"],
+        operation_summary="Update signers in bulk",
+        operation_description=(
+            "Sets the status of the company's signers selected by `ids` or by `filter` "
+            "(document_id, status), with a single UPDATE. Returns one result per signer; IDs that "
+            "do not exist or belong to another company are reported as not_found, and the response is then 207."
+        ),
+        request_body=SignerBulkUpdateSerializer,
+        responses={
+            200: SignerBulkItemResultSerializer(many=True),
+            207: SignerBulkItemResultSerializer(many=True),
+        },
+    )
+    def patch(self, request, *args, **kwargs):
+        """
+        Update several signers of a company.
+        """
+        serializer = SignerBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        results = self.signer_service.bulk_update_signers(
+            request.user, data["changes"], signer_ids=data.get("ids"), filters=data.get("filter")
+        )
+        return self.build_response(results)
+
+    @swagger_auto_schema(
+        tags=["signers"],
+        operation_summary="Delete signers in bulk",
+        operation_description=(
+            "Deletes the company's signers selected by `ids` or by `filter`, with a single DELETE. "
+            "Returns one result per signer; IDs that do not exist or belong to another company "
+            "are reported as not_found, and the response is then 207."
+        ),
+        request_body=SignerBulkSelectionSerializer,
+        responses={
+            200: SignerBulkItemResultSerializer(many=True),
+            207: SignerBulkItemResultSerializer(many=True),
+        },
+    )
+    def delete(self, request, *args, **kwargs):
+        """
+        Delete several signers of a company.
+        """
+        serializer = SignerBulkSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        results = self.signer_service.bulk_delete_signers(
+            request.user, signer_ids=data.get("ids"), filters=data.get("filter")
+        )
+        return self.build_response(results)
+
+
 class SignerDetailView(APIView):
     """
     API view to handle signer details, updates, and deletions.
@@ -80,16 +178,24 @@ class SignerDetailView(APIView):
         tags=["signers"],
         operation_summary="Retrieve a signer",
         responses={
-            200: SignerSerializer
+            200: SignerSerializer,
+            304: "The client's copy (If-None-Match / If-Modified-Since) is still current.",
         },
     )
     def get(self, request, signer_id):
         """
         Retrieve a signer by ID.
+        Answers 304 without serializing the signer when the client's copy is current.
         """
         signer = self.signer_service.get_signer(signer_id, request.user)
+        last_modified = signer.document_last_updated_at
+        etag = build_etag(request, signer.id, last_modified)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
         serializer = SignerSerializer(signer)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
 
     @swagger_auto_schema(
         tags=["signers"],
@@ -0,0 +1,134 @@
+import logging
+from typing import Optional
+
+import httpx
+from asgiref.sync import sync_to_async
+
+from apps.zapsign_integration.rate_limit import ZapSignRateLimiter
+from apps.zapsign_integration.resilience import CircuitBreaker
+from apps.zapsign_integration.service import BaseZapSignService
+from apps.zapsign_integration.session import get_async_client
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZapSignService(BaseZapSignService):
+    """
+    Asyncio counterpart of ZapSignService for code running on an event loop,
+    such as async views served through ASGI.
+    """
+
+    def __init__(
+            self,
+            api_base_url: Optional[str] = None,
+            api_token: Optional[str] = None,
+            client: Optional[httpx.AsyncClient] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            rate_limiter: Optional[ZapSignRateLimiter] = None
+    ):
+        """
+        Initializes the AsyncZapSignService with optional configurations.
+        When no client is given, the pooled client of the running event loop is used.
+        """
+        super().__init__(api_base_url, api_token)
+        self._client = client
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter or ZapSignRateLimiter()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client used for ZapSign API requests.
+        """
+        return self._client or get_async_client()
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Sends a request to the ZapSign API through the pooled client.
+        Calls go through the same circuit breaker and per-token rate limiter as
+        ZapSignService, whose cache calls run in worker threads. The thread-based
+        bulkhead does not apply here: concurrency is bounded by the client's
+        connection pool limits instead. Requests are not retried.
+        """
+        await sync_to_async(self.circuit_breaker.before_call, thread_sensitive=False)()
+        await self.rate_limiter.acquire_async(self.api_token)
+        try:
+            response = await self.client.request(method, self.build_url(path), headers=self.get_headers(), **kwargs)
+        except httpx.TransportError:
+            await sync_to_async(self.circuit_breaker.record_failure, thread_sensitive=False)()
+            raise
+
+        if response.status_code >= 500:
+            await sync_to_async(self.circuit_breaker.record_failure, thread_sensitive=False)()
+        else:
+            await sync_to_async(self.circuit_breaker.record_success, thread_sensitive=False)()
+        return response
+
+    async def create_document_in_zapsign(
+            self,
+            name: str,
+            signers: list,
+            url_pdf: str
+    ) -> dict:
+        """
+        Creates a document in the ZapSign API using a URL to the PDF.
+        """
+        try:
+            if not url_pdf:
+                logger.error("Failed to create document: url_pdf was not provided.")
+                raise ValueError("The URL to the PDF (url_pdf) must be provided.")
+
+            payload = {
+                "name": name,
+                "url_pdf": url_pdf,
+                "signers": signers
+            }
+
+            logger.info(f"Creating document with payload: {payload}")
+            response = await self._request("POST", "docs/", json=payload)
+
+            if response.status_code != 201:
+                logger.error(f"Failed to create document: {response.text}")
+                response.raise_for_status()
+
+            logger.info("Document created successfully.")
+            return response.json()
+        except Exception as e:
+            logger.error(f"An error occurred while creating a document: {str(e)}")
+            raise
+
+    async def get_document(self, document_token: str) -> dict:
+        """
+        Retrieves a document's details from the ZapSign API.
+        """
+        try:
+            logger.info(f"Fetching document with token: {document_token}")
+            response = await self._request("GET", f"docs/{document_token}/")
+
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch document: {response.text}")
+                response.raise_for_status()
+
+            logger.info("Document retrieved successfully.")
+            return response.json()
+        except Exception as e:
+            logger.error(f"An error occurred while fetching the document with token {document_token}: {str(e)}")
+            raise
+
+    async def delete_document(self, document_token: str) -> dict:
+        """
+        Deletes a document from the ZapSign API.
+        """
+        try:
+            logger.info(f"Deleting document with token: {document_token}")
+            response = await self._request("DELETE", f"docs/{document_token}/")
+
+            if response.status_code not in [200, 204]:
+                logger.error(f"Failed to delete document: {response.text}")
+                response.raise_for_status()
+
+            logger.info("Document deleted successfully.")
+            return {"message": "Document deleted successfully."}
+        except Exception as e:
+            logger.error(f"An error occurred while deleting the document with token {document_token}: {str(e)}")
+            raise
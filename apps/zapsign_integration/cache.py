@@ -0,0 +1,116 @@
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+HITS_KEY = "zapsign:document:stats:hits"
+MISSES_KEY = "zapsign:document:stats:misses"
+
+
+class ZapSignDocumentCache:
+    """
+    Read-through cache for ZapSign document payloads, stored in the Django cache
+    so every web and Celery process shares entries and hit/miss counters.
+    """
+
+    def __init__(
+            self,
+            cache_alias: str = "default",
+            timeout: Optional[int] = None,
+            final_status_timeout: Optional[int] = None
+    ):
+        self.cache_alias = cache_alias
+        self.timeout = timeout if timeout is not None else settings.ZAPSIGN_DOCUMENT_CACHE_TTL
+        self.final_status_timeout = (
+            final_status_timeout if final_status_timeout is not None
+            else settings.ZAPSIGN_DOCUMENT_CACHE_FINAL_TTL
+        )
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @staticmethod
+    def make_key(document_token: str) -> str:
+        """
+        Returns the cache key of a ZapSign document.
+        """
+        return f"zapsign:document:{document_token}"
+
+    def get_timeout_for(self, payload: dict) -> int:
+        """
+        Returns the TTL for a payload. Documents in a final status no longer change,
+        so they are kept longer than documents still waiting for signatures.
+        """
+        if payload.get("status") in settings.ZAPSIGN_DOCUMENT_FINAL_STATUSES:
+            return self.final_status_timeout
+        return self.timeout
+
+    def get_or_fetch(
+            self,
+            document_token: str,
+            fetch: Callable[[str], dict],
+            timeout: Optional[int] = None
+    ) -> dict:
+        """
+        Returns the cached payload of a document, fetching and caching it on a miss.
+        """
+        key = self.make_key(document_token)
+        payload = self.cache.get(key)
+        if payload is not None:
+            self._increment(HITS_KEY)
+            return payload
+
+        self._increment(MISSES_KEY)
+        payload = fetch(document_token)
+        self.set(document_token, payload, timeout)
+        return payload
+
+    def set(self, document_token: str, payload: dict, timeout: Optional[int] = None) -> None:
+        """
+        Stores a document payload, with an explicit TTL or one derived from the payload.
+        """
+        self.cache.set(
+            self.make_key(document_token),
+            payload,
+            timeout if timeout is not None else self.get_timeout_for(payload),
+        )
+
+    def invalidate(self, document_token: str) -> None:
+        """
+        Drops the cached payload of a document.
+        """
+        logger.info(f"Invalidating cached ZapSign document with token: {document_token}")
+        self.cache.delete(self.make_key(document_token))
+
+    def invalidate_many(self, document_tokens: Iterable[str]) -> None:
+        """
+        Drops the cached payloads of several documents at once.
+        """
+        keys = [self.make_key(token) for token in document_tokens if token]
+        if keys:
+            self.cache.delete_many(keys)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns the shared hit/miss counters and the resulting hit ratio.
+        """
+        counters = self.cache.get_many([HITS_KEY, MISSES_KEY])
+        hits = counters.get(HITS_KEY, 0)
+        misses = counters.get(MISSES_KEY, 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def _increment(self, key: str) -> None:
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            if not self.cache.add(key, 1, timeout=None):
+                self.cache.incr(key)
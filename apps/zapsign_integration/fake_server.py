@@ -0,0 +1,220 @@
+"""
+In-process stand-in for the parts of the ZapSign API used by ZapSignService.
+
+It serves `POST /docs/`, `GET /docs/{token}/` and `DELETE /docs/{token}/` under
+any path prefix (e.g. `/api/v1`), keeps documents in memory and can inject
+latency and errors, so the create path can be load-tested without network access.
+"""
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+DOCS_PATH = re.compile(r"^(?P<prefix>.*)/docs/?$")
+DOC_PATH = re.compile(r"^(?P<prefix>.*)/docs/(?P<token>[^/]+)/?$")
+
+
+@dataclass
+class LatencyModel:
+    """
+    Response latency, in milliseconds, drawn from a configurable distribution.
+    `mean_ms` is the typical latency and `jitter_ms` its spread (the standard
+    deviation for normal/lognormal, the half-width for uniform).
+    """
+    distribution: str = "constant"
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{self.distribution}'.")
+
+    def sample(self) -> float:
+        """
+        Returns one latency sample in seconds.
+        """
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            value = random.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.distribution == "normal":
+            value = random.gauss(self.mean_ms, self.jitter_ms)
+        elif self.distribution == "lognormal":
+            sigma = (self.jitter_ms / self.mean_ms) if self.jitter_ms else 0.0
+            value = self.mean_ms * random.lognormvariate(0, sigma)
+        elif self.distribution == "exponential":
+            value = random.expovariate(1 / self.mean_ms)
+        else:
+            value = self.mean_ms
+        return max(value, 0.0) / 1000
+
+
+class FakeZapSignHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakeZapSignHTTPServer"
+
+    def setup(self):
+        if self.server.handshake_ms:
+            time.sleep(self.server.handshake_ms / 1000)
+        super().setup()
+
+    def do_POST(self):
+        body = self._read_json()
+        if not DOCS_PATH.match(self.path):
+            return self._send_json(404, {"detail": "Not found."})
+        if self._reject_request():
+            return
+        if body is None or not body.get("url_pdf") or not body.get("signers"):
+            return self._send_json(400, {"detail": "name, url_pdf and signers are required."})
+        return self._send_json(201, self.server.create_document(body))
+
+    def do_GET(self):
+        match = DOC_PATH.match(self.path)
+        if not match:
+            return self._send_json(404, {"detail": "Not found."})
+        if self._reject_request():
+            return
+        document = self.server.documents.get(match.group("token"))
+        if document is None:
+            return self._send_json(404, {"detail": "Not found."})
+        return self._send_json(200, document)
+
+    def do_DELETE(self):
+        match = DOC_PATH.match(self.path)
+        if not match:
+            return self._send_json(404, {"detail": "Not found."})
+        if self._reject_request():
+            return
+        if self.server.documents.pop(match.group("token"), None) is None:
+            return self._send_json(404, {"detail": "Not found."})
+        return self._send_json(200, {"message": "Document deleted."})
+
+    def _reject_request(self) -> bool:
+        """
+        Checks the credentials, sleeps for the sampled latency and, with the configured
+        probability, answers with an injected error. Returns True when a response was sent.
+        """
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send_json(401, {"detail": "Authentication credentials were not provided."})
+            return True
+        time.sleep(self.server.latency.sample())
+        if random.random() < self.server.error_rate:
+            self._send_json(self.server.error_status, {"detail": "Injected failure."})
+            return True
+        return False
+
+    def _read_json(self) -> Optional[dict]:
+        length = int(self.headers.get("Content-Length", 0))
+        if not length:
+            return None
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+
+    def _send_json(self, status_code: int, data: dict) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Fake ZapSign: {format % args}")
+
+
+class FakeZapSignHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            address,
+            latency: Optional[LatencyModel] = None,
+            error_rate: float = 0.0,
+            error_status: int = 503,
+            handshake_ms: float = 0.0
+    ):
+        super().__init__(address, FakeZapSignHandler)
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.handshake_ms = handshake_ms
+        self.documents: Dict[str, dict] = {}
+        self._open_id = 0
+        self._lock = threading.Lock()
+
+    def create_document(self, payload: dict) -> dict:
+        """
+        Stores a document and returns it shaped like a ZapSign create response.
+        """
+        with self._lock:
+            self._open_id += 1
+            open_id = self._open_id
+        document = {
+            "open_id": open_id,
+            "token": str(uuid.uuid4()),
+            "status": "pending",
+            "name": payload.get("name"),
+            "original_file": payload.get("url_pdf"),
+            "external_id": payload.get("external_id"),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_by": {"email": "fake-zapsign@example.com"},
+            "signers": [
+                {
+                    "token": str(uuid.uuid4()),
+                    "status": "new",
+                    "name": signer.get("name"),
+                    "email": signer.get("email"),
+                    "external_id": signer.get("external_id"),
+                    "sign_url": f"https://sandbox.app.zapsign.com.br/verificar/{uuid.uuid4()}",
+                }
+                for signer in payload.get("signers", [])
+            ],
+        }
+        self.documents[document["token"]] = document
+        return document
+
+
+class FakeZapSignServer:
+    """
+    Runs a FakeZapSignHTTPServer on a background thread.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, api_prefix: str = "/api/v1", **options):
+        self.api_prefix = api_prefix
+        self.httpd = FakeZapSignHTTPServer((host, port), **options)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.api_prefix}"
+
+    def start(self) -> "FakeZapSignServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeZapSignServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from apps.zapsign_integration.fake_server import FakeZapSignHTTPServer, LatencyModel, LATENCY_DISTRIBUTIONS
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs a local stand-in for the ZapSign API with configurable latency and error rate. "
+        "Point ZAPSIGN_BASE_URL at http://<host>:<port>/api/v1 to use it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="constant",
+                            help="Latency distribution of every response.")
+        parser.add_argument("--latency-ms", type=float, default=0.0, help="Typical response latency.")
+        parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Spread of the response latency.")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error.")
+        parser.add_argument("--error-status", type=int, default=503, help="Status code of injected errors.")
+        parser.add_argument("--handshake-ms", type=float, default=0.0,
+                            help="Delay added to every new connection, to mimic TCP+TLS setup.")
+
+    def handle(self, *args, **options):
+        httpd = FakeZapSignHTTPServer(
+            (options["host"], options["port"]),
+            latency=LatencyModel(options["latency"], options["latency_ms"], options["latency_jitter_ms"]),
+            error_rate=options["error_rate"],
+            error_status=options["error_status"],
+            handshake_ms=options["handshake_ms"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Fake ZapSign API listening on http://{options['host']}:{options['port']}/api/v1"
+        ))
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
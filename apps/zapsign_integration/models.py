@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class ZapSignWebhookEvent(models.Model):
+    event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100, null=True)
+    document_token = models.CharField(max_length=255, null=True)
+    payload = models.JSONField()
+    received_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "ZapSign Webhook Event"
+        verbose_name_plural = "ZapSign Webhook Events"
+
+    def __str__(self):
+        return f"{self.event_type} ({self.event_id})"
@@ -0,0 +1,136 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from utils.exceptions import ZapSignRateLimitedException
+
+logger = logging.getLogger(__name__)
+
+# Refills the bucket from the elapsed time and takes one token when available.
+# Returns "0" when a token was taken, otherwise the seconds until one is.
+# Redis's own clock is used, so every process agrees on the refill.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class ZapSignRateLimiter:
+    """
+    Client-side token bucket for outbound ZapSign calls, kept in Redis so every
+    web and Celery process draws from the same bucket for a given API token.
+
+    Each credential refills at `rate` calls per second up to `burst` calls.
+    Callers wait for a token for at most `max_wait` seconds before giving up.
+    """
+
+    def __init__(
+            self,
+            rate: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_wait: Optional[float] = None,
+            cache_alias: str = "default"
+    ):
+        self.rate = rate if rate is not None else settings.ZAPSIGN_RATE_LIMIT_PER_SECOND
+        self.burst = burst if burst is not None else settings.ZAPSIGN_RATE_LIMIT_BURST
+        self.max_wait = max_wait if max_wait is not None else settings.ZAPSIGN_RATE_LIMIT_MAX_WAIT
+        self.cache_alias = cache_alias
+        self._script = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @staticmethod
+    def make_key(api_token: str) -> str:
+        """
+        Returns the Redis key of a credential's bucket. The token itself is never stored.
+        """
+        return f"zapsign:ratelimit:{hashlib.sha256(api_token.encode()).hexdigest()}"
+
+    def get_script(self):
+        """
+        Returns the registered token bucket script, or None when the cache is not Redis.
+        """
+        if self._script is None:
+            try:
+                connection = get_redis_connection(self.cache_alias)
+            except NotImplementedError:
+                return None
+            self._script = connection.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    def try_acquire(self, api_token: str) -> float:
+        """
+        Takes a token for a credential. Returns 0 on success, otherwise the seconds to wait.
+        Fails open when Redis is unavailable, since ZapSign enforces its own limits anyway.
+        """
+        script = self.get_script()
+        if script is None:
+            return 0.0
+        try:
+            return float(script(keys=[self.make_key(api_token)], args=[self.rate, self.burst]))
+        except RedisError as e:
+            logger.warning(f"ZapSign rate limiter unavailable, letting the call through: {str(e)}")
+            return 0.0
+
+    def acquire(self, api_token: str) -> None:
+        """
+        Blocks until a token is available for the credential, raising when that
+        would take longer than `max_wait`.
+        """
+        if not self.enabled:
+            return
+
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self.try_acquire(api_token)
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                logger.warning(f"ZapSign rate limit reached; no token available within {self.max_wait}s.")
+                raise ZapSignRateLimitedException()
+            time.sleep(wait)
+
+    async def acquire_async(self, api_token: str) -> None:
+        """
+        Same as `acquire`, for code running on an event loop: the Redis call runs in
+        a worker thread and the wait does not block the loop.
+        """
+        if not self.enabled:
+            return
+
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = await sync_to_async(self.try_acquire, thread_sensitive=False)(api_token)
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                logger.warning(f"ZapSign rate limit reached; no token available within {self.max_wait}s.")
+                raise ZapSignRateLimitedException()
+            await asyncio.sleep(wait)
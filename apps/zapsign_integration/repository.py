@@ -0,0 +1,21 @@
+from typing import Iterable, List, Set
+
+from apps.zapsign_integration.models import ZapSignWebhookEvent
+
+
+class ZapSignWebhookEventRepository:
+    @staticmethod
+    def get_existing_event_ids(event_ids: Iterable[str]) -> Set[str]:
+        """
+        Fetch which of the given event IDs have already been received.
+        """
+        return set(
+            ZapSignWebhookEvent.objects.filter(event_id__in=list(event_ids)).values_list("event_id", flat=True)
+        )
+
+    @staticmethod
+    def bulk_create_events(events: List[ZapSignWebhookEvent]) -> None:
+        """
+        Store webhook events, ignoring events that a concurrent delivery stored first.
+        """
+        ZapSignWebhookEvent.objects.bulk_create(events, ignore_conflicts=True)
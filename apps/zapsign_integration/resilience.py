@@ -0,0 +1,220 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis.exceptions import ConnectionInterrupted
+from redis.exceptions import RedisError
+
+from utils.exceptions import ZapSignBulkheadFullException, ZapSignCircuitOpenException
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Raised by the cache when Redis is unavailable.
+CACHE_ERRORS = (ConnectionInterrupted, RedisError)
+
+
+class RetryPolicy:
+    """
+    Bounded retries with full-jitter exponential backoff. `max_attempts` counts
+    the first call too, so it is never less than 1.
+    """
+
+    def __init__(
+            self,
+            max_attempts: Optional[int] = None,
+            base_delay: Optional[float] = None,
+            max_delay: Optional[float] = None
+    ):
+        max_attempts = max_attempts if max_attempts is not None else settings.ZAPSIGN_RETRY_MAX_ATTEMPTS
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay if base_delay is not None else settings.ZAPSIGN_RETRY_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else settings.ZAPSIGN_RETRY_MAX_DELAY
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns how long to wait before the given retry (0-based), honouring a
+        server-provided Retry-After within the configured cap.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker whose state lives in the Django cache, so every web and
+    Celery process sharing the Redis cache fails fast together.
+
+    The circuit opens once `failure_threshold` failures happen within
+    `failure_window` seconds. After `reset_timeout` seconds a single probe call
+    is let through (half-open); its outcome closes or re-opens the circuit.
+    When the cache is unavailable the breaker fails open, like the rate limiter.
+    """
+
+    def __init__(
+            self,
+            name: str = "zapsign",
+            cache_alias: str = "default",
+            failure_threshold: Optional[int] = None,
+            failure_window: Optional[int] = None,
+            reset_timeout: Optional[int] = None
+    ):
+        self.name = name
+        self.cache_alias = cache_alias
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None else settings.ZAPSIGN_BREAKER_FAILURE_THRESHOLD
+        )
+        self.failure_window = failure_window if failure_window is not None else settings.ZAPSIGN_BREAKER_FAILURE_WINDOW
+        self.reset_timeout = reset_timeout if reset_timeout is not None else settings.ZAPSIGN_BREAKER_RESET_TIMEOUT
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def failures_key(self) -> str:
+        return f"zapsign:breaker:{self.name}:failures"
+
+    @property
+    def opened_until_key(self) -> str:
+        return f"zapsign:breaker:{self.name}:opened_until"
+
+    @property
+    def probe_key(self) -> str:
+        return f"zapsign:breaker:{self.name}:probe"
+
+    def get_state(self) -> str:
+        """
+        Returns the current state of the circuit.
+        """
+        opened_until = self.cache.get(self.opened_until_key)
+        if opened_until is None:
+            return CIRCUIT_CLOSED
+        if time.time() < opened_until:
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    def get_metrics(self) -> Dict[str, object]:
+        """
+        Returns the circuit state and failure count, for monitoring.
+        """
+        values = self.cache.get_many([self.failures_key, self.opened_until_key])
+        return {
+            "name": self.name,
+            "state": self.get_state(),
+            "failures": values.get(self.failures_key, 0),
+            "opened_until": values.get(self.opened_until_key),
+        }
+
+    def before_call(self) -> None:
+        """
+        Raises when the circuit is open. While half-open, only one caller gets to probe.
+        Lets the call through when the cache is unavailable.
+        """
+        try:
+            state = self.get_state()
+            probing = state == CIRCUIT_HALF_OPEN and self.cache.add(
+                self.probe_key, 1, timeout=max(self.reset_timeout, 1)
+            )
+        except CACHE_ERRORS as e:
+            logger.warning(f"Circuit breaker '{self.name}' unavailable, letting the call through: {str(e)}")
+            return
+        if state == CIRCUIT_OPEN:
+            raise ZapSignCircuitOpenException()
+        if state == CIRCUIT_HALF_OPEN and not probing:
+            raise ZapSignCircuitOpenException()
+
+    def record_success(self) -> None:
+        """
+        Closes the circuit if it was open and clears the failure count. A success on a
+        closed circuit without failures, the common case, costs a single read.
+        """
+        try:
+            values = self.cache.get_many([self.failures_key, self.opened_until_key])
+            if not values:
+                return
+            if self.opened_until_key in values:
+                logger.info(f"Circuit breaker '{self.name}' closed.")
+            self.cache.delete_many([self.failures_key, self.opened_until_key, self.probe_key])
+        except CACHE_ERRORS as e:
+            logger.warning(f"Circuit breaker '{self.name}' unavailable, success not recorded: {str(e)}")
+
+    def record_failure(self) -> None:
+        """
+        Counts a failure and opens the circuit when the threshold is reached or a probe fails.
+        """
+        try:
+            state = self.get_state()
+            if self.cache.add(self.failures_key, 1, timeout=self.failure_window):
+                failures = 1
+            else:
+                try:
+                    failures = self.cache.incr(self.failures_key)
+                except ValueError:
+                    failures = 1
+                    self.cache.set(self.failures_key, failures, timeout=self.failure_window)
+
+            if state == CIRCUIT_HALF_OPEN or failures >= self.failure_threshold:
+                logger.warning(f"Circuit breaker '{self.name}' opened after {failures} failures.")
+                self.cache.set(self.opened_until_key, time.time() + self.reset_timeout, timeout=None)
+                self.cache.delete(self.probe_key)
+        except CACHE_ERRORS as e:
+            logger.warning(f"Circuit breaker '{self.name}' unavailable, failure not recorded: {str(e)}")
+
+
+class Bulkhead:
+    """
+    Limits how many outbound calls a process runs at once. Callers that cannot
+    get a slot within `timeout` seconds are rejected instead of queueing forever.
+    """
+
+    def __init__(self, max_concurrent_calls: int, timeout: float):
+        self.max_concurrent_calls = max_concurrent_calls
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_calls)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def __enter__(self):
+        if not self._semaphore.acquire(timeout=self.timeout):
+            logger.warning(f"Bulkhead full: {self.max_concurrent_calls} ZapSign calls already in flight.")
+            raise ZapSignBulkheadFullException()
+        with self._lock:
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._lock:
+            self._in_flight -= 1
+        self._semaphore.release()
+        return False
+
+
+_bulkhead: Optional[Bulkhead] = None
+_bulkhead_lock = threading.Lock()
+
+
+def get_bulkhead() -> Bulkhead:
+    """
+    Returns the bulkhead shared by every ZapSignService in this process.
+    """
+    global _bulkhead
+
+    if _bulkhead is None:
+        with _bulkhead_lock:
+            if _bulkhead is None:
+                _bulkhead = Bulkhead(settings.ZAPSIGN_MAX_CONCURRENT_CALLS, settings.ZAPSIGN_BULKHEAD_TIMEOUT)
+    return _bulkhead
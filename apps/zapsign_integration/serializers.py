@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+
+class ZapSignWebhookSignerSerializer(serializers.Serializer):
+    token = serializers.CharField(max_length=255)
+    status = serializers.CharField(max_length=50, required=False, allow_null=True)
+
+
+class ZapSignWebhookEventSerializer(serializers.Serializer):
+    event_id = serializers.CharField(max_length=255, required=False)
+    event_type = serializers.CharField(max_length=100, required=False, allow_null=True)
+    token = serializers.CharField(max_length=255, required=False, allow_null=True)
+    status = serializers.CharField(max_length=50, required=False, allow_null=True)
+    signers = ZapSignWebhookSignerSerializer(many=True, required=False)
+
+    def validate(self, data):
+        if not data.get("token") and not data.get("signers"):
+            raise serializers.ValidationError("The event must reference a document token or signers.")
+        return data
+
+
+class ZapSignWebhookResponseSerializer(serializers.Serializer):
+    received = serializers.IntegerField()
+    duplicates = serializers.IntegerField()
+    documents_updated = serializers.IntegerField()
+    signers_updated = serializers.IntegerField()
@@ -1,15 +1,24 @@
+import copy
 import logging
-from typing import Optional, Dict
+import time
+from typing import Optional, Dict, Iterable
 import requests
 from django.conf import settings
 
+from apps.zapsign_integration.cache import ZapSignDocumentCache
+from apps.zapsign_integration.rate_limit import ZapSignRateLimiter
+from apps.zapsign_integration.resilience import Bulkhead, CircuitBreaker, RetryPolicy, get_bulkhead
+from apps.zapsign_integration.session import get_session, get_timeout
+
 logger = logging.getLogger(__name__)
 
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
-class ZapSignService:
+class BaseZapSignService:
     """
-    Service class responsible for handling business rules related to
-    ZapSign API integration.
+    Configuration and request helpers shared by the sync and async ZapSign services.
     """
 
     def __init__(
@@ -18,7 +27,7 @@ class ZapSignService:
             api_token: Optional[str] = None
     ):
         """
-        Initializes the ZapSignService with optional configurations.
+        Initializes the service with optional configurations.
         """
         self.api_base_url = api_base_url or settings.ZAPSIGN_BASE_URL
         self.api_token = api_token or settings.ZAPSIGN_API_TOKEN
@@ -32,6 +41,119 @@ class ZapSignService:
             'Content-Type': 'application/json'
         }
 
+    def build_url(self, path: str) -> str:
+        """
+        Returns the absolute ZapSign API URL for the given path.
+        """
+        return f"{self.api_base_url.rstrip('/')}/{path.lstrip('/')}"
+
+
+class ZapSignService(BaseZapSignService):
+    """
+    Service class responsible for handling business rules related to
+    ZapSign API integration.
+    """
+
+    def __init__(
+            self,
+            api_base_url: Optional[str] = None,
+            api_token: Optional[str] = None,
+            session: Optional[requests.Session] = None,
+            document_cache: Optional[ZapSignDocumentCache] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            bulkhead: Optional[Bulkhead] = None,
+            rate_limiter: Optional[ZapSignRateLimiter] = None
+    ):
+        """
+        Initializes the ZapSignService with optional configurations.
+        When no session or bulkhead is given, the ones shared by the current process are used.
+        """
+        super().__init__(api_base_url, api_token)
+        self._session = session
+        self.document_cache = document_cache or ZapSignDocumentCache()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.bulkhead = bulkhead or get_bulkhead()
+        self.rate_limiter = rate_limiter or ZapSignRateLimiter()
+
+    def with_api_token(self, api_token: Optional[str]) -> "ZapSignService":
+        """
+        Returns a copy of the service that authenticates with another API token,
+        sharing the session, cache and resilience components of this one.
+        """
+        if not api_token or api_token == self.api_token:
+            return self
+        service = copy.copy(self)
+        service.api_token = api_token
+        return service
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the HTTP session used for ZapSign API requests.
+        """
+        return self._session or get_session()
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Sends a request to the ZapSign API through the pooled session.
+        Calls go through the circuit breaker, the per-token rate limiter and the bulkhead.
+        Idempotent methods are retried with jittered backoff on connection errors, 429 and 5xx responses.
+        """
+        max_attempts = self.retry_policy.max_attempts if method.upper() in IDEMPOTENT_METHODS else 1
+
+        for attempt in range(max_attempts):
+            is_last_attempt = attempt + 1 >= max_attempts
+            self.circuit_breaker.before_call()
+            self.rate_limiter.acquire(self.api_token)
+            try:
+                with self.bulkhead:
+                    response = self.session.request(
+                        method, self.build_url(path), headers=self.get_headers(), timeout=get_timeout(), **kwargs
+                    )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.circuit_breaker.record_failure()
+                if is_last_attempt:
+                    raise
+                logger.warning(f"ZapSign {method} {path} failed on attempt {attempt + 1}: {str(e)}")
+                time.sleep(self.retry_policy.get_delay(attempt))
+                continue
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                self.circuit_breaker.record_success()
+                return response
+
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            if is_last_attempt:
+                return response
+            logger.warning(f"ZapSign {method} {path} returned {response.status_code} on attempt {attempt + 1}.")
+            time.sleep(self.retry_policy.get_delay(attempt, self._get_retry_after(response)))
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the resilience and cache metrics of the ZapSign integration.
+        """
+        return {
+            "circuit_breaker": self.circuit_breaker.get_metrics(),
+            "bulkhead": {
+                "max_concurrent_calls": self.bulkhead.max_concurrent_calls,
+                "in_flight": self.bulkhead.in_flight,
+            },
+            "document_cache": self.document_cache.get_stats(),
+        }
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Returns the Retry-After header in seconds, when ZapSign sends one.
+        """
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
     def create_document_in_zapsign(
             self,
             name: str,
@@ -53,7 +175,7 @@ class ZapSignService:
             }
 
             logger.info(f"Creating document with payload: {payload}")
-            response = requests.post(f"{self.api_base_url}/docs/", headers=self.get_headers(), json=payload)
+            response = self._request("POST", "docs/", json=payload)
 
             if response.status_code != 201:
                 logger.error(f"Failed to create document: {response.text}")
@@ -65,14 +187,33 @@ class ZapSignService:
             logger.error(f"An error occurred while creating a document: {str(e)}")
             raise
 
-    def get_document(self, document_token: str) -> dict:
+    def get_document(self, document_token: str, use_cache: bool = True) -> dict:
+        """
+        Retrieves a document's details, served from the shared cache when possible.
+        """
+        if not use_cache:
+            return self.fetch_document(document_token)
+        return self.document_cache.get_or_fetch(document_token, self.fetch_document)
+
+    def invalidate_document(self, document_token: str) -> None:
+        """
+        Drops a document's cached details so the next read goes to the ZapSign API.
+        """
+        self.document_cache.invalidate(document_token)
+
+    def invalidate_documents(self, document_tokens: Iterable[str]) -> None:
+        """
+        Drops the cached details of several documents at once.
+        """
+        self.document_cache.invalidate_many(document_tokens)
+
+    def fetch_document(self, document_token: str) -> dict:
         """
         Retrieves a document's details from the ZapSign API.
         """
         try:
-            url = f"{self.api_base_url}{document_token}/"
             logger.info(f"Fetching document with token: {document_token}")
-            response = requests.get(url, headers=self.get_headers())
+            response = self._request("GET", f"docs/{document_token}/")
 
             if response.status_code != 200:
                 logger.error(f"Failed to fetch document: {response.text}")
@@ -89,14 +230,15 @@ class ZapSignService:
         Deletes a document from the ZapSign API.
         """
         try:
-            url = f"{self.api_base_url}{document_token}/"
             logger.info(f"Deleting document with token: {document_token}")
-            response = requests.delete(url, headers=self.get_headers())
+            response = self._request("DELETE", f"docs/{document_token}/")
 
             if response.status_code not in [200, 204]:
                 logger.error(f"Failed to delete document: {response.text}")
                 response.raise_for_status()
 
+            self.invalidate_document(document_token)
+
             logger.info("Document deleted successfully.")
             return {"message": "Document deleted successfully."}
         except Exception as e:
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Optional, Tuple
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_timeout() -> Tuple[float, float]:
+    """
+    Returns the (connect, read) timeout tuple used for ZapSign API requests.
+    """
+    return settings.ZAPSIGN_CONNECT_TIMEOUT, settings.ZAPSIGN_READ_TIMEOUT
+
+
+def build_session() -> requests.Session:
+    """
+    Builds a requests session with a connection pool sized from settings.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.ZAPSIGN_POOL_CONNECTIONS,
+        pool_maxsize=settings.ZAPSIGN_POOL_MAXSIZE,
+        pool_block=settings.ZAPSIGN_POOL_BLOCK,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive" if settings.ZAPSIGN_KEEP_ALIVE else "close"
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the pooled session shared by every ZapSignService in this process.
+
+    The session is created lazily and rebuilt after a fork, so pooled sockets
+    are never shared between a parent process and its workers.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            logger.info(f"Creating pooled ZapSign HTTP session for process {pid}.")
+            _session = build_session()
+            _session_pid = pid
+    return _session
+
+
+def close_session() -> None:
+    """
+    Closes the pooled session of this process, dropping its kept-alive connections.
+    """
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """
+    Builds an asyncio HTTP client with the same pool limits and timeouts as the sync session.
+    """
+    keepalive_connections = settings.ZAPSIGN_POOL_MAXSIZE if settings.ZAPSIGN_KEEP_ALIVE else 0
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.ZAPSIGN_POOL_MAXSIZE,
+            max_keepalive_connections=keepalive_connections,
+        ),
+        timeout=httpx.Timeout(
+            settings.ZAPSIGN_READ_TIMEOUT,
+            connect=settings.ZAPSIGN_CONNECT_TIMEOUT,
+        ),
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Returns the pooled asyncio client bound to the running event loop.
+
+    httpx clients cannot be shared between event loops, so one client is kept
+    per loop and dropped together with it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        logger.info(f"Creating pooled ZapSign async HTTP client for process {os.getpid()}.")
+        client = build_async_client()
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """
+    Closes the pooled asyncio client bound to the running event loop.
+    """
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,9 @@
+from django.urls import path
+from apps.zapsign_integration.views import ZapSignWebhookView, ZapSignMetricsView
+
+app_name = 'zapsign_integration'
+
+urlpatterns = [
+    path('webhooks/', ZapSignWebhookView.as_view(), name='webhooks'),
+    path('metrics/', ZapSignMetricsView.as_view(), name='metrics'),
+]
@@ -0,0 +1,78 @@
+from typing import Optional
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.zapsign_integration.serializers import ZapSignWebhookEventSerializer, ZapSignWebhookResponseSerializer
+from apps.zapsign_integration.service import ZapSignService
+from apps.zapsign_integration.webhook_service import ZapSignWebhookService
+from utils.permissions import HasZapSignWebhookSecret, IsSuperUser
+
+
+class ZapSignWebhookView(APIView):
+    """
+    Webhook receiver for ZapSign document and signer events.
+    """
+
+    authentication_classes = []
+    permission_classes = [HasZapSignWebhookSecret]
+
+    def __init__(
+            self,
+            webhook_service: Optional[ZapSignWebhookService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.webhook_service = webhook_service or ZapSignWebhookService()
+
+    @swagger_auto_schema(
+        tags=["zapsign"],
+        operation_summary="Receive ZapSign webhook events",
+        operation_description="Accepts a single event or a list of events. Events are deduplicated by event_id.",
+        request_body=ZapSignWebhookEventSerializer,
+        responses={
+            200: ZapSignWebhookResponseSerializer
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        """
+        Ingest ZapSign webhook events.
+        """
+        many = isinstance(request.data, list)
+        serializer = ZapSignWebhookEventSerializer(data=request.data, many=many)
+        serializer.is_valid(raise_exception=True)
+        events = serializer.validated_data if many else [serializer.validated_data]
+        result = self.webhook_service.ingest_events(events)
+        return Response(ZapSignWebhookResponseSerializer(result).data, status=status.HTTP_200_OK)
+
+
+class ZapSignMetricsView(APIView):
+    """
+    API view exposing the health of the ZapSign integration (SUPERUSER ONLY).
+    """
+
+    permission_classes = [IsSuperUser]
+
+    def __init__(
+            self,
+            zap_sign_service: Optional[ZapSignService] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.zap_sign_service = zap_sign_service or ZapSignService()
+
+    @swagger_auto_schema(
+        tags=["zapsign"],
+        operation_summary="ZapSign integration metrics",
+        operation_description="Circuit breaker state, in-flight calls of this process and document cache counters.",
+        responses={
+            200: "ZapSign integration metrics."
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """
+        Get the ZapSign integration metrics.
+        """
+        return Response(self.zap_sign_service.get_metrics(), status=status.HTTP_200_OK)
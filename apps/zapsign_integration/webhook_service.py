@@ -0,0 +1,113 @@
+import hashlib
+import json
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.documents.repository import DocumentRepository
+from apps.signers.repository import SignerRepository
+from apps.zapsign_integration.cache import ZapSignDocumentCache
+from apps.zapsign_integration.models import ZapSignWebhookEvent
+from apps.zapsign_integration.repository import ZapSignWebhookEventRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ZapSignWebhookService:
+    """
+    Service class responsible for ingesting ZapSign webhook events and applying
+    the status changes they carry to local documents and signers.
+    """
+
+    def __init__(
+            self,
+            event_repository: Optional[ZapSignWebhookEventRepository] = None,
+            document_repository: Optional[DocumentRepository] = None,
+            signer_repository: Optional[SignerRepository] = None,
+            document_cache: Optional[ZapSignDocumentCache] = None,
+    ):
+        self.event_repository = event_repository or ZapSignWebhookEventRepository()
+        self.document_repository = document_repository or DocumentRepository()
+        self.signer_repository = signer_repository or SignerRepository()
+        self.document_cache = document_cache or ZapSignDocumentCache()
+
+    @staticmethod
+    def build_event_id(event: dict) -> str:
+        """
+        Derive a stable ID for events delivered without one, so redeliveries are still deduplicated.
+        """
+        return hashlib.sha256(json.dumps(event, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _merge_status(statuses: Dict[str, str], token: str, status: str, final_statuses: Iterable[str]) -> None:
+        """
+        Record the latest status of a token in a batch, unless it already reached a final one.
+        """
+        if statuses.get(token) not in final_statuses:
+            statuses[token] = status
+
+    @transaction.atomic
+    def ingest_events(self, events: List[dict]) -> Dict[str, int]:
+        """
+        Store new events and apply their status changes in bulk.
+        Events already received are skipped. When several new events touch the same
+        token, the last one in the batch wins. Applying a status is idempotent, so a
+        concurrent redelivery racing past the duplicate check is harmless.
+
+        Final statuses (ZAPSIGN_DOCUMENT_FINAL_STATUSES) are never left: a late-delivered
+        older event cannot move a signed or refused document or signer back to an
+        earlier status, whether it arrives in the same batch or in a later one.
+        """
+        try:
+            events_by_id = {}
+            for event in events:
+                events_by_id.setdefault(event.get("event_id") or self.build_event_id(event), event)
+
+            existing_ids = self.event_repository.get_existing_event_ids(events_by_id.keys())
+            new_events = {event_id: event for event_id, event in events_by_id.items() if event_id not in existing_ids}
+
+            logger.info(f"Received {len(events)} ZapSign webhook events, {len(new_events)} new.")
+
+            self.event_repository.bulk_create_events([
+                ZapSignWebhookEvent(
+                    event_id=event_id,
+                    event_type=event.get("event_type"),
+                    document_token=event.get("token"),
+                    payload=event,
+                )
+                for event_id, event in new_events.items()
+            ])
+
+            final_statuses = settings.ZAPSIGN_DOCUMENT_FINAL_STATUSES
+            document_statuses = {}
+            signer_statuses = {}
+            touched_document_tokens = set()
+            for event in new_events.values():
+                if event.get("token"):
+                    touched_document_tokens.add(event["token"])
+                    if event.get("status"):
+                        self._merge_status(document_statuses, event["token"], event["status"], final_statuses)
+                for signer in event.get("signers", []):
+                    if signer.get("status"):
+                        self._merge_status(signer_statuses, signer["token"], signer["status"], final_statuses)
+
+            documents_updated = self.document_repository.bulk_update_status_by_token(
+                document_statuses, final_statuses
+            )
+            signers_updated = self.signer_repository.bulk_update_status_by_token(signer_statuses, final_statuses)
+
+            transaction.on_commit(lambda: self.document_cache.invalidate_many(touched_document_tokens))
+
+            logger.info(f"Applied ZapSign webhook events: {documents_updated} documents, {signers_updated} signers.")
+
+            return {
+                "received": len(events),
+                "duplicates": len(events) - len(new_events),
+                "documents_updated": documents_updated,
+                "signers_updated": signers_updated,
+            }
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while ingesting ZapSign webhook events: {str(e)}")
+            raise
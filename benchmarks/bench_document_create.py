@@ -0,0 +1,93 @@
+"""
+Measures throughput of the document creation path (DocumentService.create_document)
+against the in-process fake ZapSign server, using a throwaway copy of the database.
+The client-side rate limiter and circuit breaker are turned off, so throughput is
+bounded by the creation path itself and not by the ZapSign limits.
+
+    python -m benchmarks.bench_document_create --documents 200 --concurrency 8 \\
+        --latency lognormal --latency-ms 150 --latency-jitter-ms 60 --error-rate 0.01
+"""
+import argparse
+import queue
+import threading
+import time
+import uuid
+
+from benchmarks.utils import disable_zapsign_protections, report, setup_django, test_database
+
+setup_django()
+disable_zapsign_protections()
+
+from django.conf import settings  # noqa: E402
+from django.db import connections  # noqa: E402
+
+from apps.companies.models import Company  # noqa: E402
+from apps.documents.service import DocumentService  # noqa: E402
+from apps.zapsign_integration.fake_server import FakeZapSignServer, LatencyModel, LATENCY_DISTRIBUTIONS  # noqa: E402
+
+
+def create(company: Company, index: int, signers: int):
+    started = time.perf_counter()
+    failed = False
+    try:
+        DocumentService().create_document(company, {
+            "name": f"Benchmark Document {index}",
+            "url_pdf": "https://example.com/document.pdf",
+            "signers": [{"name": f"Signer {n}", "email": f"signer{n}@example.com"} for n in range(signers)],
+        })
+    except Exception:
+        failed = True
+    return (time.perf_counter() - started) * 1000, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--signers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="constant")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    latency = LatencyModel(args.latency, args.latency_ms, args.latency_jitter_ms)
+    with FakeZapSignServer(latency=latency, error_rate=args.error_rate) as server, test_database():
+        settings.ZAPSIGN_BASE_URL = server.base_url
+        company = Company.objects.create_user(
+            email=f"benchmark_{uuid.uuid4()}@company.com", password="benchmark", name="Benchmark",
+            api_token=str(uuid.uuid4()),
+        )
+
+        pending = queue.Queue()
+        for index in range(args.documents):
+            pending.put(index)
+        results = []
+
+        def worker():
+            try:
+                while True:
+                    try:
+                        index = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    results.append(create(company, index, args.signers))
+            finally:
+                connections.close_all()
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    failures = sum(1 for _, failed in results if failed)
+    print(f"{args.documents} documents, concurrency {args.concurrency}, {failures} failed")
+    print(f"throughput: {args.documents / elapsed:.1f} documents/s")
+    report("create_document latency", [timing for timing, _ in results])
+
+
+if __name__ == "__main__":
+    main()
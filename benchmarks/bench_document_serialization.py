@@ -0,0 +1,88 @@
+"""
+Compares the document list's model path (instances + DocumentSerializer) with
+its row path (values() + serialize_document_rows), per 1,000 documents, on a
+throwaway copy of the database.
+
+"serialize" times only the rendering of already-loaded data; "fetch+serialize"
+also includes the queries, as the list endpoint runs them.
+
+    python -m benchmarks.bench_document_serialization --documents 1000 --signers 2 --rounds 30
+"""
+import argparse
+import time
+import uuid
+
+from benchmarks.utils import report, setup_django, test_database
+
+setup_django()
+
+from apps.companies.models import Company  # noqa: E402
+from apps.documents.models import Document  # noqa: E402
+from apps.documents.repository import DocumentRepository  # noqa: E402
+from apps.documents.serializers import DocumentSerializer, serialize_document_rows  # noqa: E402
+from apps.signers.models import Signer  # noqa: E402
+
+
+def populate(documents: int, signers_per_document: int) -> int:
+    company = Company.objects.create_user(
+        email=f"benchmark_{uuid.uuid4()}@company.com", password="benchmark", name="Benchmark",
+        api_token=str(uuid.uuid4()),
+    )
+    created = Document.objects.bulk_create([
+        Document(name=f"Document {index}", token=str(uuid.uuid4()), status="pending", open_id=index,
+                 created_by="benchmark@company.com", external_id=f"ext-{index}", company=company)
+        for index in range(documents)
+    ])
+    Signer.objects.bulk_create([
+        Signer(name=f"Signer {n}", email=f"signer{n}_{document.id}@example.com", token=str(uuid.uuid4()),
+               document=document)
+        for document in created
+        for n in range(signers_per_document)
+    ])
+    return company.id
+
+
+def fetch_instances(company_id: int) -> list:
+    return list(DocumentRepository.get_documents_by_company(company_id).order_by("-created_at", "-id"))
+
+
+def fetch_rows(company_id: int) -> tuple:
+    rows = list(DocumentRepository.get_document_rows_by_company(company_id).order_by("-created_at", "-id"))
+    return rows, DocumentRepository.get_signer_rows_by_document_ids([row["id"] for row in rows])
+
+
+def timed(action, rounds: int, scale: float) -> list:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000 * scale)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--signers", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+    scale = 1000 / args.documents
+
+    with test_database():
+        company_id = populate(args.documents, args.signers)
+        instances = fetch_instances(company_id)
+        rows, signer_rows = fetch_rows(company_id)
+        assert serialize_document_rows(rows, signer_rows) == DocumentSerializer(instances, many=True).data
+
+        report("model serialize", timed(
+            lambda: DocumentSerializer(instances, many=True).data, args.rounds, scale))
+        report("rows serialize", timed(
+            lambda: serialize_document_rows(rows, signer_rows), args.rounds, scale))
+        report("model fetch+serialize", timed(
+            lambda: DocumentSerializer(fetch_instances(company_id), many=True).data, args.rounds, scale))
+        report("rows fetch+serialize", timed(
+            lambda: serialize_document_rows(*fetch_rows(company_id)), args.rounds, scale))
+
+
+if __name__ == "__main__":
+    main()
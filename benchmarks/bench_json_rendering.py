@@ -0,0 +1,80 @@
+"""
+Compares the stock JSONRenderer with ORJSONRenderer on document list
+responses: rendering alone, and end to end through the list endpoint
+(authentication, queries, serialization and rendering), on a throwaway copy
+of the database.
+
+    python -m benchmarks.bench_json_rendering --documents 500 --signers 2 --rounds 50
+"""
+import argparse
+import time
+import uuid
+
+from benchmarks.utils import report, setup_django, test_database
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from apps.companies.models import Company  # noqa: E402
+from apps.documents.models import Document  # noqa: E402
+from apps.documents.views import DocumentListView  # noqa: E402
+from apps.signers.models import Signer  # noqa: E402
+from utils.renderers import ORJSONRenderer  # noqa: E402
+
+
+def populate(documents: int, signers_per_document: int) -> Company:
+    company = Company.objects.create_user(
+        email=f"benchmark_{uuid.uuid4()}@company.com", password="benchmark", name="Benchmark",
+        api_token=str(uuid.uuid4()),
+    )
+    created = Document.objects.bulk_create([
+        Document(name=f"Contrato de prestação de serviços {index}", token=str(uuid.uuid4()), status="pending",
+                 open_id=index, created_by="benchmark@company.com", external_id=f"ext-{index}", company=company)
+        for index in range(documents)
+    ])
+    Signer.objects.bulk_create([
+        Signer(name=f"Signatário {n}", email=f"signer{n}_{document.id}@example.com", token=str(uuid.uuid4()),
+               document=document)
+        for document in created
+        for n in range(signers_per_document)
+    ])
+    return company
+
+
+def timed(action, rounds: int) -> list:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--signers", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    page_size = min(args.documents, settings.API_MAX_PAGE_SIZE)
+
+    with test_database():
+        client = APIClient()
+        client.force_authenticate(populate(args.documents, args.signers))
+        url = f"/api/v1/documents/?page_size={page_size}"
+
+        DocumentListView.renderer_classes = [JSONRenderer]
+        data = client.get(url).data
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+        for renderer_class in (JSONRenderer, ORJSONRenderer):
+            DocumentListView.renderer_classes = [renderer_class]
+            report(f"{renderer_class.__name__} render", timed(lambda: renderer_class().render(data), args.rounds))
+            report(f"{renderer_class.__name__} list", timed(lambda: client.get(url).content, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measures the hot lookups on documents and signers (by token, by company and
+status, by document and email) without and with their indexes, on a throwaway
+copy of the database filled with synthetic rows.
+
+    python -m benchmarks.bench_lookup_indexes --documents 100000 --companies 50 --lookups 300
+"""
+import argparse
+import random
+import time
+import uuid
+
+from benchmarks.utils import report, setup_django, test_database
+
+setup_django()
+
+from django.db import connection  # noqa: E402
+
+from apps.companies.models import Company  # noqa: E402
+from apps.documents.models import Document  # noqa: E402
+from apps.signers.models import Signer  # noqa: E402
+
+STATUSES = ("pending", "signed", "refused", "queued", "failed")
+LOOKUP_INDEXES = {
+    Document: ("document_status_created_idx", "document_token_idx"),
+    Signer: ("signer_token_idx", "signer_document_email_idx"),
+}
+
+
+def populate(documents: int, companies: int, signers_per_document: int, batch_size: int = 5000):
+    company_ids = [
+        Company.objects.create_user(
+            email=f"benchmark_{uuid.uuid4()}@company.com", password="benchmark", name=f"Benchmark {index}",
+            api_token=str(uuid.uuid4()),
+        ).id
+        for index in range(companies)
+    ]
+    for start in range(0, documents, batch_size):
+        created = Document.objects.bulk_create([
+            Document(
+                name=f"Document {index}", token=str(uuid.uuid4()), status=random.choice(STATUSES),
+                company_id=random.choice(company_ids),
+            )
+            for index in range(start, min(start + batch_size, documents))
+        ])
+        Signer.objects.bulk_create([
+            Signer(name="Signer", email=f"signer{n}_{document.id}@example.com", token=str(uuid.uuid4()),
+                   document=document)
+            for document in created
+            for n in range(signers_per_document)
+        ])
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def set_indexes(enabled: bool):
+    with connection.schema_editor(atomic=False) as schema_editor:
+        for model, names in LOOKUP_INDEXES.items():
+            for index in model._meta.indexes:
+                if index.name in names:
+                    if enabled:
+                        schema_editor.add_index(model, index)
+                    else:
+                        schema_editor.remove_index(model, index)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def timed(lookup, samples):
+    timings = []
+    for sample in samples:
+        started = time.perf_counter()
+        lookup(sample)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def run_lookups(label: str, lookups: int):
+    documents = list(Document.objects.order_by("?").values("token", "company_id", "status")[:lookups])
+    signers = list(Signer.objects.order_by("?").values("token", "document_id", "email")[:lookups])
+
+    report(f"{label} document by token", timed(
+        lambda row: Document.objects.filter(token=row["token"]).first(), documents))
+    report(f"{label} documents by status", timed(
+        lambda row: list(Document.objects.filter(company_id=row["company_id"], status=row["status"])
+                         .values_list("id", flat=True)[:50]), documents))
+    report(f"{label} signer by token", timed(
+        lambda row: Signer.objects.filter(token=row["token"]).first(), signers))
+    report(f"{label} signer by email", timed(
+        lambda row: Signer.objects.filter(document_id=row["document_id"], email=row["email"]).first(), signers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--companies", type=int, default=50)
+    parser.add_argument("--signers", type=int, default=2)
+    parser.add_argument("--lookups", type=int, default=300)
+    args = parser.parse_args()
+
+    with test_database():
+        populate(args.documents, args.companies, args.signers)
+
+        set_indexes(False)
+        run_lookups("before", args.lookups)
+
+        set_indexes(True)
+        run_lookups("after", args.lookups)
+
+
+if __name__ == "__main__":
+    main()
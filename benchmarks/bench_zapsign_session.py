@@ -0,0 +1,64 @@
+"""
+Compares per-call latency of ZapSign document creation with a fresh connection
+per request (module-level ``requests.post``) against the pooled keep-alive
+session used by ``ZapSignService``.
+
+Runs against the in-process fake ZapSign server, so no network access is needed.
+Loopback connections are almost free, so the fake server sleeps ``--handshake-ms``
+whenever a new connection is accepted to approximate the TCP+TLS setup paid
+against the real API. The client-side rate limiter and circuit breaker are
+turned off, so both sides measure connection handling only:
+
+    python -m benchmarks.bench_zapsign_session --requests 500 --handshake-ms 30
+"""
+import argparse
+import time
+
+from benchmarks.utils import disable_zapsign_protections, report, setup_django
+
+setup_django()
+disable_zapsign_protections()
+
+import requests  # noqa: E402
+
+from apps.zapsign_integration.fake_server import FakeZapSignServer  # noqa: E402
+from apps.zapsign_integration.service import ZapSignService  # noqa: E402
+
+PAYLOAD = {
+    "name": "Benchmark Document",
+    "url_pdf": "https://example.com/document.pdf",
+    "signers": [{"name": "Signer", "email": "signer@example.com"}],
+}
+
+
+def measure(call, total: int) -> list:
+    timings = []
+    for _ in range(total):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    with FakeZapSignServer(handshake_ms=args.handshake_ms) as server:
+        service = ZapSignService(api_base_url=server.base_url, api_token="benchmark")
+
+        def per_call_connection():
+            response = requests.post(f"{server.base_url}/docs/", headers=service.get_headers(), json=PAYLOAD)
+            response.raise_for_status()
+
+        def pooled_session():
+            service.create_document_in_zapsign(**PAYLOAD)
+
+        report("requests.post (no pooling)", measure(per_call_connection, args.requests))
+        report("ZapSignService (pooled)", measure(pooled_session, args.requests))
+
+
+if __name__ == "__main__":
+    main()
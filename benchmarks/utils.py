@@ -0,0 +1,57 @@
+import logging
+import os
+import statistics
+import sys
+from contextlib import contextmanager
+
+
+def setup_django() -> None:
+    """
+    Configures Django with the project settings and silences request logging,
+    which would otherwise dominate the measurements.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "zapsign.settings")
+
+    import django
+    django.setup()
+    logging.disable(logging.CRITICAL)
+
+
+def disable_zapsign_protections() -> None:
+    """
+    Turns off the client-side ZapSign rate limiter and makes the circuit breaker
+    impossible to trip, so benchmarks measure the HTTP path and not the limits
+    placed in front of it. Must run before any ZapSignService is built.
+    """
+    from django.conf import settings
+
+    settings.ZAPSIGN_RATE_LIMIT_PER_SECOND = 0
+    settings.ZAPSIGN_BREAKER_FAILURE_THRESHOLD = sys.maxsize
+
+
+@contextmanager
+def test_database():
+    """
+    Creates a throwaway copy of the database schema for the duration of a benchmark,
+    so benchmarks never write to the development database.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def report(label: str, timings_ms: list) -> None:
+    """
+    Prints mean/p50/p95 of a list of timings in milliseconds.
+    """
+    timings_ms = sorted(timings_ms)
+    p95 = timings_ms[max(int(len(timings_ms) * 0.95) - 1, 0)]
+    print(f"{label:<32} mean={statistics.mean(timings_ms):8.3f}ms  p50={statistics.median(timings_ms):8.3f}ms  "
+          f"p95={p95:8.3f}ms")
@@ -115,3 +115,16 @@ def mock_zapsign_service():
     """
     with patch("apps.documents.service.ZapSignService.create_document_in_zapsign") as mock_service:
         yield mock_service
+
+
+@pytest.fixture(autouse=True)
+def local_memory_cache(settings):
+    """
+    Automatically replace the Redis cache with an isolated in-memory cache for all tests.
+    """
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": f"test-{uuid.uuid4()}",
+        }
+    }
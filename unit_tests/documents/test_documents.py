@@ -1,7 +1,36 @@
+import base64
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
 import pytest
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
 from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
 from unittest.mock import patch
 
+from apps.companies.models import Company
+from apps.documents.models import Document, DocumentOutbox
+from apps.signers.models import Signer
+from apps.documents.repository import DocumentOutboxRepository, DocumentRepository
+from apps.documents.serializers import DocumentSerializer, serialize_document_rows
+from apps.documents.service import DocumentService
+from apps.documents.tasks import process_document_outbox
+from utils.db_routing import PrimaryReplicaRouter, ReadReplicaMiddleware, replica_reads
+from utils.exceptions import FailedToCreateDocumentInZapSignException
+from utils.idempotency import IdempotencyStore
+from utils.parsers import ORJSONParser
+from utils.renderers import ORJSONRenderer
+
 
 @pytest.mark.django_db
 def test_list_documents_success(authenticated_user, test_document):
@@ -51,6 +80,25 @@ def test_create_document_success(mock_zapsign_service, authenticated_user):
     assert len(response.data["signers"]) == 2
 
 
+@pytest.mark.django_db
+def test_create_document_rolls_back_when_zapsign_fails(mock_zapsign_service, authenticated_user):
+    """
+    Test that a failed ZapSign call leaves no local document or signers behind.
+    """
+    mock_zapsign_service.side_effect = FailedToCreateDocumentInZapSignException()
+    payload = {
+        "name": "Rejected Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    }
+
+    response = authenticated_user.post("/api/v1/documents/", payload, format="json")
+
+    assert response.status_code == FailedToCreateDocumentInZapSignException().status_code
+    assert not Document.objects.filter(name="Rejected Document").exists()
+    assert not Signer.objects.filter(email="signer1@example.com").exists()
+
+
 @pytest.mark.django_db
 def test_get_document_success(authenticated_user, test_document):
     """
@@ -84,3 +132,953 @@ def test_delete_document_success(authenticated_user, test_document):
     response = authenticated_user.delete(f"/api/v1/documents/{test_document.id}/")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+def test_create_document_with_outbox_returns_accepted(settings, mock_zapsign_service, authenticated_user):
+    """
+    Test that in outbox mode the document is queued without calling ZapSign.
+    """
+    settings.ZAPSIGN_OUTBOX_ENABLED = True
+    payload = {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    }
+
+    response = authenticated_user.post("/api/v1/documents/", payload, format="json")
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data["status"] == "queued"
+    assert response.data["token"] is None
+    entry = DocumentOutbox.objects.get(document_id=response.data["id"])
+    assert entry.status == DocumentOutbox.Status.PENDING
+    assert entry.payload["url_pdf"] == payload["url_pdf"]
+    mock_zapsign_service.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_process_outbox_entry_applies_zapsign_response(mock_zapsign_service, test_company):
+    """
+    Test that processing an outbox entry fills in the ZapSign details and signers.
+    """
+    mock_zapsign_service.return_value = {
+        "token": "zapsign-token",
+        "status": "pending",
+        "open_id": 12345,
+        "created_by": {"email": "creator@example.com"},
+        "signers": [{"token": "signer1-token", "status": "new"}],
+    }
+    service = DocumentService()
+    document = service.enqueue_document_creation(test_company, {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    })
+
+    service.process_outbox_entry(document.outbox.id)
+
+    document.refresh_from_db()
+    assert document.token == "zapsign-token"
+    assert document.status == "pending"
+    assert document.signers.get().token == "signer1-token"
+    assert DocumentOutbox.objects.get(document=document).status == DocumentOutbox.Status.DONE
+
+
+@pytest.mark.django_db
+def test_process_outbox_entry_gives_up_after_max_attempts(settings, mock_zapsign_service, test_company):
+    """
+    Test that an entry is marked as failed once it runs out of attempts.
+    """
+    settings.ZAPSIGN_OUTBOX_MAX_ATTEMPTS = 1
+    mock_zapsign_service.side_effect = ConnectionError("ZapSign is down")
+    service = DocumentService()
+    document = service.enqueue_document_creation(test_company, {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    })
+
+    with pytest.raises(ConnectionError):
+        service.process_outbox_entry(document.outbox.id)
+
+    entry = DocumentOutbox.objects.get(document=document)
+    assert entry.status == DocumentOutbox.Status.FAILED
+    assert entry.last_error == "ZapSign is down"
+    assert Document.objects.get(id=document.id).status == "failed"
+
+
+@pytest.mark.django_db
+def test_process_outbox_entry_keeps_edits_made_during_the_zapsign_call(mock_zapsign_service, test_company):
+    """
+    Test that writing the ZapSign response back does not overwrite a rename that
+    landed while the ZapSign call was in flight.
+    """
+    service = DocumentService()
+    document = service.enqueue_document_creation(test_company, {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [],
+    })
+
+    def create_in_zapsign(**payload):
+        Document.objects.filter(id=document.id).update(name="Renamed meanwhile")
+        return {"token": "zapsign-token", "status": "pending", "open_id": 1,
+                "created_by": {"email": "creator@example.com"}, "signers": []}
+
+    mock_zapsign_service.side_effect = create_in_zapsign
+
+    service.process_outbox_entry(document.outbox.id)
+
+    stored = Document.objects.get(id=document.id)
+    assert stored.name == "Renamed meanwhile"
+    assert stored.token == "zapsign-token"
+
+
+@pytest.mark.django_db
+def test_process_document_outbox_only_swallows_recorded_failures(mock_zapsign_service, test_company):
+    """
+    Test that the outbox task treats a ZapSign failure recorded on the entry as handled,
+    but lets an error raised while recording it fail the task.
+    """
+    mock_zapsign_service.side_effect = FailedToCreateDocumentInZapSignException()
+    document = DocumentService().enqueue_document_creation(test_company, {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    })
+
+    assert process_document_outbox(document.outbox.id) is None
+
+    DocumentOutbox.objects.filter(id=document.outbox.id).update(next_attempt_at=None)
+    with patch.object(DocumentOutboxRepository, "mark_failed_attempt", side_effect=RuntimeError("database down")):
+        with pytest.raises(RuntimeError):
+            process_document_outbox(document.outbox.id)
+
+
+@pytest.mark.django_db
+def test_failed_outbox_entry_is_not_drained_before_its_retry_is_due(settings, mock_zapsign_service, test_company):
+    """
+    Test that a failed attempt schedules the next one with backoff, and that the entry
+    is neither drained nor claimable until then.
+    """
+    settings.ZAPSIGN_OUTBOX_RETRY_BACKOFF = 10
+    mock_zapsign_service.side_effect = ConnectionError("ZapSign is down")
+    service = DocumentService()
+    document = service.enqueue_document_creation(test_company, {
+        "name": "Queued Document",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer 1", "email": "signer1@example.com"}],
+    })
+
+    with pytest.raises(ConnectionError):
+        service.process_outbox_entry(document.outbox.id)
+
+    entry = DocumentOutbox.objects.get(document=document)
+    stale_before = timezone.now() - timedelta(seconds=settings.ZAPSIGN_OUTBOX_VISIBILITY_TIMEOUT)
+    assert entry.status == DocumentOutbox.Status.PENDING
+    assert entry.next_attempt_at > timezone.now() + timedelta(seconds=5)
+    assert DocumentOutboxRepository.get_claimable_entry_ids(stale_before, 10) == []
+    assert service.process_outbox_entry(entry.id) is None
+
+    DocumentOutbox.objects.filter(id=entry.id).update(next_attempt_at=timezone.now())
+    assert DocumentOutboxRepository.get_claimable_entry_ids(stale_before, 10) == [entry.id]
+
+
+@pytest.mark.django_db
+def test_get_zapsign_document_is_cached_until_update(
+        authenticated_user, test_document, django_capture_on_commit_callbacks
+):
+    """
+    Test that ZapSign lookups are cached and invalidated when the document is updated.
+    """
+    test_document.token = "zapsign-token"
+    test_document.save()
+
+    with patch("apps.zapsign_integration.service.ZapSignService.fetch_document") as mock_fetch:
+        mock_fetch.return_value = {"token": "zapsign-token", "status": "pending"}
+        first = authenticated_user.get(f"/api/v1/documents/{test_document.id}/zapsign/")
+        authenticated_user.get(f"/api/v1/documents/{test_document.id}/zapsign/")
+        assert mock_fetch.call_count == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_user.put(f"/api/v1/documents/{test_document.id}/", {"name": "Renamed"}, format="json")
+        authenticated_user.get(f"/api/v1/documents/{test_document.id}/zapsign/")
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.data == {"token": "zapsign-token", "status": "pending"}
+    assert mock_fetch.call_count == 2
+
+
+@pytest.mark.django_db
+def test_create_documents_batch_success(mock_zapsign_service, authenticated_user):
+    """
+    Test that a batch where every item succeeds returns 201 with one created result per item.
+    """
+    mock_zapsign_service.side_effect = lambda **payload: {
+        "token": f"token-{payload['name']}",
+        "status": "pending",
+        "open_id": 1,
+        "created_by": {"email": "creator@example.com"},
+        "signers": [{"token": f"signer-{payload['name']}", "status": "new"}],
+    }
+    payload = {
+        "documents": [
+            {
+                "name": f"Batch {index}",
+                "url_pdf": "https://example.com/document.pdf",
+                "signers": [{"name": "Signer", "email": "signer@example.com"}],
+            }
+            for index in range(3)
+        ]
+    }
+
+    response = authenticated_user.post("/api/v1/documents/batch/", payload, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [item["index"] for item in response.data] == [0, 1, 2]
+    assert all(item["status"] == "created" for item in response.data)
+    assert response.data[1]["document"]["token"] == "token-Batch 1"
+    assert len(response.data[1]["document"]["signers"]) == 1
+    assert Document.objects.filter(name__startswith="Batch").count() == 3
+
+
+@pytest.mark.django_db
+def test_create_documents_batch_partial_failure(mock_zapsign_service, authenticated_user):
+    """
+    Test that a batch with a failing item returns 207 and drops only the failed document.
+    """
+    def create_in_zapsign(**payload):
+        if payload["name"] == "Broken":
+            raise RuntimeError("ZapSign unavailable")
+        return {
+            "token": f"token-{payload['name']}",
+            "status": "pending",
+            "open_id": 1,
+            "created_by": {"email": "creator@example.com"},
+            "signers": [],
+        }
+
+    mock_zapsign_service.side_effect = create_in_zapsign
+    signers = [{"name": "Signer", "email": "signer@example.com"}]
+    payload = {
+        "documents": [
+            {"name": "Working", "url_pdf": "https://example.com/a.pdf", "signers": signers},
+            {"name": "Broken", "url_pdf": "https://example.com/b.pdf", "signers": signers},
+        ]
+    }
+
+    response = authenticated_user.post("/api/v1/documents/batch/", payload, format="json")
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    assert response.data[0]["status"] == "created"
+    assert response.data[1]["status"] == "failed"
+    assert response.data[1]["document"] is None
+    assert response.data[1]["error"]["title"]
+    assert Document.objects.filter(name="Working").exists()
+    assert not Document.objects.filter(name="Broken").exists()
+
+
+@pytest.mark.django_db
+def test_create_documents_batch_stores_the_same_data_as_single_creates(mock_zapsign_service, authenticated_user):
+    """
+    Test that a batch-created document is stored exactly like a singly-created one,
+    and that an empty ZapSign response fails only its own item.
+    """
+    def create_in_zapsign(**payload):
+        if payload["name"] == "Empty":
+            return {}
+        return {
+            "token": "zapsign-token",
+            "status": "pending",
+            "open_id": 7,
+            "created_by": {"email": "creator@example.com"},
+            "external_id": "zapsign-external-id",
+            "signers": [{"token": "signer-token", "status": "new"}],
+        }
+
+    mock_zapsign_service.side_effect = create_in_zapsign
+    item = {
+        "name": "Same",
+        "url_pdf": "https://example.com/document.pdf",
+        "signers": [{"name": "Signer", "email": "signer@example.com"}],
+    }
+    fields = ("name", "token", "status", "open_id", "created_by", "external_id", "company_id")
+
+    single = authenticated_user.post("/api/v1/documents/", item, format="json")
+    batch = authenticated_user.post(
+        "/api/v1/documents/batch/", {"documents": [item, {**item, "name": "Empty"}]}, format="json"
+    )
+
+    single_row = Document.objects.values(*fields).get(id=single.data["id"])
+    batch_row = Document.objects.values(*fields).get(id=batch.data[0]["document"]["id"])
+    assert batch_row == single_row
+    assert single_row["created_by"] == "creator@example.com"
+    assert single_row["external_id"] == "zapsign-external-id"
+    assert batch.data[1]["status"] == "failed"
+    assert not Document.objects.filter(name="Empty").exists()
+
+
+IDEMPOTENT_PAYLOAD = {
+    "name": "Idempotent Document",
+    "url_pdf": "https://example.com/document.pdf",
+    "signers": [{"name": "Signer", "email": "signer@example.com"}],
+}
+
+
+@pytest.mark.django_db
+def test_create_document_with_idempotency_key_replays_response(mock_zapsign_service, authenticated_user):
+    """
+    Test that retrying a creation with the same Idempotency-Key replays the first
+    response without creating a second document.
+    """
+    mock_zapsign_service.return_value = {
+        "token": "zapsign-token",
+        "status": "pending",
+        "open_id": 1,
+        "created_by": {"email": "creator@example.com"},
+        "signers": [{"token": "signer-token", "status": "new"}],
+    }
+
+    first = authenticated_user.post(
+        "/api/v1/documents/", IDEMPOTENT_PAYLOAD, format="json", HTTP_IDEMPOTENCY_KEY="retry-1"
+    )
+    second = authenticated_user.post(
+        "/api/v1/documents/", IDEMPOTENT_PAYLOAD, format="json", HTTP_IDEMPOTENCY_KEY="retry-1"
+    )
+
+    assert first.status_code == second.status_code == status.HTTP_201_CREATED
+    assert second.data == first.data
+    assert second["Idempotent-Replayed"] == "true"
+    assert mock_zapsign_service.call_count == 1
+    assert Document.objects.filter(name="Idempotent Document").count() == 1
+
+
+@pytest.mark.django_db
+def test_create_document_with_reused_idempotency_key_is_rejected(mock_zapsign_service, authenticated_user):
+    """
+    Test that reusing an Idempotency-Key with a different payload returns 422.
+    """
+    mock_zapsign_service.return_value = {
+        "token": "zapsign-token",
+        "status": "pending",
+        "open_id": 1,
+        "created_by": {"email": "creator@example.com"},
+        "signers": [],
+    }
+    authenticated_user.post("/api/v1/documents/", IDEMPOTENT_PAYLOAD, format="json", HTTP_IDEMPOTENCY_KEY="reused")
+
+    response = authenticated_user.post(
+        "/api/v1/documents/", {**IDEMPOTENT_PAYLOAD, "name": "Other"}, format="json", HTTP_IDEMPOTENCY_KEY="reused"
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert not Document.objects.filter(name="Other").exists()
+
+
+@pytest.mark.django_db
+def test_create_document_while_idempotency_key_in_flight_returns_conflict(
+        settings, mock_zapsign_service, authenticated_user
+):
+    """
+    Test that a duplicate arriving while the first request still holds the key
+    gives up with 409 once the wait timeout expires.
+    """
+    settings.IDEMPOTENCY_WAIT_TIMEOUT = 0
+    company = authenticated_user.handler._force_user
+    store = IdempotencyStore()
+    scope = store.make_scope(company.pk, "POST", "/api/v1/documents/", "in-flight")
+    store.acquire(scope, store.fingerprint(IDEMPOTENT_PAYLOAD))
+
+    response = authenticated_user.post(
+        "/api/v1/documents/", IDEMPOTENT_PAYLOAD, format="json", HTTP_IDEMPOTENCY_KEY="in-flight"
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    mock_zapsign_service.assert_not_called()
+
+
+def test_idempotency_release_keeps_a_lock_taken_by_another_request():
+    """
+    Test that a request whose lock expired does not release the lock a later request took since.
+    """
+    store = IdempotencyStore()
+    fingerprint = store.fingerprint(IDEMPOTENT_PAYLOAD)
+    expired = store.acquire("expired-lock", fingerprint)
+    store.cache.delete("idempotency:lock:expired-lock")
+    current = store.acquire("expired-lock", fingerprint)
+
+    store.release("expired-lock", expired)
+
+    assert current is not None and current != expired
+    assert store.get_lock_fingerprint("expired-lock") == fingerprint
+    assert store.acquire("expired-lock", fingerprint) is None
+    store.release("expired-lock", current)
+    assert store.get_lock_fingerprint("expired-lock") is None
+
+
+@pytest.mark.django_db
+def test_create_document_signer_queries_do_not_grow_with_signers(mock_zapsign_service, test_company):
+    """
+    Test that persisting the signers of a new document takes the same number of
+    queries whether the envelope has 2 or 50 signers.
+    """
+    def create_in_zapsign(**payload):
+        return {
+            "token": f"token-{payload['name']}",
+            "status": "pending",
+            "open_id": 1,
+            "created_by": {"email": "creator@example.com"},
+            "signers": [{"token": f"signer-{index}", "status": "new"} for index in range(len(payload["signers"]))],
+        }
+
+    mock_zapsign_service.side_effect = create_in_zapsign
+    service = DocumentService()
+
+    def count_queries(signer_count):
+        data = {
+            "name": f"Envelope {signer_count}",
+            "url_pdf": "https://example.com/document.pdf",
+            "signers": [{"name": f"Signer {i}", "email": f"signer{i}@example.com"} for i in range(signer_count)],
+        }
+        with CaptureQueriesContext(connection) as context:
+            document = service.create_document(test_company, data)
+        assert document.signers.count() == signer_count
+        return len(context.captured_queries)
+
+    assert count_queries(2) == count_queries(50)
+
+
+@pytest.mark.django_db
+def test_list_documents_queries_do_not_grow_with_rows(authenticated_user):
+    """
+    Test that listing documents with nested signers runs a fixed number of queries,
+    whatever the number of documents and signers.
+    """
+    company = authenticated_user.handler._force_user
+
+    def add_documents(count):
+        documents = Document.objects.bulk_create(
+            [Document(name=f"Document {index}", company=company) for index in range(count)]
+        )
+        Signer.objects.bulk_create(
+            [
+                Signer(name="Signer", email=f"signer{index}@example.com", document=document)
+                for document in documents
+                for index in range(3)
+            ]
+        )
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = authenticated_user.get("/api/v1/documents/")
+        assert response.status_code == status.HTTP_200_OK
+        return len(context.captured_queries), response
+
+    add_documents(1)
+    queries_for_one, _ = count_queries()
+    add_documents(20)
+    queries_for_many, response = count_queries()
+
+    assert queries_for_many == queries_for_one
+    assert len(response.data) == 21
+    assert all(len(document["signers"]) == 3 for document in response.data)
+
+
+@pytest.mark.django_db
+def test_list_documents_is_paginated_with_cursors(authenticated_user):
+    """
+    Test that following the next-page cursor walks every document exactly once,
+    newest first, including documents created at the same instant.
+    """
+    company = authenticated_user.handler._force_user
+    documents = Document.objects.bulk_create(
+        [Document(name=f"Document {index}", company=company) for index in range(5)]
+    )
+    Document.objects.filter(id__in=[documents[1].id, documents[2].id]).update(created_at=documents[0].created_at)
+
+    seen = []
+    url = "/api/v1/documents/?page_size=2"
+    while url:
+        response = authenticated_user.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) <= 2
+        seen.extend(document["id"] for document in response.data)
+        cursor = response.get("X-Next-Cursor")
+        url = f"/api/v1/documents/?page_size=2&cursor={cursor}" if cursor else None
+
+    expected = Document.objects.filter(company=company).order_by("-created_at", "-id").values_list("id", flat=True)
+    assert seen == list(expected)
+
+
+@pytest.mark.django_db
+def test_list_documents_rejects_invalid_cursor(authenticated_user):
+    """
+    Test that a tampered cursor returns 400.
+    """
+    response = authenticated_user.get("/api/v1/documents/?cursor=not-a-cursor")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("values", [
+    [None, 1],
+    [{"a": 1}, 1],
+    ["2024-01-01T00:00:00+00:00", None],
+    ["2024-01-01T00:00:00+00:00", "abc"],
+    [True, [1]],
+])
+def test_list_documents_rejects_cursors_with_invalid_values(authenticated_user, values):
+    """
+    Test that a well-formed cursor carrying unusable values returns 400 instead of failing in the query.
+    """
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+    response = authenticated_user.get(f"/api/v1/documents/?cursor={cursor}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_export_documents_streams_ndjson(authenticated_user, test_document, signers):
+    """
+    Test that the export streams one NDJSON row per signer, and one row for a document without signers.
+    """
+    company = authenticated_user.handler._force_user
+    lonely_document = Document.objects.create(name="No Signers", company=company)
+
+    response = authenticated_user.get("/api/v1/documents/export/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+    assert [(row["document_id"], row["signer_email"]) for row in rows] == [
+        (test_document.id, signers[0].email),
+        (test_document.id, signers[1].email),
+        (lonely_document.id, None),
+    ]
+
+
+@pytest.mark.django_db
+def test_export_documents_streams_csv(authenticated_user, test_document, signers):
+    """
+    Test that the export can be streamed as CSV with a header row.
+    """
+    response = authenticated_user.get("/api/v1/documents/export/?export_format=csv")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert len(rows) == 2
+    assert rows[0]["document_name"] == test_document.name
+    assert rows[1]["signer_name"] == signers[1].name
+
+
+@pytest.mark.django_db
+def test_get_document_answers_not_modified_until_signers_change(
+        authenticated_user, test_document, test_signer, django_assert_num_queries
+):
+    """
+    Test that a document poll with a current ETag gets a 304 from a single query,
+    and that changing one of its signers invalidates the ETag.
+    """
+    first = authenticated_user.get(f"/api/v1/documents/{test_document.id}/")
+    etag = first["ETag"]
+
+    with django_assert_num_queries(1):
+        not_modified = authenticated_user.get(f"/api/v1/documents/{test_document.id}/", HTTP_IF_NONE_MATCH=etag)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified["ETag"] == etag
+
+    authenticated_user.put(f"/api/v1/signers/{test_signer.id}/", {"status": "signed"}, format="json")
+    changed = authenticated_user.get(f"/api/v1/documents/{test_document.id}/", HTTP_IF_NONE_MATCH=etag)
+
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed["ETag"] != etag
+    assert changed.data["signers"][0]["status"] == "signed"
+
+
+@pytest.mark.django_db
+def test_list_documents_answers_not_modified_until_a_document_is_removed(authenticated_user, test_document):
+    """
+    Test that the list ETag holds while nothing changes and changes when a document is deleted.
+    """
+    company = authenticated_user.handler._force_user
+    other_document = Document.objects.create(name="Other Document", company=company)
+    etag = authenticated_user.get("/api/v1/documents/")["ETag"]
+
+    not_modified = authenticated_user.get("/api/v1/documents/", HTTP_IF_NONE_MATCH=etag)
+    other_page = authenticated_user.get("/api/v1/documents/?page_size=1", HTTP_IF_NONE_MATCH=etag)
+    other_document.delete()
+    changed = authenticated_user.get("/api/v1/documents/", HTTP_IF_NONE_MATCH=etag)
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert other_page.status_code == status.HTTP_200_OK
+    assert changed.status_code == status.HTTP_200_OK
+    assert len(changed.data) == 1
+
+
+@pytest.mark.django_db
+def test_list_documents_validators_come_from_the_page_rows(authenticated_user):
+    """
+    Test that the list ETag is computed from the page itself, without aggregating the
+    company's documents, and that a 304 skips the signer query.
+    """
+    company = authenticated_user.handler._force_user
+    documents = [Document.objects.create(name=f"Document {index}", company=company) for index in range(3)]
+    etag = authenticated_user.get("/api/v1/documents/?page_size=2")["ETag"]
+
+    with CaptureQueriesContext(connection) as queries:
+        not_modified = authenticated_user.get("/api/v1/documents/?page_size=2", HTTP_IF_NONE_MATCH=etag)
+    captured = [query["sql"] for query in queries.captured_queries]
+    authenticated_user.put(f"/api/v1/documents/{documents[2].id}/", {"name": "Renamed"}, format="json")
+    changed = authenticated_user.get("/api/v1/documents/?page_size=2", HTTP_IF_NONE_MATCH=etag)
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert len(captured) == 1
+    assert "COUNT(" not in captured[0] and "MAX(" not in captured[0]
+    assert changed.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_list_documents_filters_in_sql(authenticated_user):
+    """
+    Test that status, external_id and creation range filters narrow the listing.
+    """
+    company = authenticated_user.handler._force_user
+    signed = Document.objects.create(name="Signed", status="signed", external_id="ext-1", company=company)
+    pending = Document.objects.create(name="Pending", status="pending", external_id="ext-2", company=company)
+    Document.objects.filter(id=pending.id).update(created_at=timezone.make_aware(datetime(2024, 1, 10)))
+
+    by_status = authenticated_user.get("/api/v1/documents/?status=signed")
+    by_external_id = authenticated_user.get("/api/v1/documents/?external_id=ext-2")
+    by_range = authenticated_user.get("/api/v1/documents/?created_after=01/01/2024&created_before=01/02/2024")
+
+    assert [document["id"] for document in by_status.data] == [signed.id]
+    assert [document["id"] for document in by_external_id.data] == [pending.id]
+    assert [document["id"] for document in by_range.data] == [pending.id]
+
+
+@pytest.mark.django_db
+def test_list_documents_rejects_invalid_filters(authenticated_user):
+    """
+    Test that unknown parameters and inverted date ranges are rejected with 400.
+    """
+    unknown = authenticated_user.get("/api/v1/documents/?name=Contract")
+    inverted = authenticated_user.get("/api/v1/documents/?created_after=02/01/2024&created_before=01/01/2024")
+
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
+    assert inverted.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_search_documents_matches_names_and_signer_emails(authenticated_user):
+    """
+    Test that search matches word prefixes of document names and signer emails,
+    ranks the document matching on both first and never returns other companies' documents.
+    """
+    company = authenticated_user.handler._force_user
+    other_company = Company.objects.create(email="other@company.com", name="Other", api_token="other-token")
+    contract = Document.objects.create(name="ACME Service Contract", company=company)
+    invoice = Document.objects.create(name="Invoice", company=company)
+    both = Document.objects.create(name="Acme Renewal", company=company)
+    Document.objects.create(name="ACME Contract", company=other_company)
+    Signer.objects.create(name="Ana Souza", email="ana@acme.com", document=invoice)
+    Signer.objects.create(name="Bruno Lima", email="bruno@acme.com", document=both)
+
+    by_name = authenticated_user.get("/api/v1/documents/search/?q=acme contr")
+    by_email = authenticated_user.get("/api/v1/documents/search/?q=acme")
+
+    assert [document["id"] for document in by_name.data] == [contract.id]
+    assert [document["id"] for document in by_email.data][0] == both.id
+    assert {document["id"] for document in by_email.data} == {contract.id, invoice.id, both.id}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["acme-corp", "corp", "acme-corp.com", "silva", "ana.silva@acme-corp.com.br"])
+def test_search_documents_matches_parts_of_signer_emails(authenticated_user, query):
+    """
+    Test that hyphenated and dotted parts of a signer email are searchable on their own.
+    """
+    document = Document.objects.create(name="Lease", company=authenticated_user.handler._force_user)
+    Signer.objects.create(name="Ana", email="ana.silva@acme-corp.com.br", document=document)
+
+    response = authenticated_user.get(f"/api/v1/documents/search/?q={query}")
+
+    assert [found["id"] for found in response.data] == [document.id]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("values", [
+    ["abc", "2024-01-01T00:00:00+00:00", 1],
+    [None, "2024-01-01T00:00:00+00:00", 1],
+    [True, "2024-01-01T00:00:00+00:00", 1],
+])
+def test_search_documents_rejects_cursors_with_invalid_ranks(authenticated_user, values):
+    """
+    Test that a search cursor whose rank is not an integer returns 400.
+    """
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+    response = authenticated_user.get(f"/api/v1/documents/search/?q=lease&cursor={cursor}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_search_documents_is_paginated_with_cursors(authenticated_user):
+    """
+    Test that following the next-page cursor walks every search result exactly once.
+    """
+    company = authenticated_user.handler._force_user
+    Document.objects.bulk_create([Document(name=f"Lease {index}", company=company) for index in range(5)])
+
+    seen = []
+    url = "/api/v1/documents/search/?q=lease&page_size=2"
+    while url:
+        response = authenticated_user.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(document["id"] for document in response.data)
+        cursor = response.get("X-Next-Cursor")
+        url = f"/api/v1/documents/search/?q=lease&page_size=2&cursor={cursor}" if cursor else None
+
+    assert sorted(seen) == sorted(Document.objects.filter(company=company).values_list("id", flat=True))
+    assert len(seen) == 5
+
+
+@pytest.mark.django_db
+def test_search_documents_rejects_empty_queries(authenticated_user):
+    """
+    Test that missing, too short or operator-only queries are rejected with 400.
+    """
+    missing = authenticated_user.get("/api/v1/documents/search/")
+    too_short = authenticated_user.get("/api/v1/documents/search/?q=a")
+    operators_only = authenticated_user.get("/api/v1/documents/search/?q=%26%7C!")
+
+    assert missing.status_code == status.HTTP_400_BAD_REQUEST
+    assert too_short.status_code == status.HTTP_400_BAD_REQUEST
+    assert operators_only.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+def test_document_reads_use_replicas_outside_transactions(settings):
+    """
+    Test that reads go to a replica only when allowed and no transaction is open on the primary.
+    """
+    settings.DATABASE_REPLICAS = ["replica_0"]
+    router = PrimaryReplicaRouter()
+
+    with replica_reads():
+        on_replica = router.db_for_read(Document)
+        with transaction.atomic():
+            in_transaction = router.db_for_read(Document)
+
+    assert on_replica == "replica_0"
+    assert in_transaction == "default"
+    assert router.db_for_read(Document) == "default"
+    assert router.db_for_write(Document) == "default"
+
+
+def test_read_replica_middleware_pins_writers_to_primary(settings):
+    """
+    Test that after a successful write a client reads from the primary while other clients keep using replicas.
+    """
+    settings.DATABASE_REPLICAS = ["replica_0"]
+    router = PrimaryReplicaRouter()
+    routes = []
+
+    def get_response(request):
+        routes.append(router.db_for_read(Document))
+        return HttpResponse(status=201 if request.method == "POST" else 200)
+
+    middleware = ReadReplicaMiddleware(get_response)
+    factory = RequestFactory()
+    middleware(factory.get("/api/v1/documents/", HTTP_AUTHORIZATION="Bearer writer"))
+    middleware(factory.post("/api/v1/documents/", HTTP_AUTHORIZATION="Bearer writer"))
+    middleware(factory.get("/api/v1/documents/", HTTP_AUTHORIZATION="Bearer writer"))
+    middleware(factory.get("/api/v1/documents/", HTTP_AUTHORIZATION="Bearer reader"))
+
+    assert routes == ["replica_0", "default", "default", "replica_0"]
+
+
+@pytest.mark.django_db
+def test_document_row_serializer_matches_model_serializer(authenticated_user, test_document, signers):
+    """
+    Test that the values()-based list serialization renders the same JSON as DocumentSerializer,
+    including empty fields, documents without signers and datetimes in the active time zone.
+    """
+    company = authenticated_user.handler._force_user
+    Document.objects.create(name="No Signers", company=company, open_id=None, created_by=None)
+    documents = DocumentRepository.get_documents_by_company(company.id).order_by("id")
+    rows = list(DocumentRepository.get_document_rows_by_company(company.id).order_by("id"))
+    signer_rows = DocumentRepository.get_signer_rows_by_document_ids([row["id"] for row in rows])
+
+    with timezone.override("America/Sao_Paulo"):
+        expected = DocumentSerializer(documents, many=True).data
+        data = serialize_document_rows(rows, signer_rows)
+
+    assert json.dumps(data) == json.dumps(expected)
+
+
+@pytest.mark.django_db
+def test_list_documents_with_sparse_fields_skips_signers(authenticated_user, test_document, signers):
+    """
+    Test that `fields` restricts the payload and the selected columns, and that signers are
+    neither returned nor queried unless expanded.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_user.get("/api/v1/documents/?fields=id,status,token")
+    expanded = authenticated_user.get("/api/v1/documents/?fields=id&expand=signers")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [{"id": test_document.id, "status": test_document.status, "token": test_document.token}]
+    assert not any("signers_signer" in query["sql"] for query in queries.captured_queries)
+    assert not any('"documents_document"."name"' in query["sql"] for query in queries.captured_queries)
+    assert list(expanded.data[0]) == ["id", "signers"]
+    assert len(expanded.data[0]["signers"]) == len(signers)
+
+
+@pytest.mark.django_db
+def test_get_document_with_sparse_fields(authenticated_user, test_document, signers):
+    """
+    Test that the detail endpoint honours `fields` and `expand`, keeps the full shape by default
+    and rejects unknown fields.
+    """
+    url = f"/api/v1/documents/{test_document.id}/"
+    sparse = authenticated_user.get(f"{url}?fields=name,created_at")
+    expanded = authenticated_user.get(f"{url}?fields=name&expand=signers")
+    full = authenticated_user.get(url)
+    unknown = authenticated_user.get(f"{url}?fields=name,secret")
+
+    assert list(sparse.data) == ["name", "created_at"]
+    assert list(expanded.data) == ["name", "signers"]
+    assert full.data == DocumentSerializer(test_document).data
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_get_document_rejects_unknown_query_parameters(authenticated_user, test_document):
+    """
+    Test that a misspelled query parameter on the detail endpoint is rejected with 400 instead of
+    silently returning the full payload.
+    """
+    response = authenticated_user.get(f"/api/v1/documents/{test_document.id}/?field=name")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "field" in str(response.data)
+
+
+@pytest.mark.django_db
+def test_orjson_renderer_and_parser_match_stock_json(authenticated_user, test_document, signers):
+    """
+    Test that the orjson renderer produces the same bytes as JSONRenderer, for a document list and for
+    the types DRF's encoder handles, and that the orjson parser reads them back like JSONParser.
+    """
+    list_data = authenticated_user.get("/api/v1/documents/").data
+    edge_cases = {
+        "aware": timezone.make_aware(datetime(2024, 1, 2, 3, 4, 5, 678901)),
+        "naive": datetime(2024, 1, 2, 3, 4, 5),
+        "date": datetime(2024, 1, 2).date(),
+        "time": datetime(2024, 1, 2, 3, 4, 5, 6).time(),
+        "delta": timedelta(minutes=90),
+        "decimal": Decimal("12.50"),
+        "uuid": uuid.UUID("123e4567-e89b-12d3-a456-426614174000"),
+        "lazy": gettext_lazy("Hello"),
+        "text": "Assinatura\u2028João\u2029✓",
+        "tuple": (1, 2.5, None, True),
+        "queryset": Document.objects.values_list("name", flat=True),
+    }
+    fallbacks = {"int_keys": {1: "one"}, "big": 2 ** 70}
+
+    for data in (list_data, edge_cases, fallbacks):
+        expected = JSONRenderer().render(data)
+        assert ORJSONRenderer().render(data) == expected
+    for data in (list_data, edge_cases):
+        expected = JSONRenderer().render(data)
+        assert ORJSONParser().parse(io.BytesIO(expected)) == JSONParser().parse(io.BytesIO(expected))
+    exponent_floats = [1e16, 1e-7]
+    assert json.loads(ORJSONRenderer().render(exponent_floats)) == json.loads(JSONRenderer().render(exponent_floats))
+    assert ORJSONRenderer().render(list_data, "application/json; indent=4") == JSONRenderer().render(
+        list_data, "application/json; indent=4"
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_update_documents_reports_each_id(authenticated_user):
+    """
+    Test that a bulk PATCH updates only the company's documents, with a query count independent of
+    the number of documents, and reports missing or foreign IDs as not_found.
+    """
+    company = authenticated_user.handler._force_user
+    other_company = Company.objects.create(email="other@company.com", name="Other", api_token="other-token")
+    documents = Document.objects.bulk_create(
+        [Document(name=f"Doc {index}", status="pending", company=company) for index in range(50)]
+    )
+    foreign = Document.objects.create(name="Foreign", status="pending", company=other_company)
+
+    def patch_status(document_ids, new_status):
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_user.patch(
+                "/api/v1/documents/bulk/", {"ids": document_ids, "changes": {"status": new_status}}, format="json"
+            )
+        return response, len(queries)
+
+    single, single_queries = patch_status([documents[0].id], "signed")
+    many, many_queries = patch_status([document.id for document in documents], "signed")
+    mixed, _ = patch_status([documents[0].id, foreign.id, 999999], "refused")
+
+    assert single.status_code == many.status_code == status.HTTP_200_OK
+    assert single_queries == many_queries
+    assert Document.objects.filter(company=company, status="signed").count() == 49
+    assert mixed.status_code == status.HTTP_207_MULTI_STATUS
+    assert mixed.data == [
+        {"id": documents[0].id, "status": "updated"},
+        {"id": foreign.id, "status": "not_found"},
+        {"id": 999999, "status": "not_found"},
+    ]
+    assert Document.objects.get(id=foreign.id).status == "pending"
+
+
+@pytest.mark.django_db
+def test_bulk_delete_documents_by_filter(authenticated_user, test_document, signers):
+    """
+    Test that a bulk DELETE by filter removes the matching documents with their signers.
+    """
+    company = authenticated_user.handler._force_user
+    kept = Document.objects.create(name="Kept", status="signed", company=company)
+    Document.objects.filter(id=test_document.id).update(status="pending")
+
+    response = authenticated_user.delete(
+        "/api/v1/documents/bulk/", {"filter": {"status": "pending"}}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [{"id": test_document.id, "status": "deleted"}]
+    assert list(Document.objects.filter(company=company).values_list("id", flat=True)) == [kept.id]
+    assert not Signer.objects.filter(id__in=[signer.id for signer in signers]).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_documents_rejects_invalid_selections(settings, authenticated_user):
+    """
+    Test that selections with both or neither of ids and filter, an empty filter,
+    or a filter matching more than API_BULK_MAX_SIZE documents are rejected with 400.
+    """
+    settings.API_BULK_MAX_SIZE = 1
+    company = authenticated_user.handler._force_user
+    Document.objects.bulk_create(
+        [Document(name=f"Doc {index}", status="pending", company=company) for index in range(2)]
+    )
+    url = "/api/v1/documents/bulk/"
+
+    both = authenticated_user.delete(url, {"ids": [1], "filter": {"status": "pending"}}, format="json")
+    neither = authenticated_user.delete(url, {}, format="json")
+    empty_filter = authenticated_user.delete(url, {"filter": {}}, format="json")
+    too_large = authenticated_user.delete(url, {"filter": {"status": "pending"}}, format="json")
+
+    for response in (both, neither, empty_filter, too_large):
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert Document.objects.filter(company=company).count() == 2
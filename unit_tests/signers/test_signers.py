@@ -1,6 +1,14 @@
+import uuid
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
+from apps.companies.models import Company
+from apps.documents.models import Document
+from apps.signers.models import Signer
+
 
 @pytest.mark.django_db
 def test_list_signers_success(authenticated_user, test_document, signers):
@@ -15,6 +23,54 @@ def test_list_signers_success(authenticated_user, test_document, signers):
     assert response.data[1]["name"] == signers[1].name
 
 
+@pytest.mark.django_db
+def test_list_signers_is_paginated(authenticated_user, test_document, signers):
+    """
+    Test that signers are listed one page at a time with a link to the next page.
+    """
+    first_page = authenticated_user.get(f"/api/v1/signers/document/{test_document.id}/?page_size=1")
+
+    assert [signer["id"] for signer in first_page.data] == [signers[0].id]
+    assert 'rel="next"' in first_page["Link"]
+
+    second_page = authenticated_user.get(
+        f"/api/v1/signers/document/{test_document.id}/?page_size=1&cursor={first_page['X-Next-Cursor']}"
+    )
+
+    assert [signer["id"] for signer in second_page.data] == [signers[1].id]
+    assert "X-Next-Cursor" not in second_page
+
+
+@pytest.mark.django_db
+def test_list_signers_answers_not_modified_until_a_signer_is_added(authenticated_user, test_document, signers):
+    """
+    Test that polling the signers of an unchanged document gets a 304, and that adding a signer changes the ETag.
+    """
+    url = f"/api/v1/signers/document/{test_document.id}/"
+    etag = authenticated_user.get(url)["ETag"]
+
+    not_modified = authenticated_user.get(url, HTTP_IF_NONE_MATCH=etag)
+    authenticated_user.post(url, [{"name": "New Signer", "email": "new@example.com"}], format="json")
+    changed = authenticated_user.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed.status_code == status.HTTP_200_OK
+    assert len(changed.data) == 3
+
+
+@pytest.mark.django_db
+def test_list_signers_of_another_companys_document_returns_not_found(authenticated_user):
+    """
+    Test that listing the signers of another company's document answers 404, not revealing that it exists.
+    """
+    other_company = Company.objects.create(email="other@company.com", name="Other", api_token=str(uuid.uuid4()))
+    foreign_document = Document.objects.create(name="Foreign", company=other_company)
+
+    response = authenticated_user.get(f"/api/v1/signers/document/{foreign_document.id}/")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 def test_create_signer_success(authenticated_user, test_document):
     """
@@ -46,6 +102,36 @@ def test_get_signer_success(authenticated_user, test_signer):
     assert response.data["email"] == test_signer.email
 
 
+@pytest.mark.django_db
+def test_get_signer_checks_ownership_in_one_query(authenticated_user, test_signer, django_assert_num_queries):
+    """
+    Test that loading a signer and checking its company takes a single query.
+    """
+    with django_assert_num_queries(1):
+        response = authenticated_user.get(f"/api/v1/signers/{test_signer.id}/")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_get_signer_distinguishes_missing_and_foreign_signers(authenticated_user):
+    """
+    Test that a missing signer returns 404 and another company's signer returns 403.
+    """
+    other_company = Company.objects.create_user(
+        email=f"other_{uuid.uuid4()}@company.com", password="securepassword", name="Other Company",
+        api_token=str(uuid.uuid4()),
+    )
+    other_document = Document.objects.create(name="Other Document", company=other_company)
+    other_signer = Signer.objects.create(name="Other Signer", email="other@signer.com", document=other_document)
+
+    missing = authenticated_user.get(f"/api/v1/signers/{other_signer.id + 1000}/")
+    foreign = authenticated_user.get(f"/api/v1/signers/{other_signer.id}/")
+
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+    assert foreign.status_code == status.HTTP_403_FORBIDDEN
+
+
 @pytest.mark.django_db
 def test_update_signer_success(authenticated_user, test_signer):
     """
@@ -69,3 +155,94 @@ def test_delete_signer_success(authenticated_user, test_signer):
     response = authenticated_user.delete(f"/api/v1/signers/{test_signer.id}/")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+def test_create_signers_queries_do_not_grow_with_signers(authenticated_user, test_document):
+    """
+    Test that creating many signers checks ownership once and inserts them together.
+    """
+    url = f"/api/v1/signers/document/{test_document.id}/"
+
+    def create(count):
+        payload = [{"name": f"Signer {index}", "email": f"signer{index}@example.com"} for index in range(count)]
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_user.post(url, payload, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == count
+        return len(queries)
+
+    assert create(2) == create(200)
+    assert Signer.objects.filter(document=test_document).count() == 202
+
+
+@pytest.mark.django_db
+def test_create_signers_is_all_or_nothing(authenticated_user, test_document):
+    """
+    Test that one invalid signer rejects the whole list without creating any signer.
+    """
+    payload = [
+        {"name": "Valid Signer", "email": "valid@example.com"},
+        {"name": "Invalid Signer", "email": "not-an-email"},
+    ]
+    response = authenticated_user.post(f"/api/v1/signers/document/{test_document.id}/", payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Signer.objects.filter(document=test_document).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_update_signers_by_filter(authenticated_user, test_document, signers):
+    """
+    Test that a bulk PATCH by document sets the status of all its signers.
+    """
+    response = authenticated_user.patch(
+        "/api/v1/signers/bulk/",
+        {"filter": {"document_id": test_document.id}, "changes": {"status": "signed"}},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [{"id": signer.id, "status": "updated"} for signer in signers]
+    assert set(Signer.objects.filter(document=test_document).values_list("status", flat=True)) == {"signed"}
+
+
+@pytest.mark.django_db
+def test_bulk_delete_signers_skips_foreign_signers(authenticated_user, signers):
+    """
+    Test that a bulk DELETE removes the company's signers and reports foreign ones as not_found.
+    """
+    other_company = Company.objects.create(email="other@company.com", name="Other", api_token=str(uuid.uuid4()))
+    foreign_document = Document.objects.create(name="Foreign", company=other_company)
+    foreign_signer = Signer.objects.create(name="Foreign", email="foreign@example.com", document=foreign_document)
+
+    response = authenticated_user.delete(
+        "/api/v1/signers/bulk/", {"ids": [signers[0].id, foreign_signer.id]}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    assert response.data == [
+        {"id": signers[0].id, "status": "deleted"},
+        {"id": foreign_signer.id, "status": "not_found"},
+    ]
+    assert not Signer.objects.filter(id=signers[0].id).exists()
+    assert Signer.objects.filter(id=foreign_signer.id).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_update_signers_locks_documents_before_signers(authenticated_user, test_document, signers):
+    """
+    Test that a signer bulk operation locks the parent documents before the signers,
+    in the same order as document bulk operations take them.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_user.patch(
+            "/api/v1/signers/bulk/", {"ids": [signer.id for signer in signers], "changes": {"status": "signed"}},
+            format="json",
+        )
+
+    locks = [query["sql"] for query in queries.captured_queries if "FOR UPDATE" in query["sql"]]
+    assert response.status_code == status.HTTP_200_OK
+    assert len(locks) == 2
+    assert locks[0].startswith(f'SELECT "{Document._meta.db_table}"."id"')
+    assert f'FOR UPDATE OF "{Signer._meta.db_table}"' in locks[1]
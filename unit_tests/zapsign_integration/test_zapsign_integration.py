@@ -0,0 +1,495 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+from django_redis.exceptions import ConnectionInterrupted
+
+from apps.zapsign_integration import session as zapsign_session
+from apps.zapsign_integration.async_service import AsyncZapSignService
+from apps.zapsign_integration.cache import ZapSignDocumentCache
+from apps.zapsign_integration.fake_server import FakeZapSignServer
+from apps.zapsign_integration.models import ZapSignWebhookEvent
+from apps.zapsign_integration.rate_limit import ZapSignRateLimiter
+from apps.zapsign_integration.resilience import Bulkhead, CircuitBreaker, RetryPolicy
+from apps.zapsign_integration.service import ZapSignService
+from apps.documents.service import DocumentService
+from utils.exceptions import ZapSignBulkheadFullException, ZapSignCircuitOpenException, ZapSignRateLimitedException
+
+
+@pytest.fixture
+def fresh_session():
+    """
+    Ensures every test starts without a pooled ZapSign session.
+    """
+    zapsign_session.close_session()
+    yield
+    zapsign_session.close_session()
+
+
+def test_services_share_pooled_session(fresh_session):
+    """
+    Test that every ZapSignService in a process reuses the same pooled session.
+    """
+    assert ZapSignService().session is ZapSignService().session
+
+
+def test_session_is_rebuilt_after_fork(fresh_session):
+    """
+    Test that a forked process does not reuse the parent's pooled session.
+    """
+    parent_session = zapsign_session.get_session()
+
+    with patch("apps.zapsign_integration.session.os.getpid", return_value=-1):
+        child_session = zapsign_session.get_session()
+
+    assert child_session is not parent_session
+
+
+def test_get_document_uses_session_with_timeouts(settings):
+    """
+    Test that requests go through the session with the configured timeouts.
+    """
+    settings.ZAPSIGN_CONNECT_TIMEOUT = 1.5
+    settings.ZAPSIGN_READ_TIMEOUT = 9.0
+    session = MagicMock()
+    session.request.return_value.status_code = 200
+    session.request.return_value.json.return_value = {"token": "doc-token"}
+
+    service = ZapSignService(api_base_url="https://zapsign.test/api/v1", api_token="token", session=session)
+    response = service.get_document("doc-token")
+
+    assert response == {"token": "doc-token"}
+    session.request.assert_called_once_with(
+        "GET",
+        "https://zapsign.test/api/v1/docs/doc-token/",
+        headers=service.get_headers(),
+        timeout=(1.5, 9.0),
+    )
+
+
+def test_async_service_creates_document():
+    """
+    Test that the async service posts to ZapSign and returns the parsed response.
+    """
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(201, json={"token": "doc-token", "status": "pending"})
+
+    async def create():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = AsyncZapSignService(api_base_url="https://zapsign.test/api/v1", api_token="token", client=client)
+            return await service.create_document_in_zapsign(
+                name="Contract", signers=[{"name": "Signer"}], url_pdf="https://example.com/doc.pdf"
+            )
+
+    response = asyncio.run(create())
+
+    assert response == {"token": "doc-token", "status": "pending"}
+    assert str(requests_seen[0].url) == "https://zapsign.test/api/v1/docs/"
+    assert requests_seen[0].headers["Authorization"] == "Bearer token"
+
+
+def test_async_service_goes_through_the_rate_limiter_and_circuit_breaker():
+    """
+    Test that async calls are refused by an exhausted rate limit or an open circuit without reaching ZapSign.
+    """
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={})
+
+    limiter = ZapSignRateLimiter(rate=1, burst=1, max_wait=0)
+    breaker = CircuitBreaker(name="test-async", failure_threshold=1, failure_window=60, reset_timeout=60)
+
+    async def fetch(service):
+        return await service.get_document("doc-token")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = AsyncZapSignService(
+                api_base_url="https://zapsign.test/api/v1", api_token="token", client=client,
+                circuit_breaker=breaker, rate_limiter=limiter,
+            )
+            with patch.object(limiter, "try_acquire", return_value=5.0):
+                with pytest.raises(ZapSignRateLimitedException):
+                    await fetch(service)
+            breaker.record_failure()
+            with pytest.raises(ZapSignCircuitOpenException):
+                await fetch(service)
+
+    asyncio.run(run())
+
+    assert requests_seen == []
+
+
+def test_async_client_is_pooled_per_event_loop():
+    """
+    Test that calls on the same event loop share one client and other loops get their own.
+    """
+    async def clients():
+        first, second = zapsign_session.get_async_client(), zapsign_session.get_async_client()
+        await zapsign_session.close_async_client()
+        return first, second
+
+    first, second = asyncio.run(clients())
+    other, _ = asyncio.run(clients())
+
+    assert first is second
+    assert other is not first
+
+
+def test_get_document_is_read_through_cached():
+    """
+    Test that repeated lookups are served from the cache and counted as hits.
+    """
+    session = MagicMock()
+    session.request.return_value.status_code = 200
+    session.request.return_value.json.return_value = {"token": "doc-token", "status": "pending"}
+    service = ZapSignService(api_base_url="https://zapsign.test/api/v1", api_token="token", session=session)
+
+    first = service.get_document("doc-token")
+    second = service.get_document("doc-token")
+
+    assert first == second == {"token": "doc-token", "status": "pending"}
+    assert session.request.call_count == 1
+    stats = service.document_cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    service.invalidate_document("doc-token")
+    service.get_document("doc-token")
+
+    assert session.request.call_count == 2
+
+
+def test_document_cache_keeps_final_statuses_longer():
+    """
+    Test that the TTL of an entry depends on the document status.
+    """
+    cache = ZapSignDocumentCache(timeout=60, final_status_timeout=3600)
+
+    assert cache.get_timeout_for({"status": "pending"}) == 60
+    assert cache.get_timeout_for({"status": "signed"}) == 3600
+
+
+@pytest.mark.django_db
+def test_webhook_applies_statuses_and_deduplicates(settings, api_client, test_document, test_signer):
+    """
+    Test that webhook events update documents and signers by token and are applied once.
+    """
+    settings.ZAPSIGN_WEBHOOK_SECRET = "webhook-secret"
+    test_document.token = "doc-token"
+    test_document.save()
+    events = [
+        {"event_id": "evt-1", "event_type": "doc_signed", "token": "doc-token", "status": "signed",
+         "signers": [{"token": test_signer.token, "status": "signed"}]},
+    ]
+
+    first = api_client.post(
+        "/api/v1/zapsign/webhooks/", events, format="json", HTTP_X_ZAPSIGN_WEBHOOK_SECRET="webhook-secret"
+    )
+    second = api_client.post(
+        "/api/v1/zapsign/webhooks/", events[0], format="json", HTTP_X_ZAPSIGN_WEBHOOK_SECRET="webhook-secret"
+    )
+
+    assert first.status_code == 200
+    assert first.data == {"received": 1, "duplicates": 0, "documents_updated": 1, "signers_updated": 1}
+    assert second.data["duplicates"] == 1
+    assert second.data["documents_updated"] == 0
+    test_document.refresh_from_db()
+    test_signer.refresh_from_db()
+    assert test_document.status == "signed"
+    assert test_signer.status == "signed"
+    assert ZapSignWebhookEvent.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_webhook_never_moves_a_document_out_of_a_final_status(settings, api_client, test_document, test_signer):
+    """
+    Test that a late-delivered older event, in the same batch or a later one,
+    does not move a signed document or signer back to an earlier status.
+    """
+    settings.ZAPSIGN_WEBHOOK_SECRET = "webhook-secret"
+    test_document.token = "doc-token"
+    test_document.save()
+    signed = {"event_id": "evt-signed", "token": "doc-token", "status": "signed",
+              "signers": [{"token": test_signer.token, "status": "signed"}]}
+    late = {"event_id": "evt-late", "token": "doc-token", "status": "pending",
+            "signers": [{"token": test_signer.token, "status": "pending"}]}
+    later = {**late, "event_id": "evt-later"}
+
+    same_batch = api_client.post(
+        "/api/v1/zapsign/webhooks/", [signed, late], format="json", HTTP_X_ZAPSIGN_WEBHOOK_SECRET="webhook-secret"
+    )
+    next_batch = api_client.post(
+        "/api/v1/zapsign/webhooks/", [later], format="json", HTTP_X_ZAPSIGN_WEBHOOK_SECRET="webhook-secret"
+    )
+
+    test_document.refresh_from_db()
+    test_signer.refresh_from_db()
+    assert same_batch.data["documents_updated"] == 1
+    assert next_batch.data["documents_updated"] == 0
+    assert next_batch.data["signers_updated"] == 0
+    assert test_document.status == "signed"
+    assert test_signer.status == "signed"
+
+
+@pytest.mark.django_db
+def test_webhook_batch_uses_constant_number_of_queries(settings, api_client, django_assert_num_queries):
+    """
+    Test that a batch of events is applied with bulk updates instead of one query per event.
+    """
+    settings.ZAPSIGN_WEBHOOK_SECRET = "webhook-secret"
+    events = [
+        {"event_id": f"evt-{i}", "token": f"doc-{i}", "status": "signed" if i % 2 else "refused"}
+        for i in range(20)
+    ]
+
+    with django_assert_num_queries(6):
+        response = api_client.post(
+            "/api/v1/zapsign/webhooks/", events, format="json", HTTP_X_ZAPSIGN_WEBHOOK_SECRET="webhook-secret"
+        )
+
+    assert response.data["received"] == 20
+
+
+@pytest.mark.django_db
+def test_webhook_rejects_requests_without_secret(settings, api_client):
+    """
+    Test that webhook calls without the shared secret are rejected.
+    """
+    settings.ZAPSIGN_WEBHOOK_SECRET = "webhook-secret"
+
+    response = api_client.post("/api/v1/zapsign/webhooks/", {"token": "doc-token", "status": "signed"}, format="json")
+
+    assert response.status_code == 403
+
+
+def make_response(status_code, json_data=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = json_data
+    return response
+
+
+def test_idempotent_calls_are_retried_on_server_errors():
+    """
+    Test that GET requests are retried after a 5xx and eventually succeed.
+    """
+    session = MagicMock()
+    session.request.side_effect = [make_response(503), make_response(200, {"token": "doc-token"})]
+    service = ZapSignService(
+        api_base_url="https://zapsign.test/api/v1", api_token="token", session=session,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0, max_delay=0),
+    )
+
+    assert service.fetch_document("doc-token") == {"token": "doc-token"}
+    assert session.request.call_count == 2
+
+
+def test_document_creation_is_not_retried():
+    """
+    Test that POST requests are sent only once, even when ZapSign fails.
+    """
+    session = MagicMock()
+    session.request.return_value = make_response(503)
+    service = ZapSignService(
+        api_base_url="https://zapsign.test/api/v1", api_token="token", session=session,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0, max_delay=0),
+    )
+
+    response = service._request("POST", "docs/", json={})
+
+    assert response.status_code == 503
+    assert session.request.call_count == 1
+
+
+def test_request_is_sent_once_when_retries_are_disabled(settings):
+    """
+    Test that ZAPSIGN_RETRY_MAX_ATTEMPTS=0 still sends the request once instead of returning nothing.
+    """
+    settings.ZAPSIGN_RETRY_MAX_ATTEMPTS = 0
+    session = MagicMock()
+    session.request.return_value = MagicMock(status_code=200)
+    service = ZapSignService(api_base_url="https://zapsign.test/api/v1", api_token="token", session=session)
+
+    response = service._request("GET", "docs/doc-token/")
+
+    assert response is session.request.return_value
+    assert session.request.call_count == 1
+
+
+def test_circuit_breaker_opens_and_fails_fast():
+    """
+    Test that the breaker opens after repeated failures and then rejects calls without hitting ZapSign.
+    """
+    session = MagicMock()
+    session.request.side_effect = requests.ConnectionError("connection refused")
+    breaker = CircuitBreaker(name="test", failure_threshold=2, failure_window=60, reset_timeout=60)
+    service = ZapSignService(
+        api_base_url="https://zapsign.test/api/v1", api_token="token", session=session,
+        retry_policy=RetryPolicy(max_attempts=1), circuit_breaker=breaker,
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            service.fetch_document("doc-token")
+
+    with pytest.raises(ZapSignCircuitOpenException):
+        service.fetch_document("doc-token")
+
+    assert session.request.call_count == 2
+    assert service.get_metrics()["circuit_breaker"]["state"] == "open"
+
+
+def test_circuit_breaker_closes_after_successful_probe():
+    """
+    Test that a half-open breaker lets one probe through and closes when it succeeds.
+    """
+    breaker = CircuitBreaker(name="test-probe", failure_threshold=1, failure_window=60, reset_timeout=0)
+    breaker.record_failure()
+
+    breaker.before_call()
+    with pytest.raises(ZapSignCircuitOpenException):
+        breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.get_state() == "closed"
+
+
+def test_circuit_breaker_fails_open_when_the_cache_is_down():
+    """
+    Test that a cache outage lets calls through instead of failing every ZapSign call.
+    """
+    cache = MagicMock()
+    for method in ("get", "get_many", "add", "incr", "set", "delete", "delete_many"):
+        getattr(cache, method).side_effect = ConnectionInterrupted(connection=None)
+    breaker = CircuitBreaker(name="test-outage")
+
+    with patch.object(CircuitBreaker, "cache", cache):
+        breaker.before_call()
+        breaker.record_failure()
+        breaker.record_success()
+
+
+def test_circuit_breaker_success_on_a_closed_circuit_only_reads():
+    """
+    Test that a success on a closed circuit without failures does not write to the cache.
+    """
+    breaker = CircuitBreaker(name="test-closed")
+
+    with patch.object(breaker.cache, "delete_many") as delete_many:
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+
+    assert delete_many.call_count == 1
+
+
+def test_bulkhead_rejects_calls_over_the_limit():
+    """
+    Test that calls beyond the concurrency limit are rejected.
+    """
+    bulkhead = Bulkhead(max_concurrent_calls=1, timeout=0)
+
+    with bulkhead:
+        with pytest.raises(ZapSignBulkheadFullException):
+            with bulkhead:
+                pass
+
+    assert bulkhead.in_flight == 0
+
+
+def test_rate_limiter_waits_for_a_token_per_credential():
+    """
+    Test that the limiter sleeps for the wait returned by the bucket script and
+    keys buckets by a hash of the credential rather than the credential itself.
+    """
+    limiter = ZapSignRateLimiter(rate=10, burst=1, max_wait=1)
+    script = MagicMock(side_effect=["0.1", "0"])
+
+    with patch.object(limiter, "get_script", return_value=script), \
+            patch("apps.zapsign_integration.rate_limit.time.sleep") as sleep:
+        limiter.acquire("company-token")
+
+    sleep.assert_called_once_with(0.1)
+    key = script.call_args.kwargs["keys"][0]
+    assert key == ZapSignRateLimiter.make_key("company-token")
+    assert "company-token" not in key
+    assert key != ZapSignRateLimiter.make_key("other-token")
+
+
+def test_rate_limiter_gives_up_after_max_wait():
+    """
+    Test that the limiter raises instead of waiting longer than allowed, before any call is sent.
+    """
+    session = MagicMock()
+    limiter = ZapSignRateLimiter(rate=1, burst=1, max_wait=0.5)
+    service = ZapSignService(
+        api_base_url="https://zapsign.test/api/v1", api_token="token", session=session, rate_limiter=limiter,
+    )
+
+    with patch.object(limiter, "get_script", return_value=MagicMock(return_value="2.0")):
+        with pytest.raises(ZapSignRateLimitedException):
+            service.fetch_document("doc-token")
+
+    session.request.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_company_api_token_is_used_when_enabled(settings, test_company):
+    """
+    Test that, when enabled, ZapSign calls made for a company use its own API token
+    while sharing the process-wide resilience components.
+    """
+    service = DocumentService()
+
+    settings.ZAPSIGN_USE_COMPANY_API_TOKEN = False
+    assert service.get_zap_sign_service(test_company).api_token == settings.ZAPSIGN_API_TOKEN
+
+    settings.ZAPSIGN_USE_COMPANY_API_TOKEN = True
+    company_service = service.get_zap_sign_service(test_company)
+    assert company_service.api_token == test_company.api_token
+    assert company_service.bulkhead is service.zap_sign_service.bulkhead
+    assert company_service.rate_limiter is service.zap_sign_service.rate_limiter
+
+
+def test_fake_server_round_trip():
+    """
+    Test that ZapSignService can create, fetch and delete documents on the fake server.
+    """
+    with FakeZapSignServer() as server:
+        service = ZapSignService(api_base_url=server.base_url, api_token="token")
+        response = service._request("POST", "docs/", json={
+            "name": "Contract",
+            "url_pdf": "https://example.com/doc.pdf",
+            "signers": [{"name": "Signer", "email": "signer@example.com"}],
+        })
+        created = response.json()
+
+        fetched = service.get_document(created["token"])
+        service.delete_document(created["token"])
+
+    assert response.status_code == 201
+    assert created["created_by"]["email"]
+    assert created["signers"][0]["email"] == "signer@example.com"
+    assert fetched["token"] == created["token"]
+    assert created["token"] not in server.httpd.documents
+
+
+def test_fake_server_injects_errors():
+    """
+    Test that the fake server answers with the configured error status.
+    """
+    with FakeZapSignServer(error_rate=1.0, error_status=502) as server:
+        service = ZapSignService(
+            api_base_url=server.base_url, api_token="token", retry_policy=RetryPolicy(max_attempts=1),
+        )
+        response = service._request("GET", "docs/missing/")
+
+    assert response.status_code == 502
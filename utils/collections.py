@@ -0,0 +1,32 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+def group_tokens_by_status(status_by_token: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Invert a token -> status mapping so each distinct status can be applied with a single UPDATE.
+    """
+    tokens_by_status = defaultdict(list)
+    for token, status in status_by_token.items():
+        tokens_by_status[status].append(token)
+    return dict(tokens_by_status)
+
+
+def build_bulk_results(
+        requested_ids: Optional[List[int]],
+        found_ids: List[int],
+        outcome: str,
+        missing: str
+) -> List[dict]:
+    """
+    One `{"id", "status"}` result per requested ID, in request order: `outcome` for the IDs
+    that were found and `missing` for the others. Without requested IDs (a filter
+    selection), one `outcome` result per found ID.
+    """
+    if requested_ids is None:
+        return [{"id": found_id, "status": outcome} for found_id in found_ids]
+    found = set(found_ids)
+    return [
+        {"id": requested_id, "status": outcome if requested_id in found else missing}
+        for requested_id in requested_ids
+    ]
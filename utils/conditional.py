@@ -0,0 +1,38 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def build_etag(request, *parts) -> str:
+    """
+    Returns a strong ETag built from the given version parts and the request's
+    query string, so different pages or filters of a resource get different tags.
+    """
+    raw = "|".join(str(part) for part in (*parts, request.META.get("QUERY_STRING", "")))
+    return quote_etag(hashlib.sha256(raw.encode()).hexdigest()[:32])
+
+
+def get_not_modified_response(request, etag: str, last_modified: Optional[datetime]):
+    """
+    Returns a 304 response carrying the validators when the client's copy is still
+    current (If-None-Match / If-Modified-Since), otherwise None.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: str, last_modified: Optional[datetime]):
+    """
+    Sets the ETag and Last-Modified headers and asks caches to revalidate before reuse.
+    """
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,94 @@
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY_PIN_CACHE_PREFIX = "db:primary-pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Set for the duration of a request whose reads may be served by a replica.
+# Anything running outside such a request (Celery tasks, management commands,
+# unsafe methods) keeps reading from the primary.
+_replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to a random replica from DATABASE_REPLICAS and everything else to the primary.
+
+    Reads only go to a replica when the current request allows it and no
+    transaction is open on the primary, so a read inside a transaction always
+    sees that transaction's writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or not _replica_reads_allowed.get():
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads(allowed: bool = True):
+    """
+    Allows (or forbids) replica reads for the enclosed block.
+    """
+    token = _replica_reads_allowed.set(allowed)
+    try:
+        yield
+    finally:
+        _replica_reads_allowed.reset(token)
+
+
+class ReadReplicaMiddleware:
+    """
+    Lets safe requests read from the replicas, except right after the same
+    client wrote something.
+
+    A successful unsafe request pins its client to the primary for
+    DATABASE_REPLICA_PIN_SECONDS, which covers the replication lag, so the
+    client always reads its own writes. Clients are told apart by a hash of
+    their Authorization header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def get_pin_key(request):
+        authorization = request.META.get("HTTP_AUTHORIZATION")
+        if not authorization:
+            return None
+        return f"{PRIMARY_PIN_CACHE_PREFIX}:{hashlib.sha256(authorization.encode()).hexdigest()}"
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        pin_key = self.get_pin_key(request)
+        if request.method not in SAFE_METHODS:
+            with replica_reads(False):
+                response = self.get_response(request)
+            if pin_key and response.status_code < 400:
+                cache.set(pin_key, True, settings.DATABASE_REPLICA_PIN_SECONDS)
+            return response
+
+        pinned = pin_key is not None and cache.get(pin_key, False)
+        with replica_reads(not pinned):
+            return self.get_response(request)
@@ -57,6 +57,14 @@ class UnauthorizedDocumentAccessException(ExceptionMessageBuilder):
         self.detail = {"title": self.title, "message": self.message}
 
 
+class DocumentNotInZapSignException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Document Not In ZapSign"
+        self.message = "The document has not been created in ZapSign yet."
+        self.status_code = status.HTTP_409_CONFLICT
+        self.detail = {"title": self.title, "message": self.message}
+
+
 class SignerNotFoundException(ExceptionMessageBuilder):
     def __init__(self):
         self.title = "Signer Not Found"
@@ -89,6 +97,30 @@ class FailedToCreateDocumentInZapSignException(ExceptionMessageBuilder):
         self.detail = {"title": self.title, "message": self.message}
 
 
+class ZapSignCircuitOpenException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "ZapSign Unavailable"
+        self.message = "The ZapSign API is failing; requests are paused for a short time. Please try again later."
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class ZapSignBulkheadFullException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Too Many ZapSign Requests"
+        self.message = "Too many requests to the ZapSign API are in progress. Please try again later."
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class ZapSignRateLimitedException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "ZapSign Rate Limit Reached"
+        self.message = "Too many requests were sent to the ZapSign API for this account. Please try again later."
+        self.status_code = status.HTTP_429_TOO_MANY_REQUESTS
+        self.detail = {"title": self.title, "message": self.message}
+
+
 class MissingZapSignResponseFieldsException(ExceptionMessageBuilder):
     def __init__(self):
         self.title = "Missing Fields in ZapSign Response"
@@ -151,3 +183,43 @@ class RegistrationFailedException(ExceptionMessageBuilder):
         self.message = "An unexpected error occurred during registration."
         self.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         self.detail = {"title": self.title, "message": self.message}
+
+
+class InvalidIdempotencyKeyException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Invalid Idempotency Key"
+        self.message = "The Idempotency-Key header must be a non-empty string of at most 255 characters."
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class IdempotencyKeyInUseException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Idempotency Key In Use"
+        self.message = "A request with this Idempotency-Key is still being processed. Please retry later."
+        self.status_code = status.HTTP_409_CONFLICT
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class IdempotencyKeyReusedException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Idempotency Key Reused"
+        self.message = "This Idempotency-Key was already used with a different request payload."
+        self.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class InvalidCursorException(ExceptionMessageBuilder):
+    def __init__(self):
+        self.title = "Invalid Cursor"
+        self.message = "The pagination cursor is invalid. Use the cursor returned with the previous page."
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = {"title": self.title, "message": self.message}
+
+
+class BulkSelectionTooLargeException(ExceptionMessageBuilder):
+    def __init__(self, max_size: int):
+        self.title = "Selection Too Large"
+        self.message = f"The filter matches more than {max_size} items. Narrow it down or select the items by id."
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = {"title": self.title, "message": self.message}
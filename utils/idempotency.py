@@ -0,0 +1,198 @@
+import functools
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis import get_redis_connection
+from drf_yasg import openapi
+from rest_framework.response import Response
+
+from utils.exceptions import InvalidIdempotencyKeyException, IdempotencyKeyInUseException, \
+    IdempotencyKeyReusedException
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+POLL_INTERVAL = 0.05
+
+# Deletes a lock only while it still holds the caller's value, so a request that
+# outlived its lock never releases the lock a later request has taken since.
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+IDEMPOTENCY_KEY_PARAMETER = openapi.Parameter(
+    IDEMPOTENCY_KEY_HEADER,
+    openapi.IN_HEADER,
+    type=openapi.TYPE_STRING,
+    required=False,
+    description=(
+        "Client-generated key that makes the request safe to retry. Retries with the same key "
+        "and payload return the stored response instead of creating the resource again."
+    ),
+)
+
+
+class IdempotencyStore:
+    """
+    Stores the first response of each Idempotency-Key in the Django cache, so
+    every web process sees it, and serialises concurrent requests with the same key.
+    """
+
+    def __init__(
+            self,
+            cache_alias: str = "default",
+            timeout: Optional[int] = None,
+            lock_timeout: Optional[int] = None,
+            wait_timeout: Optional[float] = None
+    ):
+        self.cache_alias = cache_alias
+        self.timeout = timeout if timeout is not None else settings.IDEMPOTENCY_KEY_TTL
+        self.lock_timeout = lock_timeout if lock_timeout is not None else settings.IDEMPOTENCY_LOCK_TIMEOUT
+        self.wait_timeout = wait_timeout if wait_timeout is not None else settings.IDEMPOTENCY_WAIT_TIMEOUT
+        self._release_script = None
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @staticmethod
+    def make_scope(owner_id, method: str, path: str, idempotency_key: str) -> str:
+        """
+        Returns the cache scope of a key. Keys are only unique per client and endpoint.
+        """
+        raw = f"{owner_id}:{method}:{path}:{idempotency_key}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def fingerprint(data) -> str:
+        """
+        Returns a hash of the request payload, used to detect a key reused for another request.
+        """
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_response(self, scope: str) -> Optional[dict]:
+        """
+        Returns the stored response of a scope, if any.
+        """
+        return self.cache.get(f"idempotency:response:{scope}")
+
+    def save_response(self, scope: str, fingerprint: str, response: Response) -> None:
+        """
+        Stores a response so later retries with the same key can replay it.
+        """
+        self.cache.set(
+            f"idempotency:response:{scope}",
+            {"fingerprint": fingerprint, "status": response.status_code, "data": response.data},
+            self.timeout,
+        )
+
+    def acquire(self, scope: str, fingerprint: str) -> Optional[str]:
+        """
+        Takes the in-flight lock of a scope. The lock holds a token unique to this
+        request next to the payload fingerprint. Returns the lock value, to pass to
+        `release`, or None when another request holds the lock.
+        """
+        lock = f"{uuid.uuid4().hex}:{fingerprint}"
+        return lock if self.cache.add(f"idempotency:lock:{scope}", lock, self.lock_timeout) else None
+
+    def get_lock_fingerprint(self, scope: str) -> Optional[str]:
+        """
+        Returns the payload fingerprint of the request holding the lock, if any.
+        """
+        lock = self.cache.get(f"idempotency:lock:{scope}")
+        return lock.partition(":")[2] if lock is not None else None
+
+    def get_release_script(self):
+        """
+        Returns the registered release script, or None when the cache is not Redis.
+        """
+        if self._release_script is None:
+            try:
+                connection = get_redis_connection(self.cache_alias)
+            except NotImplementedError:
+                return None
+            self._release_script = connection.register_script(RELEASE_LOCK_SCRIPT)
+        return self._release_script
+
+    def release(self, scope: str, lock: str) -> None:
+        """
+        Releases the in-flight lock of a scope, unless it expired and another request took it.
+        """
+        key = f"idempotency:lock:{scope}"
+        script = self.get_release_script()
+        if script is None:
+            if self.cache.get(key) == lock:
+                self.cache.delete(key)
+            return
+        script(keys=[self.cache.make_key(key)], args=[self.cache.client.encode(lock)])
+
+
+def replay(stored: dict, fingerprint: str) -> Response:
+    """
+    Rebuilds a stored response, refusing to replay it for a different payload.
+    """
+    if stored["fingerprint"] != fingerprint:
+        raise IdempotencyKeyReusedException()
+    return Response(stored["data"], status=stored["status"], headers={IDEMPOTENT_REPLAYED_HEADER: "true"})
+
+
+def idempotent(view_method):
+    """
+    Makes an APIView method honour the Idempotency-Key header.
+
+    The first response for a key is stored with a TTL and replayed to later
+    retries without running the view again. A duplicate arriving while the
+    first request is still running waits for its response, up to
+    IDEMPOTENCY_WAIT_TIMEOUT seconds. Server errors are not stored, so the
+    request can be retried with the same key. Requests without the header
+    are not affected.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is None:
+            return view_method(self, request, *args, **kwargs)
+        if not idempotency_key.strip() or len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise InvalidIdempotencyKeyException()
+
+        store = IdempotencyStore()
+        scope = store.make_scope(request.user.pk, request.method, request.path, idempotency_key)
+        fingerprint = store.fingerprint(request.data)
+
+        deadline = time.monotonic() + store.wait_timeout
+        while True:
+            stored = store.get_response(scope)
+            if stored is not None:
+                logger.info(f"Replaying stored response for Idempotency-Key on {request.path}.")
+                return replay(stored, fingerprint)
+            lock = store.acquire(scope, fingerprint)
+            if lock is not None:
+                break
+            lock_fingerprint = store.get_lock_fingerprint(scope)
+            if lock_fingerprint is not None and lock_fingerprint != fingerprint:
+                raise IdempotencyKeyReusedException()
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInUseException()
+            time.sleep(POLL_INTERVAL)
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code < 500:
+                store.save_response(scope, fingerprint, response)
+            return response
+        finally:
+            store.release(scope, lock)
+
+    return wrapper
@@ -0,0 +1,163 @@
+import base64
+import binascii
+import json
+from typing import List, Optional, Sequence
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+from drf_yasg import openapi
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from utils.exceptions import InvalidCursorException
+
+CURSOR_QUERY_PARAM = "cursor"
+PAGE_SIZE_QUERY_PARAM = "page_size"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_PARAMETER = openapi.Parameter(
+    CURSOR_QUERY_PARAM,
+    openapi.IN_QUERY,
+    type=openapi.TYPE_STRING,
+    required=False,
+    description="Opaque cursor of the page to fetch, taken from the X-Next-Cursor or Link header of the previous page.",
+)
+PAGE_SIZE_PARAMETER = openapi.Parameter(
+    PAGE_SIZE_QUERY_PARAM,
+    openapi.IN_QUERY,
+    type=openapi.TYPE_INTEGER,
+    required=False,
+    description="Number of items per page.",
+)
+
+
+class KeysetPagination:
+    """
+    Cursor pagination over a fixed ordering whose last field is unique.
+
+    Each page is fetched with a range condition on the ordering columns
+    instead of an OFFSET, so with a matching index every page costs the same
+    as the first one. The body stays a plain list; the cursor of the next
+    page is sent in the X-Next-Cursor and Link headers.
+    """
+
+    def __init__(
+            self,
+            ordering: Sequence[str] = ("-created_at", "-id"),
+            page_size: Optional[int] = None,
+            max_page_size: Optional[int] = None
+    ):
+        self.ordering = tuple(ordering)
+        self.page_size = page_size or settings.API_PAGE_SIZE
+        self.max_page_size = max_page_size or settings.API_MAX_PAGE_SIZE
+        self.next_cursor: Optional[str] = None
+        self.request = None
+
+    @property
+    def fields(self) -> List[str]:
+        return [field.lstrip("-") for field in self.ordering]
+
+    def paginate_queryset(self, queryset: QuerySet, request) -> list:
+        """
+        Returns the page of the queryset selected by the request's cursor.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(CURSOR_QUERY_PARAM)
+        if cursor:
+            queryset = self.filter_after_cursor(queryset, cursor)
+
+        items = list(queryset[:page_size + 1])
+        if len(items) > page_size:
+            items = items[:page_size]
+            self.next_cursor = self.encode_cursor(items[-1])
+        return items
+
+    def get_paginated_response(self, data) -> Response:
+        """
+        Returns the page body with the pagination headers.
+        """
+        response = Response(data)
+        if self.next_cursor:
+            next_url = replace_query_param(self.request.build_absolute_uri(), CURSOR_QUERY_PARAM, self.next_cursor)
+            response[NEXT_CURSOR_HEADER] = self.next_cursor
+            response["Link"] = f'<{next_url}>; rel="next"'
+        return response
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params.get(PAGE_SIZE_QUERY_PARAM, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def filter_after_cursor(self, queryset: QuerySet, cursor: str) -> QuerySet:
+        """
+        Returns the rows of the queryset after the cursor, raising InvalidCursorException
+        for any cursor whose values cannot be used in the query.
+        """
+        values = self.decode_cursor(cursor, queryset.model)
+        try:
+            return queryset.filter(self.build_filter(values))
+        except (ValueError, TypeError, ValidationError):
+            raise InvalidCursorException()
+
+    def build_filter(self, values: list) -> Q:
+        """
+        Returns the condition selecting the rows after the given ordering values.
+
+        For ("-created_at", "-id") this is `created_at <= c AND (created_at < c OR id < i)`;
+        the redundant bound on the first column lets the database use it as an index condition.
+        """
+        condition = Q()
+        for position in reversed(range(len(self.ordering))):
+            field = self.fields[position]
+            lookup = "lt" if self.ordering[position].startswith("-") else "gt"
+            after = Q(**{f"{field}__{lookup}": values[position]})
+            if position == len(self.ordering) - 1:
+                condition = after
+            else:
+                condition = after | (Q(**{field: values[position]}) & condition)
+
+        first_lookup = "lte" if self.ordering[0].startswith("-") else "gte"
+        return Q(**{f"{self.fields[0]}__{first_lookup}": values[0]}) & condition
+
+    def encode_cursor(self, item) -> str:
+        """
+        Returns the opaque cursor pointing after the given item, a model instance or a `values()` row.
+        """
+        if isinstance(item, dict):
+            values = [item[field] for field in self.fields]
+        else:
+            values = [getattr(item, field) for field in self.fields]
+        raw = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str, model) -> list:
+        """
+        Returns the ordering values stored in a cursor, converted to the model's field types.
+        Values of annotations (such as a search rank) are returned as decoded from JSON.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError("Unexpected cursor shape.")
+            if any(value is None or isinstance(value, (list, dict)) for value in values):
+                raise ValueError("Cursor values must be non-null scalars.")
+            return [self._to_python(model, field, value) for field, value in zip(self.fields, values)]
+        except (binascii.Error, ValueError, TypeError, ValidationError, UnicodeDecodeError):
+            raise InvalidCursorException()
+
+    @staticmethod
+    def _to_python(model, field: str, value):
+        try:
+            return model._meta.get_field(field).to_python(value)
+        except FieldDoesNotExist:
+            # Annotations used as orderings (such as search_rank) are integers.
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"Cursor value for {field} must be an integer.")
+            return value
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
 from rest_framework.permissions import BasePermission
 
 
@@ -8,3 +10,14 @@ class IsSuperUser(BasePermission):
 
     def has_permission(self, request, view):
         return request.user and request.user.is_superuser
+
+
+class HasZapSignWebhookSecret(BasePermission):
+    """
+    Allows access only to requests carrying the shared ZapSign webhook secret.
+    """
+
+    def has_permission(self, request, view):
+        secret = settings.ZAPSIGN_WEBHOOK_SECRET
+        provided = request.headers.get(settings.ZAPSIGN_WEBHOOK_SECRET_HEADER, "")
+        return bool(secret) and constant_time_compare(provided, secret)
@@ -0,0 +1,48 @@
+from typing import Iterable, List, Sequence, Tuple
+
+from rest_framework import serializers
+
+# Shared so datetimes are rendered exactly like a ModelSerializer renders them:
+# converted to the current time zone and formatted with REST_FRAMEWORK's DATETIME_FORMAT.
+DATETIME_FIELD = serializers.DateTimeField()
+
+
+class RowSerializer:
+    """
+    Renders rows fetched with `values()` into the dicts a ModelSerializer would
+    produce, for read paths too hot for per-instance serializers.
+
+    The mapping of output keys to row keys is resolved once, when the
+    serializer is built, instead of introspecting the model on every call.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, str]], datetime_fields: Sequence[str] = ()):
+        self.fields = tuple(fields)
+        self.row_keys = tuple(row_key for _, row_key in self.fields)
+        self.datetime_fields = tuple(
+            (output_key, row_key) for output_key, row_key in self.fields if output_key in datetime_fields
+        )
+
+    @property
+    def output_keys(self) -> Tuple[str, ...]:
+        return tuple(output_key for output_key, _ in self.fields)
+
+    def only(self, output_keys: Iterable[str]) -> "RowSerializer":
+        """
+        Returns a serializer rendering only the given keys, in this serializer's order.
+        """
+        output_keys = set(output_keys)
+        return RowSerializer(
+            [field for field in self.fields if field[0] in output_keys],
+            datetime_fields=[output_key for output_key, _ in self.datetime_fields if output_key in output_keys],
+        )
+
+    def to_representation(self, row: dict) -> dict:
+        data = {output_key: row[row_key] for output_key, row_key in self.fields}
+        for output_key, row_key in self.datetime_fields:
+            value = row[row_key]
+            data[output_key] = None if value is None else DATETIME_FIELD.to_representation(value)
+        return data
+
+    def many(self, rows: Iterable[dict]) -> List[dict]:
+        return [self.to_representation(row) for row in rows]
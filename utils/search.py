@@ -0,0 +1,24 @@
+import re
+from typing import Optional
+
+from django.contrib.postgres.search import SearchQuery
+
+SEARCH_CONFIG = "simple"
+MAX_SEARCH_TERMS = 10
+
+TERM_SEPARATORS = re.compile(r"[\s@]+")
+UNSAFE_CHARACTERS = re.compile(r"[^\w.\-]")
+
+
+def build_prefix_search_query(text: str) -> Optional[SearchQuery]:
+    """
+    Turns free text into a full-text query where every term must match the
+    beginning of a word, so "jo smi" finds "John Smith". Terms are split like
+    the search vectors split emails and stripped of tsquery operators.
+    Returns None when nothing searchable is left.
+    """
+    terms = [UNSAFE_CHARACTERS.sub("", term) for term in TERM_SEPARATORS.split(text)]
+    terms = [term for term in terms if re.search(r"\w", term)][:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return SearchQuery(" & ".join(f"'{term}':*" for term in terms), search_type="raw", config=SEARCH_CONFIG)
@@ -0,0 +1,36 @@
+import csv
+from typing import Iterable, Iterator, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class EchoBuffer:
+    """
+    File-like object whose write returns the value, so csv.writer can produce
+    one line at a time instead of filling a buffer.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """
+    Yields each row as one line of newline-delimited JSON.
+    """
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+def iter_csv(rows: Iterable[dict], fieldnames: Sequence[str]) -> Iterator[str]:
+    """
+    Yields a CSV header followed by one line per row.
+    """
+    writer = csv.DictWriter(EchoBuffer(), fieldnames=fieldnames)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow({
+            key: value.isoformat() if hasattr(value, "isoformat") else value
+            for key, value in row.items()
+        })
@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from datetime import timedelta
 from pathlib import Path
 
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'apps.companies',
     'apps.documents',
     'apps.signers',
@@ -64,6 +65,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'utils.db_routing.ReadReplicaMiddleware',
 ]
 
 ROOT_URLCONF = 'zapsign.urls'
@@ -101,6 +103,22 @@ DATABASES = {
     }
 }
 
+# Read replicas: same credentials as the primary, one alias per host.
+# Safe requests read from them unless the client wrote within the pin window.
+
+DATABASE_REPLICAS = []
+for index, replica_host in enumerate(config('POSTGRES_REPLICA_HOSTS', default='', cast=Csv())):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['utils.db_routing.PrimaryReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = config('DATABASE_REPLICA_PIN_SECONDS', default=5, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -135,9 +153,17 @@ USE_TZ = True
 
 # REST Framework
 
+# Opt-in orjson renderer/parser; the JSON produced is equivalent to the stock classes'.
+API_ORJSON_ENABLED = config('API_ORJSON_ENABLED', default=False, cast=bool)
+
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'utils.renderers.ORJSONRenderer' if API_ORJSON_ENABLED else 'rest_framework.renderers.JSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'utils.parsers.ORJSONParser' if API_ORJSON_ENABLED else 'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -168,22 +194,32 @@ EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL')
 
 
+# Redis
+
+REDIS_URL = config('REDIS_URL', default='redis://redis:6379')
+
 # Celery
 
-CELERY_BROKER_URL = 'redis://redis:6379/0'
-CELERY_RESULT_BACKEND = 'redis://redis:6379/0'
+CELERY_BROKER_URL = f'{REDIS_URL}/0'
+CELERY_RESULT_BACKEND = f'{REDIS_URL}/0'
 CELERY_ACCEPT_CONTENT = ['application/json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_WORKER_SEND_TASK_EVENTS = True
+CELERY_BEAT_SCHEDULE = {
+    'drain-document-outbox': {
+        'task': 'apps.documents.tasks.drain_document_outbox',
+        'schedule': config('ZAPSIGN_OUTBOX_DRAIN_INTERVAL', default=30.0, cast=float),
+    },
+}
 
 # Cache
 
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': 'redis://redis:6379/1',
+        'LOCATION': f'{REDIS_URL}/1',
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'KEY_PREFIX': 'django_cache:',
@@ -241,6 +277,46 @@ LOGGING = {
 
 ZAPSIGN_BASE_URL = config('ZAPSIGN_BASE_URL')
 ZAPSIGN_API_TOKEN = config('ZAPSIGN_API_TOKEN')
+ZAPSIGN_POOL_CONNECTIONS = config('ZAPSIGN_POOL_CONNECTIONS', default=10, cast=int)
+ZAPSIGN_POOL_MAXSIZE = config('ZAPSIGN_POOL_MAXSIZE', default=20, cast=int)
+ZAPSIGN_POOL_BLOCK = config('ZAPSIGN_POOL_BLOCK', default=False, cast=bool)
+ZAPSIGN_KEEP_ALIVE = config('ZAPSIGN_KEEP_ALIVE', default=True, cast=bool)
+ZAPSIGN_CONNECT_TIMEOUT = config('ZAPSIGN_CONNECT_TIMEOUT', default=3.05, cast=float)
+ZAPSIGN_READ_TIMEOUT = config('ZAPSIGN_READ_TIMEOUT', default=30.0, cast=float)
+ZAPSIGN_RETRY_MAX_ATTEMPTS = config('ZAPSIGN_RETRY_MAX_ATTEMPTS', default=3, cast=int)
+ZAPSIGN_RETRY_BASE_DELAY = config('ZAPSIGN_RETRY_BASE_DELAY', default=0.2, cast=float)
+ZAPSIGN_RETRY_MAX_DELAY = config('ZAPSIGN_RETRY_MAX_DELAY', default=2.0, cast=float)
+ZAPSIGN_BREAKER_FAILURE_THRESHOLD = config('ZAPSIGN_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+ZAPSIGN_BREAKER_FAILURE_WINDOW = config('ZAPSIGN_BREAKER_FAILURE_WINDOW', default=60, cast=int)
+ZAPSIGN_BREAKER_RESET_TIMEOUT = config('ZAPSIGN_BREAKER_RESET_TIMEOUT', default=30, cast=int)
+ZAPSIGN_MAX_CONCURRENT_CALLS = config('ZAPSIGN_MAX_CONCURRENT_CALLS', default=20, cast=int)
+ZAPSIGN_BULKHEAD_TIMEOUT = config('ZAPSIGN_BULKHEAD_TIMEOUT', default=1.0, cast=float)
+ZAPSIGN_RATE_LIMIT_PER_SECOND = config('ZAPSIGN_RATE_LIMIT_PER_SECOND', default=5.0, cast=float)
+ZAPSIGN_RATE_LIMIT_BURST = config('ZAPSIGN_RATE_LIMIT_BURST', default=10, cast=int)
+ZAPSIGN_RATE_LIMIT_MAX_WAIT = config('ZAPSIGN_RATE_LIMIT_MAX_WAIT', default=10.0, cast=float)
+ZAPSIGN_USE_COMPANY_API_TOKEN = config('ZAPSIGN_USE_COMPANY_API_TOKEN', default=False, cast=bool)
+ZAPSIGN_DOCUMENT_CACHE_TTL = config('ZAPSIGN_DOCUMENT_CACHE_TTL', default=60, cast=int)
+ZAPSIGN_DOCUMENT_CACHE_FINAL_TTL = config('ZAPSIGN_DOCUMENT_CACHE_FINAL_TTL', default=3600, cast=int)
+ZAPSIGN_DOCUMENT_FINAL_STATUSES = ('signed', 'refused')
+ZAPSIGN_WEBHOOK_SECRET = config('ZAPSIGN_WEBHOOK_SECRET', default='')
+ZAPSIGN_WEBHOOK_SECRET_HEADER = config('ZAPSIGN_WEBHOOK_SECRET_HEADER', default='X-ZapSign-Webhook-Secret')
+ZAPSIGN_BATCH_MAX_WORKERS = config('ZAPSIGN_BATCH_MAX_WORKERS', default=8, cast=int)
+DOCUMENT_BATCH_MAX_SIZE = config('DOCUMENT_BATCH_MAX_SIZE', default=500, cast=int)
+IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)
+# Must outlast the slowest idempotent request: a full DOCUMENT_BATCH_MAX_SIZE batch
+# takes 100s at ZAPSIGN_RATE_LIMIT_PER_SECOND alone, before slow calls and retries.
+IDEMPOTENCY_LOCK_TIMEOUT = config('IDEMPOTENCY_LOCK_TIMEOUT', default=600, cast=int)
+IDEMPOTENCY_WAIT_TIMEOUT = config('IDEMPOTENCY_WAIT_TIMEOUT', default=10.0, cast=float)
+ZAPSIGN_OUTBOX_ENABLED = config('ZAPSIGN_OUTBOX_ENABLED', default=False, cast=bool)
+ZAPSIGN_OUTBOX_MAX_ATTEMPTS = config('ZAPSIGN_OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+ZAPSIGN_OUTBOX_RETRY_BACKOFF = config('ZAPSIGN_OUTBOX_RETRY_BACKOFF', default=10, cast=int)
+ZAPSIGN_OUTBOX_VISIBILITY_TIMEOUT = config('ZAPSIGN_OUTBOX_VISIBILITY_TIMEOUT', default=300, cast=int)
+ZAPSIGN_OUTBOX_BATCH_SIZE = config('ZAPSIGN_OUTBOX_BATCH_SIZE', default=100, cast=int)
+
+API_PAGE_SIZE = config('API_PAGE_SIZE', default=50, cast=int)
+API_MAX_PAGE_SIZE = config('API_MAX_PAGE_SIZE', default=500, cast=int)
+API_BULK_MAX_SIZE = config('API_BULK_MAX_SIZE', default=1000, cast=int)
+DOCUMENT_EXPORT_CHUNK_SIZE = config('DOCUMENT_EXPORT_CHUNK_SIZE', default=2000, cast=int)
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.1/howto/static-files/
@@ -40,5 +40,6 @@ urlpatterns = [
     path('api/v1/companies/', include('apps.companies.urls')),
     path('api/v1/documents/', include('apps.documents.urls')),
     path('api/v1/signers/', include('apps.signers.urls')),
+    path('api/v1/zapsign/', include('apps.zapsign_integration.urls')),
 ]
 